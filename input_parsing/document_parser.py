@@ -23,6 +23,9 @@ class DocumentParser:
     
     def __init__(self):
         self.supported_formats = ['.pdf', '.docx', '.doc', '.xml', '.html', '.txt']
+        # Frozen snapshot for O(1) routing checks; the list above stays the
+        # public, ordered API
+        self._supported_set = frozenset(self.supported_formats)
         
     def parse_document(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -36,14 +39,16 @@ class DocumentParser:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Document not found: {file_path}")
-            
+        # Validate the extension first so unsupported formats are rejected
+        # without any filesystem access
         file_extension = file_path.suffix.lower()
         
-        if file_extension not in self.supported_formats:
+        if file_extension not in self._supported_set:
             raise ValueError(f"Unsupported file format: {file_extension}")
             
+        if not file_path.exists():
+            raise FileNotFoundError(f"Document not found: {file_path}")
+            
         logger.info(f"Parsing document: {file_path}")
         
         try:
@@ -230,9 +235,9 @@ class DocumentParser:
             if item['type'] in ['text', 'paragraph', 'html_element', 'text_line']:
                 text_parts.append(item['text'])
             elif item['type'] == 'table':
-                # Convert table to readable format
-                for row in item['data']:
-                    text_parts.append(' | '.join(row))
+                # Convert table to readable format with one nested join
+                text_parts.append('\n'.join(
+                    ' | '.join(str(cell) for cell in row) for row in item['data']))
                     
         return '\n'.join(text_parts)
         
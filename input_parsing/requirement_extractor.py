@@ -6,21 +6,53 @@ parsed healthcare documents with context and priority identification.
 """
 
 import logging
+from collections import Counter
+from itertools import chain
 from typing import Dict, List, Optional, Any, Tuple
 import json
 import re
 from dataclasses import dataclass
 from enum import Enum
 
-try:
-    import google.generativeai as genai
-    from google.cloud import aiplatform
-except ImportError:
-    genai = None
-    aiplatform = None
-
 logger = logging.getLogger(__name__)
 
+# Precompiled extraction patterns: the rule-based extractor scans these per
+# line or per sentence, so compiling once at import keeps re.compile out of
+# the hot loops.
+_SECTION_HEADER_RES = (
+    re.compile(r'^\d+\.?\s+([A-Z][^\n]*?)(?=\n|$)', re.IGNORECASE),  # "1. Section Title" or "1 Section Title"
+    re.compile(r'^([A-Z][A-Z\s]+)(?=\n|$)', re.IGNORECASE),             # "SECTION TITLE"
+)
+
+_REQUIREMENT_RES = (
+    re.compile(r'(?:The system shall|The software shall|The application shall|Shall|Must|Should)\s+([^\n]+)', re.IGNORECASE),
+    re.compile(r'(?:REQ|Requirement)\s*[\d\.]+\s*:?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'\d+\.\d+\s+([^\n]+)', re.IGNORECASE),
+)
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# All reference formats folded into one alternation so the text is scanned
+# once instead of once per standard.  The lookahead keeps overlapping refs
+# ("FDA 21 CFR 820" yields both "FDA 21" and "21 CFR 820") that separate
+# findall passes used to pick up independently.
+_COMPLIANCE_SCAN_RE = re.compile(
+    r'(?=(FDA\s*\d+\s*CFR\s*[\d\.\-]+'  # full "FDA 21 CFR 820" span first
+    r'|FDA\s*[\d\.\-]*|ISO\s*[\d\.\-]*|IEC\s*[\d\.\-]*'
+    r'|GDPR|HIPAA|21\s*CFR\s*[\d\.\-]*))',
+    re.IGNORECASE,
+)
+
+# Each criterion keeps its introducer ("when ...", "within ...") so the
+# extracted text reads as a standalone condition
+_CRITERIA_RES = (
+    re.compile(r'(when\s+[^\n]+)', re.IGNORECASE),
+    re.compile(r'(if\s+[^\n]+)', re.IGNORECASE),
+    re.compile(r'(within\s+[^\n]+)', re.IGNORECASE),
+    re.compile(r'(less than\s+[^\n]+)', re.IGNORECASE),
+    re.compile(r'(greater than\s+[^\n]+)', re.IGNORECASE),
+)
+
 
 class RequirementType(Enum):
     """Types of requirements."""
@@ -41,9 +73,53 @@ class Priority(Enum):
     LOW = "low"
 
 
-@dataclass
+def _keyword_scanner(groups) -> 're.Pattern':
+    """
+    Compile (enum, keywords) pairs into one tagged alternation.
+
+    One finditer pass over the text reports every category whose keywords
+    occur (via match.lastgroup), replacing a substring scan per category.
+    """
+    return re.compile('|'.join(
+        '(?P<%s>%s)' % (member.name, '|'.join(map(re.escape, keywords)))
+        for member, keywords in groups
+    ))
+
+
+# Classification keyword tables, in precedence order: the first category
+# with a hit anywhere in the text wins.
+_TYPE_KEYWORDS = (
+    (RequirementType.PERFORMANCE, ('performance', 'speed', 'response time', 'throughput',
+                                   'respond within', 'latency')),
+    (RequirementType.SECURITY, ('security', 'encrypt', 'authenticate', 'authorize')),
+    (RequirementType.COMPLIANCE, ('compliance', 'fda', 'iso', 'iec', 'gdpr')),
+    (RequirementType.USABILITY, ('usability', 'user interface', 'user experience', 'ui')),
+    (RequirementType.RELIABILITY, ('reliability', 'availability', 'uptime', 'fault')),
+    (RequirementType.FUNCTIONAL, ('shall', 'must', 'should', 'will')),
+)
+_TYPE_SCAN_RE = _keyword_scanner(_TYPE_KEYWORDS)
+
+_PRIORITY_KEYWORDS = (
+    (Priority.CRITICAL, ('critical', 'essential', 'mandatory', 'required')),
+    (Priority.HIGH, ('important', 'high priority', 'urgent')),
+    (Priority.LOW, ('optional', 'nice to have', 'low priority')),
+)
+_PRIORITY_SCAN_RE = _keyword_scanner(_PRIORITY_KEYWORDS)
+
+# Group-name tags resolved once instead of per _determine_priority call
+_CRITICAL_TAG = Priority.CRITICAL.name
+_HIGH_TAG = Priority.HIGH.name
+_LOW_TAG = Priority.LOW.name
+
+_PRIORITY_SECTION_RE = re.compile(r'safety|security|compliance')
+
+
+@dataclass(frozen=True)
 class Requirement:
     """Structured requirement data."""
+    __slots__ = ('id', 'description', 'type', 'priority', 'source_section',
+                 'compliance_refs', 'context', 'acceptance_criteria',
+                 'dependencies', 'raw_text')
     id: str
     description: str
     type: RequirementType
@@ -69,9 +145,19 @@ class RequirementExtractor:
         """
         self.api_key = api_key
         self.project_id = project_id
-        
+
+        # Import the Google SDK lazily: it is only needed when an API key is
+        # supplied, and pulling in grpc/protobuf at module import slows down
+        # every rule-based-only startup
+        genai = None
+        if api_key:
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                genai = None
+
         try:
-            if genai and api_key:
+            if genai:
                 genai.configure(api_key=api_key)
                 self.model = genai.GenerativeModel('gemini-pro')
                 logger.info("Google Generative AI initialized successfully")
@@ -108,8 +194,8 @@ class RequirementExtractor:
             if item['type'] in ['text', 'paragraph', 'html_element', 'text_line']:
                 text_parts.append(item['text'])
             elif item['type'] == 'table':
-                for row in item['data']:
-                    text_parts.append(' | '.join(str(cell) for cell in row))
+                text_parts.append('\n'.join(
+                    ' | '.join(str(cell) for cell in row) for row in item['data']))
                     
         return '\n'.join(text_parts)
         
@@ -214,12 +300,6 @@ class RequirementExtractor:
         """Split text into logical sections."""
         sections = []
         
-        # Look for section headers (numbered or titled)
-        section_patterns = [
-            r'^\d+\.?\s+([A-Z][^\n]*?)(?=\n|$)',  # "1. Section Title" or "1 Section Title"
-            r'^([A-Z][A-Z\s]+)(?=\n|$)',          # "SECTION TITLE"
-        ]
-        
         lines = text.split('\n')
         current_section = "General"
         current_text = []
@@ -230,8 +310,8 @@ class RequirementExtractor:
                 continue
                 
             is_header = False
-            for pattern in section_patterns:
-                if re.match(pattern, line, re.IGNORECASE):
+            for pattern in _SECTION_HEADER_RES:
+                if pattern.match(line):
                     if current_text:
                         sections.append((current_section, '\n'.join(current_text)))
                     current_section = line
@@ -251,14 +331,7 @@ class RequirementExtractor:
         """Extract requirements from a specific section."""
         requirements = []
         
-        # Look for requirement patterns
-        req_patterns = [
-            r'(?:The system shall|The software shall|The application shall|Shall|Must|Should)\s+([^\n]+)',
-            r'(?:REQ|Requirement)\s*[\d\.]+\s*:?\s*([^\n]+)',
-            r'\d+\.\d+\s+([^\n]+)',
-        ]
-        
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         req_counter = start_id
         
         for sentence in sentences:
@@ -266,8 +339,8 @@ class RequirementExtractor:
             if not sentence:
                 continue
                 
-            for pattern in req_patterns:
-                match = re.search(pattern, sentence, re.IGNORECASE)
+            for pattern in _REQUIREMENT_RES:
+                match = pattern.search(sentence)
                 if match:
                     req_text = match.group(1) if match.groups() else sentence
                     
@@ -301,73 +374,34 @@ class RequirementExtractor:
         
     def _classify_requirement_type(self, text: str) -> RequirementType:
         """Classify requirement type based on content."""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['performance', 'speed', 'response time', 'throughput']):
-            return RequirementType.PERFORMANCE
-        elif any(word in text_lower for word in ['security', 'encrypt', 'authenticate', 'authorize']):
-            return RequirementType.SECURITY
-        elif any(word in text_lower for word in ['compliance', 'fda', 'iso', 'iec', 'gdpr']):
-            return RequirementType.COMPLIANCE
-        elif any(word in text_lower for word in ['usability', 'user interface', 'user experience', 'ui']):
-            return RequirementType.USABILITY
-        elif any(word in text_lower for word in ['reliability', 'availability', 'uptime', 'fault']):
-            return RequirementType.RELIABILITY
-        elif any(word in text_lower for word in ['shall', 'must', 'should', 'will']):
-            return RequirementType.FUNCTIONAL
-        else:
-            return RequirementType.NON_FUNCTIONAL
-            
+        hits = {m.lastgroup for m in _TYPE_SCAN_RE.finditer(text.lower())}
+        for req_type, _ in _TYPE_KEYWORDS:
+            if req_type.name in hits:
+                return req_type
+        return RequirementType.NON_FUNCTIONAL
+
     def _determine_priority(self, text: str, section_title: str) -> Priority:
         """Determine requirement priority."""
-        text_lower = text.lower()
-        section_lower = section_title.lower()
-        
-        if any(word in text_lower for word in ['critical', 'essential', 'mandatory', 'required']):
+        hits = {m.lastgroup for m in _PRIORITY_SCAN_RE.finditer(text.lower())}
+
+        if _CRITICAL_TAG in hits:
             return Priority.CRITICAL
-        elif any(word in text_lower for word in ['important', 'high priority', 'urgent']):
-            return Priority.HIGH
-        elif any(word in section_lower for word in ['safety', 'security', 'compliance']):
+        if _HIGH_TAG in hits or _PRIORITY_SECTION_RE.search(section_title.lower()):
             return Priority.HIGH
-        elif any(word in text_lower for word in ['optional', 'nice to have', 'low priority']):
+        if _LOW_TAG in hits:
             return Priority.LOW
-        else:
-            return Priority.MEDIUM
-            
+        return Priority.MEDIUM
+
     def _extract_compliance_refs(self, text: str) -> List[str]:
         """Extract compliance references from text."""
-        compliance_patterns = [
-            r'FDA\\s*[\\d\\.\\-]*',
-            r'ISO\\s*[\\d\\.\\-]*',
-            r'IEC\\s*[\\d\\.\\-]*',
-            r'GDPR',
-            r'HIPAA',
-            r'21\\s*CFR\\s*[\\d\\.\\-]*',
-        ]
-        
-        refs = []
-        for pattern in compliance_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            refs.extend(matches)
-            
-        return list(set(refs))  # Remove duplicates
+        return list({m.group(1) for m in _COMPLIANCE_SCAN_RE.finditer(text)})
         
     def _extract_acceptance_criteria(self, text: str) -> List[str]:
         """Extract acceptance criteria from requirement text."""
         criteria = []
         
-        # Look for criteria patterns
-        criteria_patterns = [
-            r'when\s+([^\n]+)',
-            r'if\s+([^\n]+)',
-            r'within\s+([^\n]+)',
-            r'less than\s+([^\n]+)',
-            r'greater than\s+([^\n]+)',
-        ]
-        
-        for pattern in criteria_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            criteria.extend(matches)
+        for pattern in _CRITERIA_RES:
+            criteria.extend(pattern.findall(text))
             
         return criteria
         
@@ -381,36 +415,22 @@ class RequirementExtractor:
         Returns:
             Summary dictionary
         """
-        summary = {
+        # Counter iterates at C level; sorted list keeps the refs
+        # JSON-serializable and deterministic
+        return {
             'total_requirements': len(requirements),
-            'by_type': {},
-            'by_priority': {},
-            'compliance_refs': set(),
-            'requirements': []
+            'by_type': dict(Counter(req.type.value for req in requirements)),
+            'by_priority': dict(Counter(req.priority.value for req in requirements)),
+            'compliance_refs': sorted(set(chain.from_iterable(
+                req.compliance_refs for req in requirements))),
+            'requirements': [
+                {
+                    'id': req.id,
+                    'description': req.description,
+                    'type': req.type.value,
+                    'priority': req.priority.value,
+                    'compliance_refs': req.compliance_refs
+                }
+                for req in requirements
+            ]
         }
-        
-        for req in requirements:
-            # Count by type
-            req_type = req.type.value
-            summary['by_type'][req_type] = summary['by_type'].get(req_type, 0) + 1
-            
-            # Count by priority
-            priority = req.priority.value
-            summary['by_priority'][priority] = summary['by_priority'].get(priority, 0) + 1
-            
-            # Collect compliance references
-            summary['compliance_refs'].update(req.compliance_refs)
-            
-            # Add requirement summary
-            summary['requirements'].append({
-                'id': req.id,
-                'description': req.description,
-                'type': req_type,
-                'priority': priority,
-                'compliance_refs': req.compliance_refs
-            })
-            
-        # Convert set to list for JSON serialization
-        summary['compliance_refs'] = list(summary['compliance_refs'])
-        
-        return summary
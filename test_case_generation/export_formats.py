@@ -11,10 +11,12 @@ import json
 import csv
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+import xlsxwriter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import requests
@@ -24,6 +26,28 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Column order for CSV export; mirrors the keys of _test_case_to_dict so the
+# writer does not need a materialized first row to discover fieldnames.
+_CSV_FIELDNAMES = (
+    'id', 'title', 'description', 'test_case_type', 'priority', 'requirement_id',
+    'compliance_refs', 'prerequisites', 'expected_outcome', 'pass_criteria',
+    'fail_criteria', 'estimated_duration', 'created_date', 'last_modified',
+    'test_steps'
+)
+
+
+def _json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _enum_str(value: Any) -> str:
+    """Return the string value of an enum member or the value itself as str."""
+    return value.value if hasattr(value, 'value') else str(value)
+
+
 class ExportManager:
     """Manages export of test cases to various formats."""
     
@@ -87,8 +111,8 @@ class ExportManager:
             export_data['test_cases'].append(tc_dict)
             
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps_indented(export_data))
             
         logger.info(f"Exported {len(test_cases)} test cases to JSON: {output_path}")
         return True
@@ -98,30 +122,34 @@ class ExportManager:
         """Export test cases to Excel format."""
         output_path = Path(output_path)
         
-        # Create workbook
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
-        # Create test cases sheet
-        self._create_test_cases_sheet(wb, test_cases)
-        
-        # Create summary sheet
-        self._create_summary_sheet(wb, test_cases)
-        
-        # Create traceability sheet
-        self._create_traceability_sheet(wb, test_cases)
+        # Constant-memory mode streams each row to disk as soon as the next
+        # one starts, so peak memory stays flat regardless of workbook size.
+        wb = xlsxwriter.Workbook(str(output_path), {'constant_memory': True,
+                                                    'strings_to_urls': False})
+        header_format = wb.add_format({'bold': True, 'bg_color': '#CCCCCC',
+                                       'align': 'center', 'valign': 'vcenter'})
+        bold_format = wb.add_format({'bold': True})
+        title_format = wb.add_format({'bold': True, 'font_size': 14})
         
-        # Save workbook
-        wb.save(output_path)
+        try:
+            # Create test cases sheet
+            self._create_test_cases_sheet(wb, test_cases, header_format)
+            
+            # Create summary sheet
+            self._create_summary_sheet(wb, test_cases, title_format, bold_format)
+            
+            # Create traceability sheet
+            self._create_traceability_sheet(wb, test_cases, header_format)
+        finally:
+            wb.close()
         
         logger.info(f"Exported {len(test_cases)} test cases to Excel: {output_path}")
         return True
         
-    def _create_test_cases_sheet(self, wb: Workbook, test_cases: List[Any]) -> None:
+    def _create_test_cases_sheet(self, wb: xlsxwriter.Workbook, test_cases: List[Any],
+                                 header_format: Any) -> None:
         """Create test cases sheet in Excel workbook."""
-        ws = wb.create_sheet("Test Cases")
+        ws = wb.add_worksheet("Test Cases")
         
         # Define headers
         headers = [
@@ -131,53 +159,50 @@ class ExportManager:
         ]
         
         # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-        # Write test case data
-        for row, tc in enumerate(test_cases, 2):
-            ws.cell(row=row, column=1, value=getattr(tc, 'id', ''))
-            ws.cell(row=row, column=2, value=getattr(tc, 'title', ''))
-            ws.cell(row=row, column=3, value=getattr(tc, 'description', ''))
-            ws.cell(row=row, column=4, value=getattr(tc, 'test_case_type', '').value if hasattr(getattr(tc, 'test_case_type', ''), 'value') else str(getattr(tc, 'test_case_type', '')))
-            ws.cell(row=row, column=5, value=getattr(tc, 'priority', '').value if hasattr(getattr(tc, 'priority', ''), 'value') else str(getattr(tc, 'priority', '')))
-            ws.cell(row=row, column=6, value=getattr(tc, 'requirement_id', ''))
-            ws.cell(row=row, column=7, value=', '.join(getattr(tc, 'compliance_refs', [])))
-            ws.cell(row=row, column=8, value='; '.join(getattr(tc, 'prerequisites', [])))
-            
-            # Format test steps
+        ws.write_row(0, 0, headers, header_format)
+        widths = [len(header) for header in headers]
+        
+        # Write test case data (rows must be emitted in order for
+        # constant-memory mode, so widths are tracked in the same pass)
+        for row, tc in enumerate(test_cases, 1):
             test_steps = getattr(tc, 'test_steps', [])
-            steps_text = []
-            for step in test_steps:
-                if hasattr(step, 'step_number') and hasattr(step, 'action'):
-                    steps_text.append(f"{step.step_number}. {step.action}")
-            ws.cell(row=row, column=9, value='; '.join(steps_text))
+            steps_text = '; '.join(
+                f"{step.step_number}. {step.action}"
+                for step in test_steps
+                if hasattr(step, 'step_number') and hasattr(step, 'action')
+            )
             
-            ws.cell(row=row, column=10, value=getattr(tc, 'expected_outcome', ''))
-            ws.cell(row=row, column=11, value='; '.join(getattr(tc, 'pass_criteria', [])))
-            ws.cell(row=row, column=12, value='; '.join(getattr(tc, 'fail_criteria', [])))
-            ws.cell(row=row, column=13, value=getattr(tc, 'estimated_duration', ''))
-            ws.cell(row=row, column=14, value=getattr(tc, 'created_date', ''))
+            values = [
+                getattr(tc, 'id', ''),
+                getattr(tc, 'title', ''),
+                getattr(tc, 'description', ''),
+                _enum_str(getattr(tc, 'test_case_type', '')),
+                _enum_str(getattr(tc, 'priority', '')),
+                getattr(tc, 'requirement_id', ''),
+                ', '.join(getattr(tc, 'compliance_refs', [])),
+                '; '.join(getattr(tc, 'prerequisites', [])),
+                steps_text,
+                getattr(tc, 'expected_outcome', ''),
+                '; '.join(getattr(tc, 'pass_criteria', [])),
+                '; '.join(getattr(tc, 'fail_criteria', [])),
+                getattr(tc, 'estimated_duration', ''),
+                getattr(tc, 'created_date', '')
+            ]
+            ws.write_row(row, 0, values)
             
+            for col, value in enumerate(values):
+                length = len(str(value))
+                if length > widths[col]:
+                    widths[col] = length
+                    
         # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        for col, width in enumerate(widths):
+            ws.set_column(col, col, min(width + 2, 50))
             
-    def _create_summary_sheet(self, wb: Workbook, test_cases: List[Any]) -> None:
+    def _create_summary_sheet(self, wb: xlsxwriter.Workbook, test_cases: List[Any],
+                              title_format: Any, bold_format: Any) -> None:
         """Create summary sheet in Excel workbook."""
-        ws = wb.create_sheet("Summary")
+        ws = wb.add_worksheet("Summary")
         
         # Calculate summary statistics
         total_tc = len(test_cases)
@@ -185,69 +210,62 @@ class ExportManager:
         by_priority = {}
         
         for tc in test_cases:
-            tc_type = getattr(tc, 'test_case_type', '').value if hasattr(getattr(tc, 'test_case_type', ''), 'value') else str(getattr(tc, 'test_case_type', ''))
-            priority = getattr(tc, 'priority', '').value if hasattr(getattr(tc, 'priority', ''), 'value') else str(getattr(tc, 'priority', ''))
+            tc_type = _enum_str(getattr(tc, 'test_case_type', ''))
+            priority = _enum_str(getattr(tc, 'priority', ''))
             
             by_type[tc_type] = by_type.get(tc_type, 0) + 1
             by_priority[priority] = by_priority.get(priority, 0) + 1
             
         # Write summary data
-        ws.cell(row=1, column=1, value="Test Case Summary").font = Font(bold=True, size=14)
-        ws.cell(row=2, column=1, value="Total Test Cases:").font = Font(bold=True)
-        ws.cell(row=2, column=2, value=total_tc)
+        ws.write(0, 0, "Test Case Summary", title_format)
+        ws.write(1, 0, "Total Test Cases:", bold_format)
+        ws.write(1, 1, total_tc)
         
-        ws.cell(row=4, column=1, value="By Type:").font = Font(bold=True)
-        row = 5
+        ws.write(3, 0, "By Type:", bold_format)
+        row = 4
         for tc_type, count in by_type.items():
-            ws.cell(row=row, column=1, value=tc_type)
-            ws.cell(row=row, column=2, value=count)
+            ws.write(row, 0, tc_type)
+            ws.write(row, 1, count)
             row += 1
             
-        ws.cell(row=row+1, column=1, value="By Priority:").font = Font(bold=True)
+        ws.write(row + 1, 0, "By Priority:", bold_format)
         row += 2
         for priority, count in by_priority.items():
-            ws.cell(row=row, column=1, value=priority)
-            ws.cell(row=row, column=2, value=count)
+            ws.write(row, 0, priority)
+            ws.write(row, 1, count)
             row += 1
             
-    def _create_traceability_sheet(self, wb: Workbook, test_cases: List[Any]) -> None:
+    def _create_traceability_sheet(self, wb: xlsxwriter.Workbook, test_cases: List[Any],
+                                   header_format: Any) -> None:
         """Create traceability matrix sheet in Excel workbook."""
-        ws = wb.create_sheet("Traceability Matrix")
+        ws = wb.add_worksheet("Traceability Matrix")
         
         # Headers
         headers = ['Test Case ID', 'Requirement ID', 'Compliance References', 'Test Type', 'Priority']
+        ws.write_row(0, 0, headers, header_format)
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-            
         # Data
-        for row, tc in enumerate(test_cases, 2):
-            ws.cell(row=row, column=1, value=getattr(tc, 'id', ''))
-            ws.cell(row=row, column=2, value=getattr(tc, 'requirement_id', ''))
-            ws.cell(row=row, column=3, value=', '.join(getattr(tc, 'compliance_refs', [])))
-            ws.cell(row=row, column=4, value=getattr(tc, 'test_case_type', '').value if hasattr(getattr(tc, 'test_case_type', ''), 'value') else str(getattr(tc, 'test_case_type', '')))
-            ws.cell(row=row, column=5, value=getattr(tc, 'priority', '').value if hasattr(getattr(tc, 'priority', ''), 'value') else str(getattr(tc, 'priority', '')))
+        for row, tc in enumerate(test_cases, 1):
+            ws.write_row(row, 0, [
+                getattr(tc, 'id', ''),
+                getattr(tc, 'requirement_id', ''),
+                ', '.join(getattr(tc, 'compliance_refs', [])),
+                _enum_str(getattr(tc, 'test_case_type', '')),
+                _enum_str(getattr(tc, 'priority', ''))
+            ])
             
     def _export_to_csv(self, test_cases: List[Any], output_path: Union[str, Path], 
                       **kwargs) -> bool:
         """Export test cases to CSV format."""
         output_path = Path(output_path)
         
-        # Convert test cases to list of dictionaries
-        csv_data = []
-        for tc in test_cases:
-            tc_dict = self._test_case_to_dict(tc)
-            csv_data.append(tc_dict)
+        # Stream rows through the writer so memory does not scale with the
+        # number of test cases
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(self._test_case_to_dict(tc) for tc in test_cases)
             
-        # Write to CSV
-        if csv_data:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-                writer.writeheader()
-                writer.writerows(csv_data)
-                
         logger.info(f"Exported {len(test_cases)} test cases to CSV: {output_path}")
         return True
         
@@ -305,8 +323,8 @@ class ExportManager:
             jira_data['issues'].append(issue)
             
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(jira_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps_indented(jira_data))
             
         logger.info(f"Exported {len(test_cases)} test cases to Jira JSON: {output_path}")
         return True
@@ -413,8 +431,8 @@ class ExportManager:
             azure_data['testCases'].append(test_case)
             
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(azure_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps_indented(azure_data))
             
         logger.info(f"Exported {len(test_cases)} test cases to Azure DevOps JSON: {output_path}")
         return True
@@ -0,0 +1,34 @@
+"""
+Shared HTTP Client Module
+
+Provides a single pooled requests.Session shared by the modules that issue
+many outbound HTTP requests (self-healing probes, regulatory monitoring
+fetches), so TCP/TLS connections are reused instead of reopened per call.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=64,
+                    max_retries=Retry(total=2, backoff_factor=0.1)
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
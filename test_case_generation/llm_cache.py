@@ -0,0 +1,121 @@
+"""
+LLM Response Cache
+
+Caches parsed LLM JSON payloads keyed by a hash of the prompt so repeated
+generation or refinement requests skip the multi-second network round-trip.
+Supports an in-process LRU backend and an optional file-backed store that
+survives restarts.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """TTL + LRU cache for parsed LLM responses."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: int = 86400,
+                 cache_file: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            ttl_seconds: Time-to-live for each entry in seconds
+            cache_file: Optional JSON file path for persistence across runs
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._dirty = False
+
+        if self.cache_file:
+            self._load_from_file()
+            # Catch anything still unflushed when the process exits,
+            # e.g. streaming consumers that never call flush()
+            atexit.register(self.flush)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.time() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value under key, evicting the oldest entry if full."""
+        if ttl is not None:
+            # Per-entry TTLs are stored by shifting the timestamp so a single
+            # expiry check in get() covers both cases.
+            stored_at = time.time() - (self.ttl_seconds - ttl)
+        else:
+            stored_at = time.time()
+
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        # Persistence is deferred to flush(): rewriting the whole file on
+        # every insert costs more than the cached work it saves
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Persist entries to the cache file if any were added since the
+        last flush."""
+        if self.cache_file and self._dirty:
+            self._save_to_file()
+            self._dirty = False
+
+    def _load_from_file(self) -> None:
+        """Load persisted entries, dropping any that have expired."""
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r') as f:
+                    data = json.load(f)
+
+                now = time.time()
+                for key, (stored_at, value) in data.items():
+                    if now - stored_at <= self.ttl_seconds:
+                        self._entries[key] = (stored_at, value)
+        except Exception as e:
+            logger.error(f"Error loading LLM cache: {str(e)}")
+
+    def _save_to_file(self) -> None:
+        """Persist current entries to the cache file.
+
+        The write goes to a temp file swapped in with os.replace, so a
+        concurrent process (e.g. a pytest-xdist worker) sharing the path
+        sees either the old or the new file, never a partial one.
+        """
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent,
+                                            prefix=self.cache_file.name + '.')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({k: list(v) for k, v in self._entries.items()}, f)
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.error(f"Error saving LLM cache: {str(e)}")
@@ -5,12 +5,17 @@ Monitors regulatory changes from official sources and alerts users when
 compliance rules may have changed, ensuring test cases remain current.
 """
 
+import bisect
+import concurrent.futures
+from collections import Counter
 import logging
+import os
 import requests
 import json
 import hashlib
+import sqlite3
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 import feedparser
@@ -24,12 +29,46 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from .http_client import get_session
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Below this many pending changes, per-change analysis runs serially to
+# avoid process-pool startup overhead.
+_PARALLEL_ANALYSIS_THRESHOLD = 100
+
+
+def _analyze_requirement_impact(change: Dict[str, Any]) -> List[str]:
+    """Analyze which requirements might be affected by the change.
+
+    Module-level so it is picklable for process-pool offload.
+    """
+    # This would require integration with the requirements database
+    # For now, return empty list
+    return []
+
 
 @dataclass
 class RegulatoryChange:
     """Detected regulatory change."""
+    # Manual __slots__ keeps 3.8 compatibility (dataclass slots=True is 3.10+)
+    __slots__ = ('change_id', 'standard', 'title', 'description', 'source_url',
+                 'publication_date', 'change_type', 'severity',
+                 'affected_requirements', 'confidence', 'detected_at')
     change_id: str
     standard: str
     title: str
@@ -43,9 +82,25 @@ class RegulatoryChange:
     detected_at: str
 
 
+@dataclass
+class _ClassifyCtx:
+    """Content prepared once for the classification helpers."""
+    __slots__ = ('content', 'content_lower', 'standard')
+    content: str
+    content_lower: str
+    standard: str
+
+    @classmethod
+    def from_content(cls, content: str, standard: str) -> '_ClassifyCtx':
+        return cls(content, content.lower(), standard)
+
+
 @dataclass
 class MonitoringAlert:
     """Alert generated for regulatory changes."""
+    __slots__ = ('alert_id', 'change_id', 'alert_type', 'severity', 'title',
+                 'message', 'affected_test_cases', 'recommended_actions',
+                 'created_at')
     alert_id: str
     change_id: str
     alert_type: str  # new_change, requirement_impact, compliance_risk
@@ -66,15 +121,35 @@ class RegulatoryMonitor:
         self.config_path.parent.mkdir(exist_ok=True)
         self.config = self._load_config()
         
-        # Data storage
-        self.changes_db_path = Path("data/regulatory_changes.json")
+        # Data storage (SQLite; holds both changes and alerts)
+        self.changes_db_path = Path("data/regulatory_monitoring.db")
         self.changes_db_path.parent.mkdir(exist_ok=True)
+        self._db = self._open_database()
+        self._migrate_legacy_json()
         self.regulatory_changes = self._load_changes()
-        
-        # Alert storage
-        self.alerts_db_path = Path("data/regulatory_alerts.json")
-        self.alerts_db_path.parent.mkdir(exist_ok=True)
         self.alerts = self._load_alerts()
+
+        # Parallel epoch timestamps for the (time-ordered) change list,
+        # so recency queries can bisect instead of re-parsing ISO strings
+        self._change_times = [self._detected_at_timestamp(change)
+                              for change in self.regulatory_changes]
+
+        # Incrementally maintained aggregates for get_monitoring_statistics
+        self._changes_by_standard = Counter(
+            change['standard'] for change in self.regulatory_changes)
+        self._alerts_by_severity = Counter(
+            alert['severity'] for alert in self.alerts)
+        self._active_alerts = [alert for alert in self.alerts
+                               if alert['severity'] in ('critical', 'high')]
+
+        # Conditional-GET validators per source URL
+        self._etag_store_path = Path("data/etags.json")
+        self._etag_store = self._load_etag_store()
+
+        # Feed-body hashes (skip re-parsing identical payloads) and
+        # dead-lettered feeds that failed to parse
+        self._feed_hashes: Dict[str, str] = {}
+        self._dead_feeds: set = set()
         
         # Monitoring sources
         self.monitoring_sources = self._initialize_monitoring_sources()
@@ -82,6 +157,9 @@ class RegulatoryMonitor:
         # Change detection patterns
         self.change_patterns = self._initialize_change_patterns()
         
+        # Pooled HTTP session shared with the self-healing engine
+        self._http = get_session()
+
         # Monitoring thread
         self.monitoring_thread = None
         self.is_monitoring = False
@@ -103,6 +181,7 @@ class RegulatoryMonitor:
         config = {
             'monitoring_interval_hours': 24,
             'alert_threshold_confidence': 0.7,
+            'assume_feed_chronological': True,
             'email_notifications': {
                 'enabled': False,
                 'smtp_server': '',
@@ -136,46 +215,190 @@ class RegulatoryMonitor:
         
         return config
     
+    def _open_database(self) -> sqlite3.Connection:
+        """Open the SQLite database, creating tables on first use."""
+        db = sqlite3.connect(self.changes_db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS changes (
+                change_id TEXT PRIMARY KEY,
+                standard TEXT,
+                title TEXT,
+                description TEXT,
+                source_url TEXT,
+                publication_date TEXT,
+                change_type TEXT,
+                severity TEXT,
+                affected_requirements TEXT,
+                confidence REAL,
+                detected_at TEXT
+            )
+        """)
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_changes_standard_detected
+            ON changes (standard, detected_at)
+        """)
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                alert_id TEXT PRIMARY KEY,
+                change_id TEXT,
+                alert_type TEXT,
+                severity TEXT,
+                title TEXT,
+                message TEXT,
+                affected_test_cases TEXT,
+                recommended_actions TEXT,
+                created_at TEXT
+            )
+        """)
+        db.commit()
+        return db
+
+    def _migrate_legacy_json(self):
+        """One-time import of the old JSON-file databases into SQLite."""
+        legacy_changes = Path("data/regulatory_changes.json")
+        legacy_alerts = Path("data/regulatory_alerts.json")
+
+        try:
+            if legacy_changes.exists():
+                with open(legacy_changes, 'rb') as f:
+                    self._save_changes(_json_loads(f.read()))
+                legacy_changes.rename(legacy_changes.with_suffix('.json.migrated'))
+                logger.info("Migrated legacy changes JSON into SQLite")
+
+            if legacy_alerts.exists():
+                with open(legacy_alerts, 'rb') as f:
+                    self._save_alerts(_json_loads(f.read()))
+                legacy_alerts.rename(legacy_alerts.with_suffix('.json.migrated'))
+                logger.info("Migrated legacy alerts JSON into SQLite")
+        except Exception as e:
+            logger.error(f"Error migrating legacy JSON databases: {e}")
+
     def _load_changes(self) -> List[Dict[str, Any]]:
         """Load regulatory changes from database."""
-        if not self.changes_db_path.exists():
-            return []
-        
         try:
-            with open(self.changes_db_path, 'r') as f:
-                return json.load(f)
+            rows = self._db.execute("""
+                SELECT change_id, standard, title, description, source_url,
+                       publication_date, change_type, severity,
+                       affected_requirements, confidence, detected_at
+                FROM changes ORDER BY detected_at
+            """).fetchall()
+            return [
+                {
+                    'change_id': row[0],
+                    'standard': row[1],
+                    'title': row[2],
+                    'description': row[3],
+                    'source_url': row[4],
+                    'publication_date': row[5],
+                    'change_type': row[6],
+                    'severity': row[7],
+                    'affected_requirements': _json_loads(row[8] or '[]'),
+                    'confidence': row[9],
+                    'detected_at': row[10]
+                }
+                for row in rows
+            ]
         except Exception as e:
             logger.error(f"Error loading changes: {e}")
             return []
-    
-    def _save_changes(self):
-        """Save regulatory changes to database."""
+
+    def _save_changes(self, changes: Optional[List[Dict[str, Any]]] = None):
+        """Upsert the given changes (default: all) into the database."""
         try:
-            with open(self.changes_db_path, 'w') as f:
-                json.dump(self.regulatory_changes, f, indent=2)
+            self._db.executemany("""
+                INSERT OR REPLACE INTO changes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    change['change_id'],
+                    change['standard'],
+                    change['title'],
+                    change['description'],
+                    change['source_url'],
+                    change['publication_date'],
+                    change['change_type'],
+                    change['severity'],
+                    _json_dumps(change.get('affected_requirements', [])),
+                    change['confidence'],
+                    change['detected_at']
+                )
+                for change in (changes if changes is not None else self.regulatory_changes)
+            ])
+            self._db.commit()
         except Exception as e:
             logger.error(f"Error saving changes: {e}")
-    
+
     def _load_alerts(self) -> List[Dict[str, Any]]:
         """Load alerts from database."""
-        if not self.alerts_db_path.exists():
-            return []
-        
         try:
-            with open(self.alerts_db_path, 'r') as f:
-                return json.load(f)
+            rows = self._db.execute("""
+                SELECT alert_id, change_id, alert_type, severity, title,
+                       message, affected_test_cases, recommended_actions,
+                       created_at
+                FROM alerts ORDER BY created_at
+            """).fetchall()
+            return [
+                {
+                    'alert_id': row[0],
+                    'change_id': row[1],
+                    'alert_type': row[2],
+                    'severity': row[3],
+                    'title': row[4],
+                    'message': row[5],
+                    'affected_test_cases': _json_loads(row[6] or '[]'),
+                    'recommended_actions': _json_loads(row[7] or '[]'),
+                    'created_at': row[8]
+                }
+                for row in rows
+            ]
         except Exception as e:
             logger.error(f"Error loading alerts: {e}")
             return []
-    
-    def _save_alerts(self):
-        """Save alerts to database."""
+
+    def _save_alerts(self, alerts: Optional[List[Dict[str, Any]]] = None):
+        """Upsert the given alerts (default: all) into the database."""
         try:
-            with open(self.alerts_db_path, 'w') as f:
-                json.dump(self.alerts, f, indent=2)
+            self._db.executemany("""
+                INSERT OR REPLACE INTO alerts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    alert['alert_id'],
+                    alert['change_id'],
+                    alert['alert_type'],
+                    alert['severity'],
+                    alert['title'],
+                    alert['message'],
+                    _json_dumps(alert.get('affected_test_cases', [])),
+                    _json_dumps(alert.get('recommended_actions', [])),
+                    alert['created_at']
+                )
+                for alert in (alerts if alerts is not None else self.alerts)
+            ])
+            self._db.commit()
         except Exception as e:
             logger.error(f"Error saving alerts: {e}")
     
+    def _load_etag_store(self) -> Dict[str, Any]:
+        """Load cached ETag/Last-Modified validators per source URL."""
+        if not self._etag_store_path.exists():
+            return {}
+
+        try:
+            with open(self._etag_store_path, 'rb') as f:
+                return _json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Error loading ETag store: {e}")
+            return {}
+
+    def _save_etag_store(self):
+        """Save cached ETag/Last-Modified validators."""
+        try:
+            with open(self._etag_store_path, 'w') as f:
+                f.write(_json_dumps(self._etag_store))
+        except Exception as e:
+            logger.error(f"Error saving ETag store: {e}")
+
     def _initialize_monitoring_sources(self) -> Dict[str, Dict[str, Any]]:
         """Initialize monitoring sources for different standards."""
         return {
@@ -245,6 +468,17 @@ class RegulatoryMonitor:
     
     def _initialize_change_patterns(self) -> Dict[str, List[str]]:
         """Initialize patterns for detecting regulatory changes."""
+        # Severity indicators compiled into a single alternation so one
+        # linear scan covers all tiers; named groups identify the tier.
+        self._severity_re = re.compile(
+            r'\b(?P<crit>immediate|urgent|critical|mandatory|required|'
+            r'effective immediately|compliance required)\b'
+            r'|\b(?P<high>important|significant|major|updated|revised|'
+            r'amended|changes to)\b'
+            r'|\b(?P<med>clarification|guidance|frequently asked|'
+            r'interpretation|best practice)\b',
+            re.IGNORECASE
+        )
         return {
             'new_regulation': [
                 r'new\s+(regulation|guidance|standard)',
@@ -339,30 +573,69 @@ class RegulatoryMonitor:
     
     def _check_rss_feed(self, standard: str, rss_url: str):
         """Check RSS feed for changes."""
+        if rss_url in self._dead_feeds:
+            return
+
         try:
-            feed = feedparser.parse(rss_url)
-            
+            headers = {}
+            etag, last_modified = self._etag_store.get(rss_url, (None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+            response = self._http.get(rss_url, headers=headers, timeout=30)
+            # Server says nothing changed since the last poll
+            if response.status_code == 304:
+                return
+            response.raise_for_status()
+
+            new_etag = response.headers.get('ETag')
+            new_modified = response.headers.get('Last-Modified')
+            if new_etag or new_modified:
+                self._etag_store[rss_url] = (new_etag, new_modified)
+                self._save_etag_store()
+
+            # Skip parsing entirely when the body is byte-identical
+            content_hash = hashlib.md5(response.content).hexdigest()
+            if self._feed_hashes.get(rss_url) == content_hash:
+                return
+            self._feed_hashes[rss_url] = content_hash
+
+            # We only read title/description/link/published, so skip
+            # feedparser's HTML sanitization and URI resolution
+            feed = feedparser.parse(
+                response.content,
+                response_headers=dict(response.headers),
+                resolve_relative_uris=False,
+                sanitize_html=False
+            )
+
+            if feed.bozo and not feed.entries:
+                logger.warning(f"Dead-lettering malformed feed {rss_url}: {feed.bozo_exception}")
+                self._dead_feeds.add(rss_url)
+                return
+
+            assume_chronological = self.config.get('assume_feed_chronological', True)
+
             for entry in feed.entries:
                 # Check if this is a new entry
                 entry_id = self._generate_entry_id(entry)
-                if not self._is_known_change(entry_id):
-                    # Analyze entry for regulatory changes
-                    change = self._analyze_rss_entry(standard, entry, rss_url)
-                    if change:
-                        self.regulatory_changes.append({
-                            'change_id': change.change_id,
-                            'standard': change.standard,
-                            'title': change.title,
-                            'description': change.description,
-                            'source_url': change.source_url,
-                            'publication_date': change.publication_date,
-                            'change_type': change.change_type,
-                            'severity': change.severity,
-                            'affected_requirements': change.affected_requirements,
-                            'confidence': change.confidence,
-                            'detected_at': change.detected_at
-                        })
-                        self._save_changes()
+                if self._is_known_change(entry_id):
+                    if assume_chronological:
+                        # Feeds are newest-first: everything after the
+                        # first known entry is older and already stored
+                        break
+                    continue
+
+                # Analyze entry for regulatory changes
+                change = self._analyze_rss_entry(standard, entry, rss_url)
+                if change:
+                    record = asdict(change)
+                    self.regulatory_changes.append(record)
+                    self._change_times.append(self._detected_at_timestamp(record))
+                    self._changes_by_standard[record['standard']] += 1
+                    self._save_changes([record])
                         
         except Exception as e:
             logger.error(f"Error parsing RSS feed {rss_url}: {e}")
@@ -370,9 +643,24 @@ class RegulatoryMonitor:
     def _check_web_page(self, standard: str, web_url: str):
         """Check web page for changes."""
         try:
-            response = requests.get(web_url, timeout=30)
+            headers = {}
+            etag, last_modified = self._etag_store.get(web_url, (None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+            response = self._http.get(web_url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return
             response.raise_for_status()
-            
+
+            new_etag = response.headers.get('ETag')
+            new_modified = response.headers.get('Last-Modified')
+            if new_etag or new_modified:
+                self._etag_store[web_url] = (new_etag, new_modified)
+                self._save_etag_store()
+
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Look for recent updates or announcements
@@ -380,27 +668,18 @@ class RegulatoryMonitor:
                                           class_=re.compile(r'update|announcement|news|change'))
             
             for element in update_elements:
-                # Extract text content
-                text_content = element.get_text(strip=True)
-                
+                # Extract text content and lowercase it once
+                ctx = _ClassifyCtx.from_content(element.get_text(strip=True), standard)
+
                 # Check if this looks like a regulatory change
-                if self._is_regulatory_change(text_content, standard):
-                    change = self._analyze_web_content(standard, text_content, web_url)
+                if self._is_regulatory_change(ctx):
+                    change = self._analyze_web_content(ctx, web_url)
                     if change:
-                        self.regulatory_changes.append({
-                            'change_id': change.change_id,
-                            'standard': change.standard,
-                            'title': change.title,
-                            'description': change.description,
-                            'source_url': change.source_url,
-                            'publication_date': change.publication_date,
-                            'change_type': change.change_type,
-                            'severity': change.severity,
-                            'affected_requirements': change.affected_requirements,
-                            'confidence': change.confidence,
-                            'detected_at': change.detected_at
-                        })
-                        self._save_changes()
+                        record = asdict(change)
+                        self.regulatory_changes.append(record)
+                        self._change_times.append(self._detected_at_timestamp(record))
+                        self._changes_by_standard[record['standard']] += 1
+                        self._save_changes([record])
                         
         except Exception as e:
             logger.error(f"Error checking web page {web_url}: {e}")
@@ -412,20 +691,20 @@ class RegulatoryMonitor:
         link = getattr(entry, 'link', source_url)
         published = getattr(entry, 'published', datetime.now().isoformat())
         
-        # Combine title and description for analysis
-        content = f"{title} {description}"
-        
-        if not self._is_regulatory_change(content, standard):
+        # Combine title and description for analysis; lowercase once
+        ctx = _ClassifyCtx.from_content(f"{title} {description}", standard)
+
+        if not self._is_regulatory_change(ctx):
             return None
-        
+
         # Determine change type
-        change_type = self._classify_change_type(content)
-        
+        change_type = self._classify_change_type(ctx)
+
         # Determine severity
-        severity = self._classify_severity(content, change_type)
-        
+        severity = self._classify_severity(ctx, change_type)
+
         # Calculate confidence
-        confidence = self._calculate_confidence(content, standard, change_type)
+        confidence = self._calculate_confidence(ctx, change_type)
         
         # Generate change ID
         change_id = self._generate_change_id(standard, title, published)
@@ -444,32 +723,29 @@ class RegulatoryMonitor:
             detected_at=datetime.now().isoformat()
         )
     
-    def _analyze_web_content(self, standard: str, content: str, source_url: str) -> Optional[RegulatoryChange]:
+    def _analyze_web_content(self, ctx: _ClassifyCtx, source_url: str) -> Optional[RegulatoryChange]:
         """Analyze web content for regulatory changes."""
-        if not self._is_regulatory_change(content, standard):
-            return None
-        
         # Extract title (first line or sentence)
-        lines = content.split('\n')
+        lines = ctx.content.split('\n')
         title = lines[0][:100] if lines else "Regulatory Change"
-        
+
         # Determine change type
-        change_type = self._classify_change_type(content)
-        
+        change_type = self._classify_change_type(ctx)
+
         # Determine severity
-        severity = self._classify_severity(content, change_type)
-        
+        severity = self._classify_severity(ctx, change_type)
+
         # Calculate confidence
-        confidence = self._calculate_confidence(content, standard, change_type)
-        
+        confidence = self._calculate_confidence(ctx, change_type)
+
         # Generate change ID
-        change_id = self._generate_change_id(standard, title, datetime.now().isoformat())
-        
+        change_id = self._generate_change_id(ctx.standard, title, datetime.now().isoformat())
+
         return RegulatoryChange(
             change_id=change_id,
-            standard=standard,
+            standard=ctx.standard,
             title=title,
-            description=content[:500],  # Truncate for storage
+            description=ctx.content[:500],  # Truncate for storage
             source_url=source_url,
             publication_date=datetime.now().isoformat(),
             change_type=change_type,
@@ -479,13 +755,13 @@ class RegulatoryMonitor:
             detected_at=datetime.now().isoformat()
         )
     
-    def _is_regulatory_change(self, content: str, standard: str) -> bool:
+    def _is_regulatory_change(self, ctx: _ClassifyCtx) -> bool:
         """Check if content represents a regulatory change."""
-        content_lower = content.lower()
-        
+        content_lower = ctx.content_lower
+
         # Check for standard-specific keywords
-        if standard in self.monitoring_sources:
-            keywords = self.monitoring_sources[standard]['keywords']
+        if ctx.standard in self.monitoring_sources:
+            keywords = self.monitoring_sources[ctx.standard]['keywords']
             if not any(keyword.lower() in content_lower for keyword in keywords):
                 return False
         
@@ -506,72 +782,58 @@ class RegulatoryMonitor:
         
         return any(context in content_lower for context in regulatory_context)
     
-    def _classify_change_type(self, content: str) -> str:
+    def _classify_change_type(self, ctx: _ClassifyCtx) -> str:
         """Classify the type of regulatory change."""
-        content_lower = content.lower()
-        
         for change_type, patterns in self.change_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, content_lower):
+                if re.search(pattern, ctx.content_lower):
                     return change_type.replace('_', ' ')
-        
+
         return 'general'
-    
-    def _classify_severity(self, content: str, change_type: str) -> str:
+
+    def _classify_severity(self, ctx: _ClassifyCtx, change_type: str) -> str:
         """Classify the severity of the regulatory change."""
-        content_lower = content.lower()
-        
-        # High severity indicators
-        high_severity = [
-            'immediate', 'urgent', 'critical', 'mandatory',
-            'required', 'effective immediately', 'compliance required'
-        ]
-        
-        if any(indicator in content_lower for indicator in high_severity):
-            return 'critical'
-        
-        # Medium severity indicators
-        medium_severity = [
-            'important', 'significant', 'major', 'updated',
-            'revised', 'amended', 'changes to'
-        ]
-        
-        if any(indicator in content_lower for indicator in medium_severity):
-            return 'high'
-        
-        # Low severity indicators
-        low_severity = [
-            'clarification', 'guidance', 'frequently asked',
-            'interpretation', 'best practice'
-        ]
-        
-        if any(indicator in content_lower for indicator in low_severity):
-            return 'medium'
-        
-        return 'low'
+        # Single pass over the content; the highest-priority tier wins
+        # regardless of where its indicator appears.
+        severity = 'low'
+        for match in self._severity_re.finditer(ctx.content_lower):
+            if match.group('crit'):
+                return 'critical'
+            if match.group('high'):
+                severity = 'high'
+            elif match.group('med') and severity == 'low':
+                severity = 'medium'
+        return severity
     
-    def _calculate_confidence(self, content: str, standard: str, change_type: str) -> float:
+    def _calculate_confidence(self, ctx: _ClassifyCtx, change_type: str) -> float:
         """Calculate confidence score for the detected change."""
         confidence = 0.5  # Base confidence
-        
+
         # Increase confidence based on standard-specific keywords
-        if standard in self.monitoring_sources:
-            keywords = self.monitoring_sources[standard]['keywords']
-            keyword_matches = sum(1 for keyword in keywords if keyword.lower() in content.lower())
+        if ctx.standard in self.monitoring_sources:
+            keywords = self.monitoring_sources[ctx.standard]['keywords']
+            keyword_matches = sum(1 for keyword in keywords if keyword.lower() in ctx.content_lower)
             confidence += min(keyword_matches * 0.1, 0.3)
-        
+
         # Increase confidence based on change type specificity
         if change_type in ['new regulation', 'updated regulation']:
             confidence += 0.2
         elif change_type in ['deprecated regulation']:
             confidence += 0.3
-        
+
         # Increase confidence based on content length and detail
-        if len(content) > 200:
+        if len(ctx.content) > 200:
             confidence += 0.1
-        
+
         return min(confidence, 1.0)
     
+    @staticmethod
+    def _detected_at_timestamp(change: Dict[str, Any]) -> float:
+        """Convert a change's detected_at ISO string to an epoch float."""
+        return datetime.fromisoformat(
+            change['detected_at'].replace('Z', '+00:00')
+        ).timestamp()
+
     def _generate_change_id(self, standard: str, title: str, date: str) -> str:
         """Generate unique change ID."""
         content = f"{standard}_{title}_{date}"
@@ -587,46 +849,54 @@ class RegulatoryMonitor:
     
     def _is_known_change(self, change_id: str) -> bool:
         """Check if change is already known."""
-        return any(change['change_id'] == change_id for change in self.regulatory_changes)
+        row = self._db.execute(
+            "SELECT 1 FROM changes WHERE change_id = ? LIMIT 1", (change_id,)
+        ).fetchone()
+        return row is not None
     
     def _analyze_changes(self):
         """Analyze detected changes for impact on requirements."""
-        for change in self.regulatory_changes:
-            if not change.get('affected_requirements'):
-                # Analyze change for requirement impact
-                affected_requirements = self._analyze_requirement_impact(change)
-                change['affected_requirements'] = affected_requirements
-                self._save_changes()
-    
+        pending = [change for change in self.regulatory_changes
+                   if not change.get('affected_requirements')]
+        if not pending:
+            return
+
+        # Per-change analysis is independent and CPU-bound; offload large
+        # batches to a process pool, but stay serial for small ones.
+        if len(pending) < _PARALLEL_ANALYSIS_THRESHOLD:
+            results = [_analyze_requirement_impact(change) for change in pending]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                results = list(pool.map(_analyze_requirement_impact, pending, chunksize=64))
+
+        for change, affected_requirements in zip(pending, results):
+            change['affected_requirements'] = affected_requirements
+        self._save_changes(pending)
+
     def _analyze_requirement_impact(self, change: Dict[str, Any]) -> List[str]:
         """Analyze which requirements might be affected by the change."""
-        # This would require integration with the requirements database
-        # For now, return empty list
-        return []
+        return _analyze_requirement_impact(change)
     
     def _generate_alerts(self):
         """Generate alerts for significant changes."""
         threshold_confidence = self.config.get('alert_threshold_confidence', 0.7)
-        
+
+        new_alerts = []
+        new_records = []
         for change in self.regulatory_changes:
             if change['confidence'] >= threshold_confidence:
                 alert = self._create_alert(change)
                 if alert:
-                    self.alerts.append({
-                        'alert_id': alert.alert_id,
-                        'change_id': alert.change_id,
-                        'alert_type': alert.alert_type,
-                        'severity': alert.severity,
-                        'title': alert.title,
-                        'message': alert.message,
-                        'affected_test_cases': alert.affected_test_cases,
-                        'recommended_actions': alert.recommended_actions,
-                        'created_at': alert.created_at
-                    })
-                    self._save_alerts()
-                    
-                    # Send notifications
-                    self._send_notifications(alert)
+                    record = asdict(alert)
+                    self._add_alert(record)
+                    new_alerts.append(alert)
+                    new_records.append(record)
+
+        if new_records:
+            self._save_alerts(new_records)
+            # Send notifications in one batch so SMTP/HTTP handshakes
+            # are paid once per cycle, not once per alert
+            self._send_notifications(new_alerts)
     
     def _create_alert(self, change: Dict[str, Any]) -> Optional[MonitoringAlert]:
         """Create alert for regulatory change."""
@@ -691,103 +961,103 @@ class RegulatoryMonitor:
         
         return actions
     
-    def _send_notifications(self, alert: MonitoringAlert):
-        """Send notifications for alerts."""
+    def _send_notifications(self, alerts: List[MonitoringAlert]):
+        """Send notifications for a batch of alerts."""
+        if not alerts:
+            return
+
         # Email notifications
         if self.config.get('email_notifications', {}).get('enabled', False):
-            self._send_email_notification(alert)
-        
+            self._send_email_notifications(alerts)
+
         # Webhook notifications
         if self.config.get('webhook_notifications', {}).get('enabled', False):
-            self._send_webhook_notification(alert)
-    
-    def _send_email_notification(self, alert: MonitoringAlert):
-        """Send email notification."""
+            self._send_webhook_notifications(alerts)
+
+    def _send_email_notifications(self, alerts: List[MonitoringAlert]):
+        """Send email notifications over a single SMTP session."""
         try:
             email_config = self.config['email_notifications']
-            
-            msg = MIMEMultipart()
-            msg['From'] = email_config['username']
-            msg['To'] = ', '.join(email_config['recipients'])
-            msg['Subject'] = alert.title
-            
-            msg.attach(MIMEText(alert.message, 'plain'))
-            
+
             server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
-            server.starttls()
-            server.login(email_config['username'], email_config['password'])
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info(f"Email notification sent for alert {alert.alert_id}")
-            
+            try:
+                server.starttls()
+                server.login(email_config['username'], email_config['password'])
+
+                for alert in alerts:
+                    msg = MIMEMultipart()
+                    msg['From'] = email_config['username']
+                    msg['To'] = ', '.join(email_config['recipients'])
+                    msg['Subject'] = alert.title
+                    msg.attach(MIMEText(alert.message, 'plain'))
+                    server.send_message(msg)
+            finally:
+                server.quit()
+
+            logger.info(f"Email notifications sent for {len(alerts)} alert(s)")
+
         except Exception as e:
-            logger.error(f"Error sending email notification: {e}")
-    
-    def _send_webhook_notification(self, alert: MonitoringAlert):
-        """Send webhook notification."""
+            logger.error(f"Error sending email notifications: {e}")
+
+    def _send_webhook_notifications(self, alerts: List[MonitoringAlert]):
+        """Send one webhook POST per URL carrying all alerts."""
         try:
             webhook_config = self.config['webhook_notifications']
-            
-            payload = {
-                'alert_id': alert.alert_id,
-                'change_id': alert.change_id,
-                'alert_type': alert.alert_type,
-                'severity': alert.severity,
-                'title': alert.title,
-                'message': alert.message,
-                'affected_test_cases': alert.affected_test_cases,
-                'recommended_actions': alert.recommended_actions,
-                'created_at': alert.created_at
-            }
-            
+
+            payload = [
+                {
+                    'alert_id': alert.alert_id,
+                    'change_id': alert.change_id,
+                    'alert_type': alert.alert_type,
+                    'severity': alert.severity,
+                    'title': alert.title,
+                    'message': alert.message,
+                    'affected_test_cases': alert.affected_test_cases,
+                    'recommended_actions': alert.recommended_actions,
+                    'created_at': alert.created_at
+                }
+                for alert in alerts
+            ]
+
             for webhook_url in webhook_config['urls']:
-                response = requests.post(webhook_url, json=payload, timeout=30)
+                response = self._http.post(webhook_url, json=payload, timeout=30)
                 response.raise_for_status()
-            
-            logger.info(f"Webhook notification sent for alert {alert.alert_id}")
-            
+
+            logger.info(f"Webhook notifications sent for {len(alerts)} alert(s)")
+
         except Exception as e:
-            logger.error(f"Error sending webhook notification: {e}")
+            logger.error(f"Error sending webhook notifications: {e}")
     
     def get_recent_changes(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get recent regulatory changes."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        recent_changes = []
-        for change in self.regulatory_changes:
-            change_date = datetime.fromisoformat(change['detected_at'].replace('Z', '+00:00'))
-            if change_date >= cutoff_date:
-                recent_changes.append(change)
-        
-        return sorted(recent_changes, key=lambda x: x['detected_at'], reverse=True)
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+
+        # The change list is time-ordered, so bisect the parallel
+        # timestamp list and return the tail, newest first
+        idx = bisect.bisect_left(self._change_times, cutoff)
+        return self.regulatory_changes[idx:][::-1]
     
+    def _add_alert(self, record: Dict[str, Any]):
+        """Record a new alert and update the incremental aggregates."""
+        self.alerts.append(record)
+        self._alerts_by_severity[record['severity']] += 1
+        if record['severity'] in ('critical', 'high'):
+            self._active_alerts.append(record)
+
     def get_active_alerts(self) -> List[Dict[str, Any]]:
         """Get active alerts."""
-        return [alert for alert in self.alerts if alert['severity'] in ['critical', 'high']]
+        # Copy so callers cannot mutate the monitor's internal list
+        return list(self._active_alerts)
     
     def get_monitoring_statistics(self) -> Dict[str, Any]:
         """Get monitoring statistics."""
-        total_changes = len(self.regulatory_changes)
-        total_alerts = len(self.alerts)
-        
-        # Count by standard
-        changes_by_standard = {}
-        for change in self.regulatory_changes:
-            standard = change['standard']
-            changes_by_standard[standard] = changes_by_standard.get(standard, 0) + 1
-        
-        # Count by severity
-        alerts_by_severity = {}
-        for alert in self.alerts:
-            severity = alert['severity']
-            alerts_by_severity[severity] = alerts_by_severity.get(severity, 0) + 1
-        
+        # Aggregates are maintained incrementally as changes and alerts
+        # are recorded, so this is O(1) in the history size
         return {
-            'total_changes': total_changes,
-            'total_alerts': total_alerts,
-            'changes_by_standard': changes_by_standard,
-            'alerts_by_severity': alerts_by_severity,
+            'total_changes': len(self.regulatory_changes),
+            'total_alerts': len(self.alerts),
+            'changes_by_standard': dict(self._changes_by_standard),
+            'alerts_by_severity': dict(self._alerts_by_severity),
             'monitoring_active': self.is_monitoring,
             'last_check': datetime.now().isoformat()
         }
@@ -5,14 +5,19 @@ Implements logic to detect UI/API changes using historical execution results
 and automatically adjust test case steps or selectors.
 """
 
+import concurrent.futures
+import functools
 import logging
 import json
 import hashlib
+from collections import Counter, deque
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 import re
+import threading
+import time
 import difflib
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -22,8 +27,73 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import requests
 from bs4 import BeautifulSoup
 
+from .http_client import get_session
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # substring fallback; pyahocorasick is optional
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Endpoint probe verdicts are reused for this many seconds before the
+# URL is hit again
+_ENDPOINT_CACHE_TTL = 300
+_ENDPOINT_CACHE_MAXSIZE = 1024
+
+# In-memory execution-history window; older records stay on disk only
+_HISTORY_MAXLEN = 10_000
+
+
+@functools.lru_cache(maxsize=2048)
+def _find_alternative_selector(old_selector: str) -> Optional[str]:
+    """Find alternative selector for UI element.
+
+    Pure string transform; memoized because retried failures probe the
+    same selector repeatedly.
+    """
+    try:
+        # This would require actual browser interaction
+        # For demo purposes, return a modified selector
+        if 'id=' in old_selector:
+            # Try class-based selector
+            return old_selector.replace('id=', 'class=')
+        elif 'class=' in old_selector:
+            # Try xpath
+            return f"//*[@class='{old_selector.split('=')[1]}']"
+        else:
+            # Try different approach
+            return f"//*[contains(text(), '{old_selector}')]"
+    except Exception as e:
+        logger.error(f"Error finding alternative selector: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _generate_new_assertion(old_assertion: str, actual_result: str) -> str:
+    """Generate new assertion based on actual result."""
+    # Simple assertion update logic
+    if "contains" in old_assertion.lower():
+        return f"Response contains: {actual_result[:100]}..."
+    elif "equals" in old_assertion.lower():
+        return f"Response equals: {actual_result}"
+    else:
+        return f"Response matches: {actual_result[:100]}..."
+
 
 @dataclass
 class ChangeDetection:
@@ -67,56 +137,94 @@ class ExecutionResult:
 class SelfHealingEngine:
     """Self-healing test case engine."""
     
-    def __init__(self, history_path: str = "data/execution_history.json"):
+    def __init__(self, history_path: str = "data/execution_history.jsonl"):
         """Initialize the self-healing engine."""
         self.history_path = Path(history_path)
         self.history_path.parent.mkdir(exist_ok=True)
-        self.execution_history = self._load_execution_history()
+        self.execution_history = deque(self._load_execution_history(),
+                                       maxlen=_HISTORY_MAXLEN)
         self.change_patterns = self._initialize_change_patterns()
         self.healing_rules = self._initialize_healing_rules()
+        # Heal-action log (JSON Lines) with incrementally maintained stats
+        self.heal_log_path = self.history_path.parent / "heal_actions.jsonl"
+        self._heal_type_counts: Counter = Counter()
+        # Per-pattern hit tallies maintained as failures are analyzed
+        self._pattern_hit_counts: Counter = Counter()
+        self._total_heals = 0
+        self._high_confidence_heals = 0
+        self._load_heal_stats()
+        # TTL cache of endpoint probe results: url -> (verdict, expires_at)
+        self._endpoint_cache: Dict[str, Tuple[bool, float]] = {}
+        # Pooled session (shared with regulatory monitoring) so repeated
+        # probes reuse TCP/TLS connections and retry consistently
+        self._http = get_session()
+        # Extraction regexes compiled once; hit on every failure
+        self._selector_re = re.compile(r'selector[:\s]+(\S+)', re.IGNORECASE)
+        self._url_re = re.compile(r'https?://\S+')
+        # Serializes heal-log writes when failures heal concurrently
+        self._record_lock = threading.Lock()
+        # Dispatch tables replacing the if/elif routing chains
+        self._detect_dispatch = {
+            'ui_element_changes': self._detect_ui_element_change,
+            'api_endpoint_changes': self._detect_api_endpoint_change,
+            'response_structure_changes': self._detect_response_structure_change
+        }
+        self._strategy_dispatch = {
+            'update_selector': self._update_selector,
+            'update_endpoint_url': self._update_endpoint_url,
+            'update_json_path': self._update_json_path,
+            'update_assertion': self._update_assertion
+        }
         
     def _load_execution_history(self) -> List[ExecutionResult]:
-        """Load execution history from file."""
+        """Load execution history from file (JSON Lines, one result per line)."""
+        legacy_path = self.history_path.with_suffix('.json')
+        if not self.history_path.exists() and legacy_path.exists():
+            return self._migrate_legacy_history(legacy_path)
+
         if not self.history_path.exists():
             return []
-        
+
         try:
             with open(self.history_path, 'r') as f:
-                data = json.load(f)
-            
-            return [
-                ExecutionResult(**item) for item in data
-            ]
+                return [ExecutionResult(**_json_loads(line))
+                        for line in f if line.strip()]
         except Exception as e:
             logger.error(f"Error loading execution history: {e}")
             return []
-    
-    def _save_execution_history(self):
-        """Save execution history to file."""
+
+    def _migrate_legacy_history(self, legacy_path: Path) -> List[ExecutionResult]:
+        """One-time conversion of the old whole-file JSON history to JSONL."""
         try:
-            data = [
-                {
-                    'test_case_id': result.test_case_id,
-                    'step_number': result.step_number,
-                    'action': result.action,
-                    'expected_result': result.expected_result,
-                    'actual_result': result.actual_result,
-                    'status': result.status,
-                    'execution_time': result.execution_time,
-                    'screenshot_path': result.screenshot_path,
-                    'error_message': result.error_message
-                }
-                for result in self.execution_history
-            ]
-            
+            with open(legacy_path, 'r') as f:
+                data = json.load(f)
+            results = [ExecutionResult(**item) for item in data]
+
             with open(self.history_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                for result in results:
+                    f.write(_json_dumps(asdict(result)) + '\n')
+            legacy_path.rename(legacy_path.with_suffix('.json.migrated'))
+            logger.info("Migrated legacy execution history to JSONL")
+            return results
+        except Exception as e:
+            logger.error(f"Error migrating execution history: {e}")
+            return []
+
+    def _append_execution_result(self, result: ExecutionResult):
+        """Append one execution result to the history file."""
+        try:
+            with open(self.history_path, 'a') as f:
+                f.write(_json_dumps(asdict(result)) + '\n')
         except Exception as e:
             logger.error(f"Error saving execution history: {e}")
     
-    def _initialize_change_patterns(self) -> Dict[str, List[str]]:
-        """Initialize patterns for detecting changes."""
-        return {
+    def _initialize_change_patterns(self) -> Dict[str, 're.Pattern']:
+        """Initialize patterns for detecting changes.
+
+        Returns one combined, precompiled regex per change category so a
+        failure message is classified with a single search call.
+        """
+        pattern_strings = {
             'ui_element_changes': [
                 r'element.*not.*found',
                 r'selector.*invalid',
@@ -137,6 +245,54 @@ class SelfHealingEngine:
                 r'json.*parsing.*error'
             ]
         }
+
+        # Individual compiled patterns kept for per-pattern analysis paths
+        self._compiled_patterns = {
+            change_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for change_type, patterns in pattern_strings.items()
+        }
+
+        # Literal keywords per category, used to narrow which combined
+        # regexes are worth running against a failure message
+        self._category_keywords = {
+            'ui_element_changes': ('element', 'selector', 'stale'),
+            'api_endpoint_changes': ('404', 'endpoint', 'url'),
+            'response_structure_changes': ('key', 'field', 'response', 'json')
+        }
+
+        # Flat keyword set for the cheap "can anything match?" prefilter
+        self._keyword_set = frozenset(
+            keyword for keywords in self._category_keywords.values()
+            for keyword in keywords
+        )
+
+        if ahocorasick is not None:
+            # Single linear scan over the message reports every matching
+            # category at once
+            automaton = ahocorasick.Automaton()
+            for category, keywords in self._category_keywords.items():
+                for keyword in keywords:
+                    automaton.add_word(keyword, category)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+        else:
+            self._keyword_automaton = None
+
+        # One alternation with named groups over the UI patterns, so
+        # failure batches are counted per-pattern in a single search
+        ui_patterns = pattern_strings['ui_element_changes']
+        self._ui_combined = re.compile(
+            "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(ui_patterns)),
+            re.IGNORECASE
+        )
+        self._ui_pattern_names = {f"p{i}": p for i, p in enumerate(ui_patterns)}
+
+        return {
+            change_type: re.compile(
+                "|".join(f"(?:{p})" for p in patterns), re.IGNORECASE
+            )
+            for change_type, patterns in pattern_strings.items()
+        }
     
     def _initialize_healing_rules(self) -> Dict[str, Dict[str, Any]]:
         """Initialize healing rules for different change types."""
@@ -170,7 +326,7 @@ class SelfHealingEngine:
     def record_execution_result(self, result: ExecutionResult):
         """Record test execution result for analysis."""
         self.execution_history.append(result)
-        self._save_execution_history()
+        self._append_execution_result(result)
         
         # Analyze for potential changes
         if result.status == 'fail':
@@ -179,34 +335,74 @@ class SelfHealingEngine:
     def _analyze_failure(self, result: ExecutionResult):
         """Analyze test failure for potential changes."""
         error_message = result.error_message or result.actual_result
-        
-        for change_type, patterns in self.change_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, error_message, re.IGNORECASE):
-                    change = self._detect_change(change_type, result, pattern)
-                    if change:
-                        self._attempt_healing(change, result)
-                    break
+
+        # Cheap prefilter: most failures (timeouts, assertion diffs)
+        # contain none of the change keywords, so skip all regex work
+        error_lower = error_message.lower()
+        if not any(keyword in error_lower for keyword in self._keyword_set):
+            return
+
+        # One clock read and ISO formatting per analysis; every record
+        # produced below shares it.  Kept local so concurrent analyses
+        # (analyze_failures_batch) cannot stamp each other's records
+        now_iso = datetime.now().isoformat()
+
+        # Narrow the candidate categories with one keyword scan before
+        # paying for the combined regexes
+        if self._keyword_automaton is not None:
+            candidates = {category for _, category
+                          in self._keyword_automaton.iter(error_lower)}
+        else:
+            candidates = {category
+                          for category, keywords in self._category_keywords.items()
+                          if any(keyword in error_lower for keyword in keywords)}
+
+        for change_type, combined_pattern in self.change_patterns.items():
+            if change_type in candidates and combined_pattern.search(error_message):
+                if change_type == 'ui_element_changes':
+                    # Tally which UI pattern fired, so improvement
+                    # suggestions need no history rescan; the += on the
+                    # Counter is not atomic, so take the record lock
+                    match = self._ui_combined.search(error_message)
+                    if match:
+                        with self._record_lock:
+                            self._pattern_hit_counts[self._ui_pattern_names[match.lastgroup]] += 1
+
+                change = self._detect_change(change_type, result, combined_pattern.pattern, now_iso)
+                if change:
+                    self._attempt_healing(change, result)
     
-    def _detect_change(self, change_type: str, result: ExecutionResult, pattern: str) -> Optional[ChangeDetection]:
+    def analyze_failures_batch(self, results: List[ExecutionResult]):
+        """Analyze a batch of failed results concurrently.
+
+        Each failure heals independently and the work is dominated by
+        HTTP probes, so fanning out over threads collapses the batch
+        latency to roughly that of the slowest failure.
+        """
+        if not results:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(results))) as pool:
+            list(pool.map(self._analyze_failure, results))
+
+    def _detect_change(self, change_type: str, result: ExecutionResult,
+                       pattern: str, now_iso: str) -> Optional[ChangeDetection]:
         """Detect specific change based on error pattern."""
         try:
-            if change_type == 'ui_element_changes':
-                return self._detect_ui_element_change(result, pattern)
-            elif change_type == 'api_endpoint_changes':
-                return self._detect_api_endpoint_change(result, pattern)
-            elif change_type == 'response_structure_changes':
-                return self._detect_response_structure_change(result, pattern)
+            detector = self._detect_dispatch.get(change_type)
+            if detector:
+                return detector(result, pattern, now_iso)
         except Exception as e:
             logger.error(f"Error detecting change: {e}")
-        
+
         return None
     
-    def _detect_ui_element_change(self, result: ExecutionResult, pattern: str) -> Optional[ChangeDetection]:
+    def _detect_ui_element_change(self, result: ExecutionResult, pattern: str,
+                                  now_iso: str) -> Optional[ChangeDetection]:
         """Detect UI element changes."""
         # Extract selector from action
         action = result.action
-        selector_match = re.search(r'selector[:\s]+([^\s]+)', action, re.IGNORECASE)
+        selector_match = self._selector_re.search(action)
         
         if not selector_match:
             return None
@@ -214,7 +410,7 @@ class SelfHealingEngine:
         old_selector = selector_match.group(1)
         
         # Try to find alternative selector
-        new_selector = self._find_alternative_selector(old_selector, result)
+        new_selector = _find_alternative_selector(old_selector)
         
         if new_selector and new_selector != old_selector:
             return ChangeDetection(
@@ -224,15 +420,16 @@ class SelfHealingEngine:
                 new_value=new_selector,
                 confidence=0.8,
                 change_description=f"Element selector changed from {old_selector} to {new_selector}",
-                detected_at=datetime.now().isoformat()
+                detected_at=now_iso
             )
         
         return None
     
-    def _detect_api_endpoint_change(self, result: ExecutionResult, pattern: str) -> Optional[ChangeDetection]:
+    def _detect_api_endpoint_change(self, result: ExecutionResult, pattern: str,
+                                    now_iso: str) -> Optional[ChangeDetection]:
         """Detect API endpoint changes."""
         # Extract URL from action
-        url_match = re.search(r'https?://[^\s]+', result.action)
+        url_match = self._url_re.search(result.action)
         
         if not url_match:
             return None
@@ -250,12 +447,13 @@ class SelfHealingEngine:
                 new_value=new_url,
                 confidence=0.9,
                 change_description=f"API endpoint changed from {old_url} to {new_url}",
-                detected_at=datetime.now().isoformat()
+                detected_at=now_iso
             )
         
         return None
     
-    def _detect_response_structure_change(self, result: ExecutionResult, pattern: str) -> Optional[ChangeDetection]:
+    def _detect_response_structure_change(self, result: ExecutionResult, pattern: str,
+                                          now_iso: str) -> Optional[ChangeDetection]:
         """Detect response structure changes."""
         # This would require more sophisticated analysis
         # For now, return a generic change detection
@@ -266,27 +464,9 @@ class SelfHealingEngine:
             new_value='modified',
             confidence=0.6,
             change_description="Response structure may have changed",
-            detected_at=datetime.now().isoformat()
+            detected_at=now_iso
         )
     
-    def _find_alternative_selector(self, old_selector: str, result: ExecutionResult) -> Optional[str]:
-        """Find alternative selector for UI element."""
-        try:
-            # This would require actual browser interaction
-            # For demo purposes, return a modified selector
-            if 'id=' in old_selector:
-                # Try class-based selector
-                return old_selector.replace('id=', 'class=')
-            elif 'class=' in old_selector:
-                # Try xpath
-                return f"//*[@class='{old_selector.split('=')[1]}']"
-            else:
-                # Try different approach
-                return f"//*[contains(text(), '{old_selector}')]"
-        except Exception as e:
-            logger.error(f"Error finding alternative selector: {e}")
-            return None
-    
     def _find_alternative_endpoint(self, old_url: str, result: ExecutionResult) -> Optional[str]:
         """Find alternative API endpoint."""
         try:
@@ -299,22 +479,49 @@ class SelfHealingEngine:
                 old_url.replace('/v2/', '/v1/')
             ]
             
-            for variation in variations:
-                if self._test_endpoint(variation):
-                    return variation
-            
+            # Drop duplicates and no-op replacements before spending probes
+            candidates = [v for v in dict.fromkeys(variations) if v != old_url]
+            if not candidates:
+                return None
+
+            # Probe all candidates concurrently; each is an independent
+            # blocking HTTP round-trip, so latency drops to ~one RTT
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+                futures = {pool.submit(self._test_endpoint, variation): variation
+                           for variation in candidates}
+                for future in concurrent.futures.as_completed(futures):
+                    if future.result():
+                        for other in futures:
+                            other.cancel()
+                        return futures[future]
+
             return None
         except Exception as e:
             logger.error(f"Error finding alternative endpoint: {e}")
             return None
     
     def _test_endpoint(self, url: str) -> bool:
-        """Test if an endpoint is accessible."""
+        """Test if an endpoint is accessible (verdicts cached with a TTL)."""
+        now = time.monotonic()
+        cached = self._endpoint_cache.get(url)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
         try:
-            response = requests.get(url, timeout=5)
-            return response.status_code < 400
+            # HEAD avoids downloading a body we would discard; fall back
+            # to GET for servers that disallow it
+            response = self._http.head(url, timeout=5, allow_redirects=True)
+            if response.status_code == 405:
+                response = self._http.get(url, timeout=5, stream=True)
+                response.close()
+            accessible = response.status_code < 400
         except:
-            return False
+            accessible = False
+
+        if len(self._endpoint_cache) >= _ENDPOINT_CACHE_MAXSIZE:
+            self._endpoint_cache.clear()
+        self._endpoint_cache[url] = (accessible, now + _ENDPOINT_CACHE_TTL)
+        return accessible
     
     def _attempt_healing(self, change: ChangeDetection, result: ExecutionResult):
         """Attempt to heal test case based on detected change."""
@@ -337,17 +544,12 @@ class SelfHealingEngine:
     def _apply_healing_strategy(self, strategy: str, change: ChangeDetection, result: ExecutionResult) -> Optional[HealAction]:
         """Apply specific healing strategy."""
         try:
-            if strategy == 'update_selector':
-                return self._update_selector(change, result)
-            elif strategy == 'update_endpoint_url':
-                return self._update_endpoint_url(change, result)
-            elif strategy == 'update_json_path':
-                return self._update_json_path(change, result)
-            elif strategy == 'update_assertion':
-                return self._update_assertion(change, result)
+            handler = self._strategy_dispatch.get(strategy)
+            if handler:
+                return handler(change, result)
         except Exception as e:
             logger.error(f"Error applying healing strategy {strategy}: {e}")
-        
+
         return None
     
     def _update_selector(self, change: ChangeDetection, result: ExecutionResult) -> Optional[HealAction]:
@@ -363,7 +565,8 @@ class SelfHealingEngine:
             new_content=new_action,
             confidence=change.confidence,
             reason=f"Updated selector from {change.old_value} to {change.new_value}",
-            healed_at=datetime.now().isoformat()
+            # Same analysis pass as the detection; reuse its timestamp
+            healed_at=change.detected_at
         )
     
     def _update_endpoint_url(self, change: ChangeDetection, result: ExecutionResult) -> Optional[HealAction]:
@@ -379,7 +582,8 @@ class SelfHealingEngine:
             new_content=new_action,
             confidence=change.confidence,
             reason=f"Updated endpoint from {change.old_value} to {change.new_value}",
-            healed_at=datetime.now().isoformat()
+            # Same analysis pass as the detection; reuse its timestamp
+            healed_at=change.detected_at
         )
     
     def _update_json_path(self, change: ChangeDetection, result: ExecutionResult) -> Optional[HealAction]:
@@ -393,13 +597,14 @@ class SelfHealingEngine:
             new_content=result.expected_result + " (updated for structure change)",
             confidence=change.confidence,
             reason="Updated JSON path for response structure change",
-            healed_at=datetime.now().isoformat()
+            # Same analysis pass as the detection; reuse its timestamp
+            healed_at=change.detected_at
         )
     
     def _update_assertion(self, change: ChangeDetection, result: ExecutionResult) -> Optional[HealAction]:
         """Update assertion in test case."""
         old_assertion = result.expected_result
-        new_assertion = self._generate_new_assertion(old_assertion, result.actual_result)
+        new_assertion = _generate_new_assertion(old_assertion, result.actual_result)
         
         return HealAction(
             test_case_id=result.test_case_id,
@@ -409,44 +614,54 @@ class SelfHealingEngine:
             new_content=new_assertion,
             confidence=change.confidence,
             reason="Updated assertion based on actual result",
-            healed_at=datetime.now().isoformat()
+            # Same analysis pass as the detection; reuse its timestamp
+            healed_at=change.detected_at
         )
     
-    def _generate_new_assertion(self, old_assertion: str, actual_result: str) -> str:
-        """Generate new assertion based on actual result."""
-        # Simple assertion update logic
-        if "contains" in old_assertion.lower():
-            return f"Response contains: {actual_result[:100]}..."
-        elif "equals" in old_assertion.lower():
-            return f"Response equals: {actual_result}"
-        else:
-            return f"Response matches: {actual_result[:100]}..."
-    
+    def _load_heal_stats(self):
+        """Seed the heal-action counters from the on-disk log."""
+        legacy_path = self.heal_log_path.with_suffix('.json')
+        if not self.heal_log_path.exists() and legacy_path.exists():
+            # One-time conversion of the old whole-file JSON log to JSONL
+            try:
+                with open(legacy_path, 'r') as f:
+                    heal_actions = json.load(f)
+                with open(self.heal_log_path, 'w') as f:
+                    for action in heal_actions:
+                        f.write(_json_dumps(action) + '\n')
+                legacy_path.rename(legacy_path.with_suffix('.json.migrated'))
+                logger.info("Migrated legacy heal-action log to JSONL")
+            except Exception as e:
+                logger.error(f"Error migrating heal-action log: {e}")
+                return
+
+        if not self.heal_log_path.exists():
+            return
+
+        try:
+            with open(self.heal_log_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._count_heal_action(_json_loads(line))
+        except Exception as e:
+            logger.error(f"Error loading heal-action log: {e}")
+
+    def _count_heal_action(self, action: Dict[str, Any]):
+        """Update the incremental heal statistics with one action."""
+        self._total_heals += 1
+        self._heal_type_counts[action['action_type']] += 1
+        if action['confidence'] > 0.7:
+            self._high_confidence_heals += 1
+
     def _record_heal_action(self, heal_action: HealAction):
         """Record healing action for tracking."""
-        heal_log_path = self.history_path.parent / "heal_actions.json"
-        
         try:
-            if heal_log_path.exists():
-                with open(heal_log_path, 'r') as f:
-                    heal_actions = json.load(f)
-            else:
-                heal_actions = []
-            
-            heal_actions.append({
-                'test_case_id': heal_action.test_case_id,
-                'step_number': heal_action.step_number,
-                'action_type': heal_action.action_type,
-                'old_content': heal_action.old_content,
-                'new_content': heal_action.new_content,
-                'confidence': heal_action.confidence,
-                'reason': heal_action.reason,
-                'healed_at': heal_action.healed_at
-            })
-            
-            with open(heal_log_path, 'w') as f:
-                json.dump(heal_actions, f, indent=2)
-                
+            record = asdict(heal_action)
+            with self._record_lock:
+                with open(self.heal_log_path, 'a') as f:
+                    f.write(_json_dumps(record) + '\n')
+                self._count_heal_action(record)
+
             logger.info(f"Heal action recorded: {heal_action.action_type} for {heal_action.test_case_id}")
         except Exception as e:
             logger.error(f"Error recording heal action: {e}")
@@ -468,31 +683,21 @@ class SelfHealingEngine:
     
     def get_healing_statistics(self) -> Dict[str, Any]:
         """Get statistics about healing actions."""
-        heal_log_path = self.history_path.parent / "heal_actions.json"
-        
-        if not heal_log_path.exists():
+        if self._total_heals == 0:
             return {'total_heals': 0, 'heal_types': {}, 'success_rate': 0.0}
-        
+
         try:
-            with open(heal_log_path, 'r') as f:
-                heal_actions = json.load(f)
-            
-            total_heals = len(heal_actions)
-            heal_types = {}
-            
-            for action in heal_actions:
-                action_type = action['action_type']
-                heal_types[action_type] = heal_types.get(action_type, 0) + 1
-            
-            # Calculate success rate based on confidence
-            high_confidence_heals = sum(1 for action in heal_actions if action['confidence'] > 0.7)
-            success_rate = high_confidence_heals / total_heals if total_heals > 0 else 0.0
-            
+            # Counters are maintained incrementally; only the recent tail
+            # is read back from the log
+            with open(self.heal_log_path, 'r') as f:
+                recent_heals = [_json_loads(line)
+                                for line in deque(f, maxlen=5) if line.strip()]
+
             return {
-                'total_heals': total_heals,
-                'heal_types': heal_types,
-                'success_rate': success_rate,
-                'recent_heals': heal_actions[-5:] if heal_actions else []
+                'total_heals': self._total_heals,
+                'heal_types': dict(self._heal_type_counts),
+                'success_rate': self._high_confidence_heals / self._total_heals,
+                'recent_heals': recent_heals
             }
         except Exception as e:
             logger.error(f"Error getting healing statistics: {e}")
@@ -501,23 +706,12 @@ class SelfHealingEngine:
     def suggest_healing_improvements(self) -> List[str]:
         """Suggest improvements to healing capabilities."""
         suggestions = []
-        
-        # Analyze failure patterns
-        recent_failures = [r for r in self.execution_history if r.status == 'fail']
-        
-        if len(recent_failures) > 10:
-            # Check for common failure patterns
-            error_patterns = {}
-            for failure in recent_failures:
-                error_msg = failure.error_message or failure.actual_result
-                for pattern in self.change_patterns['ui_element_changes']:
-                    if re.search(pattern, error_msg, re.IGNORECASE):
-                        error_patterns[pattern] = error_patterns.get(pattern, 0) + 1
-            
-            # Suggest improvements for common patterns
-            for pattern, count in error_patterns.items():
-                if count > 3:
-                    suggestions.append(f"Consider improving selector strategy for pattern: {pattern}")
+
+        # Pattern hits are tallied as failures are analyzed, so no
+        # history rescan is needed here
+        for pattern, count in self._pattern_hit_counts.items():
+            if count > 3:
+                suggestions.append(f"Consider improving selector strategy for pattern: {pattern}")
         
         # Check healing success rate
         stats = self.get_healing_statistics()
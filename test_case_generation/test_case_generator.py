@@ -5,24 +5,228 @@ Generates detailed, compliant test cases from healthcare requirements using
 AI and ensures traceability to regulatory standards.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
+import itertools
 import json
 import re
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, asdict, replace, fields as dataclasses_fields
 from enum import Enum
-import uuid
 from datetime import datetime
 
+from .llm_cache import LLMCache
+
 try:
-    import google.generativeai as genai
-    from google.cloud import aiplatform
-except ImportError:
-    genai = None
-    aiplatform = None
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# Concurrency cap for in-flight AI calls, kept below typical Gemini rate limits
+_MAX_CONCURRENT_AI_CALLS = 8
+
+# Pre-compiled patterns for the rule-based generation path; the action verbs
+# are fused into one alternation so the requirement text is scanned once.
+# Patterns are all-lowercase and matched against case-folded input, which is
+# cheaper than running the engine with re.IGNORECASE
+_COMBINED_ACTION_RE = re.compile(
+    r'(?:shall|must|will|should|'
+    r'enable|allow|provide|support|display|show|generate|create|validate|verify)'
+    r'\s+([^\n]+)'
+)
+
+_BOUNDARY_TRIGGER_RE = re.compile(r'\b(?:limit|maximum|minimum|range|threshold|value)\b')
+
+# Keyword-indexed test-data templates, checked in precedence order; values
+# are copied on lookup so callers can safely mutate/serialize them
+_ACTION_DATA_TEMPLATES = (
+    (frozenset({'login', 'authenticate'}), {
+        'username': 'test_user',
+        'password': 'test_password',
+        'role': 'healthcare_provider'
+    }),
+    (frozenset({'patient'}), {
+        'patient_id': 'PAT001',
+        'patient_name': 'Test Patient',
+        'date_of_birth': '1990-01-01'
+    }),
+    (frozenset({'data', 'record'}), {
+        'data_type': 'medical_record',
+        'data_format': 'HL7_FHIR',
+        'validation_rules': 'enabled'
+    }),
+)
+
+_DEFAULT_TEST_DATA = {
+    'input_data': 'test_input',
+    'expected_format': 'valid'
+}
+
+# Tokenizer for action text: alphabetic runs only, so punctuation stuck to
+# a word ("login:", "data,") cannot hide it from the template keywords
+_ACTION_WORD_RE = re.compile(r'[a-z]+')
+
+# Immutable-by-convention base scenarios, built once at import; callers treat
+# these dicts as read-only (plain dicts rather than MappingProxyType so they
+# stay JSON/asdict serializable)
+# Static generation instructions, rendered once at import. Keeping this as an
+# identical prefix across requests lets provider-side prompt caching reuse it
+# and avoids re-rendering ~1KB of boilerplate per requirement
+_SYSTEM_PROMPT = """
+        Generate detailed test cases for the following healthcare software requirement.
+        Ensure test cases include references to regulatory standards (FDA, ISO, IEC) for compliance.
+
+        Generate test cases including:
+        1. Case ID, title, description
+        2. Step-by-step actions with expected results
+        3. Priority based on requirement priority
+        4. References to regulatory standards (FDA, ISO, IEC)
+        5. Test data requirements
+        6. Prerequisites and pass/fail criteria
+        7. Estimated duration
+
+        Focus on healthcare-specific testing including:
+        - Patient safety validation
+        - Data privacy and security testing
+        - Regulatory compliance verification
+        - Medical device functionality testing
+        - Clinical workflow validation
+        - Audit trail verification
+        - Risk management validation
+
+        Generate both positive and negative test scenarios.
+        Include boundary value testing where applicable.
+
+        Return the result as a JSON object with a 'test_cases' array.
+        Each test case should have:
+        - id: Unique test case ID (TC-XXX format)
+        - title: Descriptive title
+        - description: Detailed description
+        - test_case_type: positive/negative/boundary/integration/performance/security/usability/compliance
+        - priority: critical/high/medium/low
+        - requirement_id: Reference to source requirement
+        - compliance_refs: List of compliance references
+        - test_steps: Array of test steps with step_number, action, expected_result
+        - prerequisites: List of prerequisites
+        - test_data: Object with test data requirements
+        - expected_outcome: Overall expected outcome
+        - pass_criteria: List of pass criteria
+        - fail_criteria: List of fail criteria
+        - estimated_duration: Duration in minutes
+        """
+
+_BASE_NEGATIVE_SCENARIOS = (
+    {
+        'action': 'Enter invalid input data',
+        'expected_result': 'System displays appropriate error message',
+        'data_inputs': {'input_data': 'invalid_data'}
+    },
+    {
+        'action': 'Submit empty form',
+        'expected_result': 'System displays validation error',
+        'data_inputs': {'input_data': ''}
+    },
+    {
+        'action': 'Access without proper permissions',
+        'expected_result': 'System denies access with appropriate message',
+        'data_inputs': {'permissions': 'none'}
+    },
+)
+
+_PATIENT_NEGATIVE_SCENARIO = {
+    'action': 'Enter invalid patient ID',
+    'expected_result': 'System displays patient not found error',
+    'data_inputs': {'patient_id': 'INVALID_ID'}
+}
+
+_DATA_NEGATIVE_SCENARIO = {
+    'action': 'Submit corrupted data',
+    'expected_result': 'System handles data corruption gracefully',
+    'data_inputs': {'data_format': 'corrupted'}
+}
+
+_NUMERIC_PATTERNS = [
+    re.compile(r'(\d+)\s*(?:seconds?|minutes?|hours?|days?)'),
+    re.compile(r'(\d+)\s*(?:bytes?|kb|mb|gb)'),
+    re.compile(r'(\d+)\s*(?:characters?|fields?|records?)'),
+    # Load limits: "1000 concurrent users", "50 requests", "10 connections"
+    re.compile(r'(\d+)\s*(?:concurrent\s+|simultaneous\s+)?'
+               r'(?:users?|connections?|requests?|sessions?)'),
+]
+
+
+# Scenario derivation is pure in the requirement text, and bulk generation
+# repeatedly sees similar requirement phrasing, so results are memoized.
+# The cached dicts are never handed out directly: the _generate_*_scenarios
+# wrappers copy them so a downstream mutation (e.g. via TestStep.data_inputs)
+# cannot corrupt the cache.
+def _copy_scenario(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached scenario, including its nested data_inputs dict."""
+    copied = dict(scenario)
+    if copied.get('data_inputs') is not None:
+        copied['data_inputs'] = dict(copied['data_inputs'])
+    return copied
+
+
+@functools.lru_cache(maxsize=1024)
+def _negative_scenarios_for(requirement_lower: str) -> tuple:
+    scenarios = list(_BASE_NEGATIVE_SCENARIOS)
+    
+    # Add healthcare-specific negative scenarios
+    if 'patient' in requirement_lower:
+        scenarios.append(_PATIENT_NEGATIVE_SCENARIO)
+        
+    if 'data' in requirement_lower:
+        scenarios.append(_DATA_NEGATIVE_SCENARIO)
+        
+    return tuple(scenarios[:6])  # Limit to 6 total scenarios
+
+
+@functools.lru_cache(maxsize=1024)
+def _boundary_scenarios_for(requirement_lower: str) -> tuple:
+    scenarios = []
+    
+    # Look for numeric values in requirement (patterns expect lowercase)
+    for pattern in _NUMERIC_PATTERNS:
+        for match in pattern.findall(requirement_lower):
+            value = int(match)
+            scenarios.extend([
+                {
+                    'action': f'Test with value {value - 1} (just below limit)',
+                    'expected_result': 'System accepts the value',
+                    'data_inputs': {'test_value': value - 1}
+                },
+                {
+                    'action': f'Test with value {value} (at limit)',
+                    'expected_result': 'System accepts the value',
+                    'data_inputs': {'test_value': value}
+                },
+                {
+                    'action': f'Test with value {value + 1} (just above limit)',
+                    'expected_result': 'System rejects the value with appropriate error',
+                    'data_inputs': {'test_value': value + 1}
+                }
+            ])
+            
+    return tuple(scenarios[:6])  # Limit to 6 scenarios
+
 
 class TestCaseType(Enum):
     """Types of test cases."""
@@ -44,7 +248,34 @@ class TestCasePriority(Enum):
     LOW = "low"
 
 
-@dataclass
+# Value->member lookup tables: a dict hit is much cheaper than going through
+# Enum.__call__ for every parsed test case
+_TEST_CASE_TYPE_MAP = {e.value: e for e in TestCaseType}
+_PRIORITY_MAP = {e.value: e for e in TestCasePriority}
+
+
+def _add_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ holding its fields.
+
+    Equivalent to @dataclass(slots=True) but works on Python 3.8, where
+    field defaults stored as class attributes would otherwise conflict
+    with a hand-written __slots__ tuple.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses_fields(cls))
+    cls_dict['__slots__'] = field_names + cls_dict.pop('__extra_slots__', ())
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+@_add_slots
+@dataclass(frozen=True)
 class TestStep:
     """Individual test step."""
     step_number: int
@@ -55,7 +286,8 @@ class TestStep:
     postconditions: Optional[str] = None
 
 
-@dataclass
+@_add_slots
+@dataclass(frozen=True)
 class TestCase:
     """Complete test case structure."""
     id: str
@@ -74,16 +306,32 @@ class TestCase:
     estimated_duration: Optional[int] = None  # in minutes
     created_date: str = ""
     last_modified: str = ""
+
+    # Non-field slot for the memoized JSON form; kept out of asdict()
+    __extra_slots__ = ('_json_cache',)
     
     def __post_init__(self):
+        # The class is frozen, so defaulting has to bypass __setattr__
         if self.pass_criteria is None:
-            self.pass_criteria = []
+            object.__setattr__(self, 'pass_criteria', [])
         if self.fail_criteria is None:
-            self.fail_criteria = []
+            object.__setattr__(self, 'fail_criteria', [])
         if not self.created_date:
-            self.created_date = datetime.now().isoformat()
+            object.__setattr__(self, 'created_date', datetime.now().isoformat())
         if not self.last_modified:
-            self.last_modified = datetime.now().isoformat()
+            object.__setattr__(self, 'last_modified', datetime.now().isoformat())
+
+    def _as_json(self) -> str:
+        """Return the indented JSON form, recomputed only when modified."""
+        cached = getattr(self, '_json_cache', None)
+        if cached is not None and cached[0] == self.last_modified:
+            return cached[1]
+        json_str = json.dumps(
+            asdict(self), indent=2,
+            default=lambda o: o.value if isinstance(o, Enum) else str(o)
+        )
+        object.__setattr__(self, '_json_cache', (self.last_modified, json_str))
+        return json_str
 
 
 class TestCaseGenerator:
@@ -99,10 +347,32 @@ class TestCaseGenerator:
         """
         self.api_key = api_key
         self.project_id = project_id
-        
-        if genai and api_key:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-pro')
+        self._cache = LLMCache(ttl_seconds=86400)
+        # Rule-based generation is deterministic, so cached results keyed by
+        # requirement hash survive across runs
+        self._rule_cache = LLMCache(ttl_seconds=7 * 86400,
+                                    cache_file='data/rule_cache.json')
+        # Fallback test-case IDs: a monotonic counter seeded from the clock is
+        # unique per run without a urandom syscall per case (unlike uuid4)
+        self._id_counter = itertools.count(int(time.time() * 1000) << 20)
+        # Rendered compliance-mappings JSON, keyed by the source list object,
+        # so per-requirement prompts reuse one serialization per batch
+        self._compliance_info_cache: Optional[Any] = None
+
+        # Import the Google SDK lazily: it is only needed when an API key is
+        # supplied, and pulling in grpc/protobuf at module import slows down
+        # every rule-based-only startup
+        self._genai = None
+        if api_key:
+            try:
+                import google.generativeai as genai
+                self._genai = genai
+            except ImportError:
+                self._genai = None
+
+        if self._genai:
+            self._genai.configure(api_key=api_key)
+            self.model = self._genai.GenerativeModel('gemini-pro')
         else:
             logger.warning("Google Generative AI not available. Using rule-based generation.")
             self.model = None
@@ -119,27 +389,123 @@ class TestCaseGenerator:
         Returns:
             List of generated test cases
         """
-        test_cases = []
-        
+        if self.model:
+            return self._generate_with_ai_batch(requirements, compliance_mappings)
+
+        test_cases = list(self.iter_test_cases(requirements, compliance_mappings))
+        # One persistence write per run instead of one per requirement
+        self._rule_cache.flush()
+        return test_cases
+
+    def iter_test_cases(self, requirements: List[Dict[str, Any]],
+                      compliance_mappings: List[Dict[str, Any]] = None):
+        """
+        Lazily yield test cases requirement by requirement.
+
+        Streaming consumers (file writers, HTTP responses) keep only one
+        requirement's worth of cases alive instead of the whole result set.
+        The AI path issues one call per requirement here; use
+        generate_test_cases for the single batched call.
+
+        Args:
+            requirements: List of parsed requirements
+            compliance_mappings: Optional compliance mappings
+
+        Yields:
+            TestCase objects as they are generated
+        """
+        # One timestamp per batch: every case in this run shares the same
+        # logical creation moment, so avoid a clock read per field
+        now = datetime.now().isoformat()
+
         for req in requirements:
             if self.model:
-                req_test_cases = self._generate_with_ai(req, compliance_mappings)
+                yield from self._generate_with_ai(req, compliance_mappings)
             else:
-                req_test_cases = self._generate_with_rules(req, compliance_mappings)
-                
-            test_cases.extend(req_test_cases)
-            
+                yield from self._generate_with_rules(req, compliance_mappings, now=now)
+
+    def _generate_with_ai_batch(self, requirements: List[Dict[str, Any]],
+                              compliance_mappings: List[Dict[str, Any]] = None) -> List[TestCase]:
+        """Generate test cases for all requirements in a single AI call."""
+        prompt = self._create_batch_generation_prompt(requirements, compliance_mappings)
+        cache_key = self._cache_key(prompt)
+
+        results_data = self._cache.get(cache_key)
+        if results_data is None:
+            try:
+                response = self.model.generate_content(prompt)
+                results_data = _json_loads(response.text)
+                self._cache.set(cache_key, results_data)
+            except Exception as e:
+                logger.error(f"Batched AI generation failed: {str(e)}")
+                test_cases = []
+                for req in requirements:
+                    test_cases.extend(self._generate_with_ai(req, compliance_mappings))
+                return test_cases
+
+        requirements_by_id = {req.get('id'): req for req in requirements}
+
+        test_cases = []
+        for result in results_data.get('results', []):
+            requirement = requirements_by_id.get(result.get('requirement_id'), {})
+            for tc_data in result.get('test_cases', []):
+                test_cases.append(self._create_test_case_from_data(tc_data, requirement))
+
         return test_cases
-        
+
+    def _create_batch_generation_prompt(self, requirements: List[Dict[str, Any]],
+                                      compliance_mappings: List[Dict[str, Any]] = None) -> str:
+        """Create a single prompt covering a batch of requirements."""
+        compliance_info = self._render_compliance_info(compliance_mappings)
+
+        requirements_json = _json_dumps_indented(
+            [{'requirement_id': req.get('id', 'N/A'), 'requirement': req} for req in requirements]
+        )
+
+        return f"""
+        Generate detailed test cases for each of the following healthcare software requirements.
+        Ensure test cases include references to regulatory standards (FDA, ISO, IEC) for compliance.
+
+        Requirements (JSON array):
+        {requirements_json}
+        {compliance_info}
+
+        For each requirement, generate test cases including:
+        1. Case ID, title, description
+        2. Step-by-step actions with expected results
+        3. Priority based on requirement priority
+        4. References to regulatory standards (FDA, ISO, IEC)
+        5. Test data requirements
+        6. Prerequisites and pass/fail criteria
+        7. Estimated duration
+
+        Generate both positive and negative test scenarios.
+        Include boundary value testing where applicable.
+
+        Return the result as a JSON object of the form:
+        {{"results": [{{"requirement_id": "...", "test_cases": [...]}}]}}
+        Each test case should follow the same structure as a single-requirement
+        generation request (id, title, description, test_case_type, priority,
+        requirement_id, compliance_refs, test_steps, prerequisites, test_data,
+        expected_outcome, pass_criteria, fail_criteria, estimated_duration).
+        """
+
     def _generate_with_ai(self, requirement: Dict[str, Any], 
                          compliance_mappings: List[Dict[str, Any]] = None) -> List[TestCase]:
         """Generate test cases using AI."""
         prompt = self._create_generation_prompt(requirement, compliance_mappings)
-        
+        cache_key = self._cache_key(prompt)
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return [self._create_test_case_from_data(tc_data, requirement)
+                    for tc_data in cached.get('test_cases', [])]
+
         try:
             response = self.model.generate_content(prompt)
-            test_cases_data = json.loads(response.text)
-            
+            test_cases_data = _json_loads(response.text)
+            self._cache.set(cache_key, test_cases_data)
+
             test_cases = []
             for tc_data in test_cases_data.get('test_cases', []):
                 test_case = self._create_test_case_from_data(tc_data, requirement)
@@ -151,17 +517,99 @@ class TestCaseGenerator:
             logger.error(f"AI generation failed: {str(e)}")
             return self._generate_with_rules(requirement, compliance_mappings)
             
-    def _create_generation_prompt(self, requirement: Dict[str, Any], 
+    async def generate_test_cases_async(self, requirements: List[Dict[str, Any]],
+                                      compliance_mappings: List[Dict[str, Any]] = None) -> List[TestCase]:
+        """
+        Generate test cases with per-requirement AI calls running concurrently.
+
+        Useful when batching is not viable (e.g. per-requirement prompts must
+        differ); N network-bound calls overlap instead of running serially.
+
+        Args:
+            requirements: List of parsed requirements
+            compliance_mappings: Optional compliance mappings
+
+        Returns:
+            List of generated test cases
+        """
+        if not self.model:
+            return self.generate_test_cases(requirements, compliance_mappings)
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_AI_CALLS)
+        results = await asyncio.gather(
+            *[self._generate_with_ai_async(req, compliance_mappings, semaphore)
+              for req in requirements]
+        )
+        return [tc for group in results for tc in group]
+
+    async def _generate_with_ai_async(self, requirement: Dict[str, Any],
+                                    compliance_mappings: List[Dict[str, Any]],
+                                    semaphore: asyncio.Semaphore) -> List[TestCase]:
+        """Generate test cases for one requirement using the async AI client."""
+        prompt = self._create_generation_prompt(requirement, compliance_mappings)
+        cache_key = self._cache_key(prompt)
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return [self._create_test_case_from_data(tc_data, requirement)
+                    for tc_data in cached.get('test_cases', [])]
+
+        try:
+            async with semaphore:
+                response = await self.model.generate_content_async(prompt)
+            test_cases_data = _json_loads(response.text)
+            self._cache.set(cache_key, test_cases_data)
+
+            return [self._create_test_case_from_data(tc_data, requirement)
+                    for tc_data in test_cases_data.get('test_cases', [])]
+
+        except Exception as e:
+            logger.error(f"Async AI generation failed: {str(e)}")
+            return self._generate_with_rules(requirement, compliance_mappings)
+
+    def generate_test_cases_parallel(self, requirements: List[Dict[str, Any]],
+                                   compliance_mappings: List[Dict[str, Any]] = None) -> List[TestCase]:
+        """Synchronous variant that overlaps AI calls via a thread pool."""
+        if not self.model:
+            return self.generate_test_cases(requirements, compliance_mappings)
+
+        with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_AI_CALLS) as executor:
+            groups = executor.map(
+                lambda req: self._generate_with_ai(req, compliance_mappings),
+                requirements
+            )
+            return [tc for group in groups for tc in group]
+
+    def _render_compliance_info(self, compliance_mappings: List[Dict[str, Any]]) -> str:
+        """Serialize compliance mappings once and reuse across a batch."""
+        if not compliance_mappings:
+            return ""
+
+        cached = self._compliance_info_cache
+        if cached is not None and cached[0] is compliance_mappings:
+            return cached[1]
+
+        info = f"\\nCompliance References: {_json_dumps_indented(compliance_mappings)}"
+        self._compliance_info_cache = (compliance_mappings, info)
+        return info
+
+    @staticmethod
+    def _cache_key(prompt: str) -> str:
+        """Compute a stable cache key for an LLM prompt."""
+        payload = json.dumps({'prompt': prompt, 'model': 'gemini-pro'}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _create_generation_prompt(self, requirement: Dict[str, Any],
                                 compliance_mappings: List[Dict[str, Any]] = None) -> str:
         """Create prompt for AI-based test case generation."""
-        compliance_info = ""
-        if compliance_mappings:
-            compliance_info = f"\\nCompliance References: {json.dumps(compliance_mappings, indent=2)}"
-            
+        return _SYSTEM_PROMPT + self._build_user_prompt(
+            requirement, self._render_compliance_info(compliance_mappings)
+        )
+
+    @staticmethod
+    def _build_user_prompt(requirement: Dict[str, Any], compliance_info: str) -> str:
+        """Render only the per-requirement portion of the prompt."""
         return f"""
-        Generate detailed test cases for the following healthcare software requirement.
-        Ensure test cases include references to regulatory standards (FDA, ISO, IEC) for compliance.
-        
         Requirement:
         - ID: {requirement.get('id', 'N/A')}
         - Description: {requirement.get('description', '')}
@@ -169,44 +617,6 @@ class TestCaseGenerator:
         - Priority: {requirement.get('priority', 'N/A')}
         - Compliance References: {requirement.get('compliance_refs', [])}
         {compliance_info}
-        
-        Generate test cases including:
-        1. Case ID, title, description
-        2. Step-by-step actions with expected results
-        3. Priority based on requirement priority
-        4. References to regulatory standards (FDA, ISO, IEC)
-        5. Test data requirements
-        6. Prerequisites and pass/fail criteria
-        7. Estimated duration
-        
-        Focus on healthcare-specific testing including:
-        - Patient safety validation
-        - Data privacy and security testing
-        - Regulatory compliance verification
-        - Medical device functionality testing
-        - Clinical workflow validation
-        - Audit trail verification
-        - Risk management validation
-        
-        Generate both positive and negative test scenarios.
-        Include boundary value testing where applicable.
-        
-        Return the result as a JSON object with a 'test_cases' array.
-        Each test case should have:
-        - id: Unique test case ID (TC-XXX format)
-        - title: Descriptive title
-        - description: Detailed description
-        - test_case_type: positive/negative/boundary/integration/performance/security/usability/compliance
-        - priority: critical/high/medium/low
-        - requirement_id: Reference to source requirement
-        - compliance_refs: List of compliance references
-        - test_steps: Array of test steps with step_number, action, expected_result
-        - prerequisites: List of prerequisites
-        - test_data: Object with test data requirements
-        - expected_outcome: Overall expected outcome
-        - pass_criteria: List of pass criteria
-        - fail_criteria: List of fail criteria
-        - estimated_duration: Duration in minutes
         """
         
     def _create_test_case_from_data(self, tc_data: Dict[str, Any], 
@@ -227,11 +637,13 @@ class TestCaseGenerator:
             
         # Create test case
         test_case = TestCase(
-            id=tc_data.get('id', f"TC-{uuid.uuid4().hex[:8].upper()}"),
+            id=tc_data.get('id') or f"TC-{next(self._id_counter):08X}",
             title=tc_data.get('title', ''),
             description=tc_data.get('description', ''),
-            test_case_type=TestCaseType(tc_data.get('test_case_type', 'positive')),
-            priority=TestCasePriority(tc_data.get('priority', 'medium')),
+            test_case_type=_TEST_CASE_TYPE_MAP.get(tc_data.get('test_case_type', 'positive'),
+                                                   TestCaseType.POSITIVE),
+            priority=_PRIORITY_MAP.get(tc_data.get('priority', 'medium'),
+                                       TestCasePriority.MEDIUM),
             requirement_id=requirement.get('id', ''),
             compliance_refs=tc_data.get('compliance_refs', []),
             test_steps=test_steps,
@@ -246,29 +658,77 @@ class TestCaseGenerator:
         return test_case
         
     def _generate_with_rules(self, requirement: Dict[str, Any], 
-                           compliance_mappings: List[Dict[str, Any]] = None) -> List[TestCase]:
+                           compliance_mappings: List[Dict[str, Any]] = None,
+                           now: Optional[str] = None) -> List[TestCase]:
         """Generate test cases using rule-based approach."""
+        cache_key = hashlib.sha256(
+            json.dumps(requirement, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        cached = self._rule_cache.get(cache_key)
+        if cached is not None:
+            return [self._test_case_from_record(record) for record in cached]
+
         test_cases = []
         
+        if now is None:
+            now = datetime.now().isoformat()
+        
+        # Shared intermediates computed once and fanned out to all three
+        # generators instead of being re-derived per test-case type
+        priority = self._map_requirement_priority_to_test_priority(
+            requirement.get('priority', 'medium'))
+        prerequisites = self._generate_prerequisites(requirement)
+        
         # Generate positive test case
-        positive_tc = self._generate_positive_test_case(requirement, compliance_mappings)
+        positive_tc = self._generate_positive_test_case(
+            requirement, compliance_mappings, now,
+            priority=priority, prerequisites=prerequisites)
         if positive_tc:
             test_cases.append(positive_tc)
             
         # Generate negative test case
-        negative_tc = self._generate_negative_test_case(requirement, compliance_mappings)
+        negative_tc = self._generate_negative_test_case(
+            requirement, compliance_mappings, now,
+            priority=priority, prerequisites=prerequisites)
         if negative_tc:
             test_cases.append(negative_tc)
             
         # Generate boundary test case if applicable
-        boundary_tc = self._generate_boundary_test_case(requirement, compliance_mappings)
+        boundary_tc = self._generate_boundary_test_case(
+            requirement, compliance_mappings, now,
+            priority=priority, prerequisites=prerequisites)
         if boundary_tc:
             test_cases.append(boundary_tc)
             
+        self._rule_cache.set(cache_key, [self._test_case_to_record(tc) for tc in test_cases])
+
         return test_cases
+
+    @staticmethod
+    def _test_case_to_record(test_case: TestCase) -> Dict[str, Any]:
+        """Serialize a TestCase to a JSON-safe dict."""
+        record = asdict(test_case)
+        record['test_case_type'] = test_case.test_case_type.value
+        record['priority'] = test_case.priority.value
+        return record
+
+    @staticmethod
+    def _test_case_from_record(record: Dict[str, Any]) -> TestCase:
+        """Rebuild a TestCase from its JSON-safe dict form."""
+        record = dict(record)
+        record['test_case_type'] = _TEST_CASE_TYPE_MAP.get(record.get('test_case_type'),
+                                                           TestCaseType.POSITIVE)
+        record['priority'] = _PRIORITY_MAP.get(record.get('priority'),
+                                               TestCasePriority.MEDIUM)
+        record['test_steps'] = [TestStep(**step) for step in record.get('test_steps', [])]
+        return TestCase(**record)
         
     def _generate_positive_test_case(self, requirement: Dict[str, Any], 
-                                   compliance_mappings: List[Dict[str, Any]] = None) -> TestCase:
+                                   compliance_mappings: List[Dict[str, Any]] = None,
+                                   now: Optional[str] = None,
+                                   priority: Optional[TestCasePriority] = None,
+                                   prerequisites: Optional[List[str]] = None) -> TestCase:
         """Generate positive test case."""
         req_id = requirement.get('id', 'REQ-001')
         req_desc = requirement.get('description', '')
@@ -277,37 +737,44 @@ class TestCaseGenerator:
         actions = self._extract_actions_from_requirement(req_desc)
         
         # Create test steps
-        test_steps = []
-        for i, action in enumerate(actions, 1):
-            step = TestStep(
+        test_steps = [
+            TestStep(
                 step_number=i,
                 action=action,
                 expected_result=f"System {action.lower()} successfully",
                 data_inputs=self._generate_test_data_for_action(action)
             )
-            test_steps.append(step)
-            
+            for i, action in enumerate(actions, 1)
+        ]
+
         # Create test case
         test_case = TestCase(
             id=f"TC-{req_id}-POS-001",
             title=f"Positive Test: {req_desc[:50]}...",
             description=f"Verify that the system correctly implements: {req_desc}",
             test_case_type=TestCaseType.POSITIVE,
-            priority=self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
+            priority=priority if priority is not None else
+                self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
             requirement_id=req_id,
             compliance_refs=requirement.get('compliance_refs', []),
             test_steps=test_steps,
-            prerequisites=self._generate_prerequisites(requirement),
+            prerequisites=list(prerequisites) if prerequisites is not None else
+                self._generate_prerequisites(requirement),
             expected_outcome="All test steps pass successfully",
             pass_criteria=["System responds as expected", "No errors or exceptions occur"],
             fail_criteria=["System fails to respond", "Errors or exceptions occur"],
-            estimated_duration=self._estimate_duration(len(test_steps))
+            estimated_duration=self._estimate_duration(len(test_steps)),
+            created_date=now or '',
+            last_modified=now or ''
         )
         
         return test_case
         
     def _generate_negative_test_case(self, requirement: Dict[str, Any], 
-                                   compliance_mappings: List[Dict[str, Any]] = None) -> TestCase:
+                                   compliance_mappings: List[Dict[str, Any]] = None,
+                                   now: Optional[str] = None,
+                                   priority: Optional[TestCasePriority] = None,
+                                   prerequisites: Optional[List[str]] = None) -> TestCase:
         """Generate negative test case."""
         req_id = requirement.get('id', 'REQ-001')
         req_desc = requirement.get('description', '')
@@ -316,42 +783,49 @@ class TestCaseGenerator:
         negative_scenarios = self._generate_negative_scenarios(req_desc)
         
         # Create test steps
-        test_steps = []
-        for i, scenario in enumerate(negative_scenarios, 1):
-            step = TestStep(
+        test_steps = [
+            TestStep(
                 step_number=i,
                 action=scenario['action'],
                 expected_result=scenario['expected_result'],
                 data_inputs=scenario.get('data_inputs')
             )
-            test_steps.append(step)
-            
+            for i, scenario in enumerate(negative_scenarios, 1)
+        ]
+
         # Create test case
         test_case = TestCase(
             id=f"TC-{req_id}-NEG-001",
             title=f"Negative Test: {req_desc[:50]}...",
             description=f"Verify that the system handles invalid inputs gracefully: {req_desc}",
             test_case_type=TestCaseType.NEGATIVE,
-            priority=self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
+            priority=priority if priority is not None else
+                self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
             requirement_id=req_id,
             compliance_refs=requirement.get('compliance_refs', []),
             test_steps=test_steps,
-            prerequisites=self._generate_prerequisites(requirement),
+            prerequisites=list(prerequisites) if prerequisites is not None else
+                self._generate_prerequisites(requirement),
             expected_outcome="System handles invalid inputs gracefully with appropriate error messages",
             pass_criteria=["System displays appropriate error messages", "System remains stable"],
             fail_criteria=["System crashes or behaves unexpectedly", "No error handling"],
-            estimated_duration=self._estimate_duration(len(test_steps))
+            estimated_duration=self._estimate_duration(len(test_steps)),
+            created_date=now or '',
+            last_modified=now or ''
         )
         
         return test_case
         
     def _generate_boundary_test_case(self, requirement: Dict[str, Any], 
-                                   compliance_mappings: List[Dict[str, Any]] = None) -> Optional[TestCase]:
+                                   compliance_mappings: List[Dict[str, Any]] = None,
+                                   now: Optional[str] = None,
+                                   priority: Optional[TestCasePriority] = None,
+                                   prerequisites: Optional[List[str]] = None) -> Optional[TestCase]:
         """Generate boundary test case if applicable."""
         req_desc = requirement.get('description', '').lower()
         
         # Check if requirement involves numeric values or limits
-        if not any(word in req_desc for word in ['limit', 'maximum', 'minimum', 'range', 'threshold', 'value']):
+        if not _BOUNDARY_TRIGGER_RE.search(req_desc):
             return None
             
         req_id = requirement.get('id', 'REQ-001')
@@ -363,48 +837,43 @@ class TestCaseGenerator:
             return None
             
         # Create test steps
-        test_steps = []
-        for i, scenario in enumerate(boundary_scenarios, 1):
-            step = TestStep(
+        test_steps = [
+            TestStep(
                 step_number=i,
                 action=scenario['action'],
                 expected_result=scenario['expected_result'],
                 data_inputs=scenario.get('data_inputs')
             )
-            test_steps.append(step)
-            
+            for i, scenario in enumerate(boundary_scenarios, 1)
+        ]
+
         # Create test case
         test_case = TestCase(
             id=f"TC-{req_id}-BND-001",
             title=f"Boundary Test: {req_desc[:50]}...",
             description=f"Verify system behavior at boundary values: {req_desc}",
             test_case_type=TestCaseType.BOUNDARY,
-            priority=self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
+            priority=priority if priority is not None else
+                self._map_requirement_priority_to_test_priority(requirement.get('priority', 'medium')),
             requirement_id=req_id,
             compliance_refs=requirement.get('compliance_refs', []),
             test_steps=test_steps,
-            prerequisites=self._generate_prerequisites(requirement),
+            prerequisites=list(prerequisites) if prerequisites is not None else
+                self._generate_prerequisites(requirement),
             expected_outcome="System behaves correctly at all boundary values",
             pass_criteria=["System handles boundary values correctly", "No unexpected behavior"],
             fail_criteria=["System fails at boundary values", "Unexpected behavior occurs"],
-            estimated_duration=self._estimate_duration(len(test_steps))
+            estimated_duration=self._estimate_duration(len(test_steps)),
+            created_date=now or '',
+            last_modified=now or ''
         )
         
         return test_case
         
     def _extract_actions_from_requirement(self, requirement_text: str) -> List[str]:
         """Extract key actions from requirement text."""
-        actions = []
-        
-        # Look for action verbs
-        action_patterns = [
-            r'(?:shall|must|will|should)\\s+([^\\n]+)',
-            r'(?:enable|allow|provide|support|display|show|generate|create|validate|verify)\\s+([^\\n]+)',
-        ]
-        
-        for pattern in action_patterns:
-            matches = re.findall(pattern, requirement_text, re.IGNORECASE)
-            actions.extend(matches)
+        # Look for action verbs in a single pass over the case-folded text
+        actions = _COMBINED_ACTION_RE.findall(requirement_text.lower())
             
         # If no specific actions found, create generic ones
         if not actions:
@@ -418,31 +887,13 @@ class TestCaseGenerator:
         
     def _generate_test_data_for_action(self, action: str) -> Dict[str, Any]:
         """Generate test data requirements for an action."""
-        action_lower = action.lower()
-        
-        if 'login' in action_lower or 'authenticate' in action_lower:
-            return {
-                'username': 'test_user',
-                'password': 'test_password',
-                'role': 'healthcare_provider'
-            }
-        elif 'patient' in action_lower:
-            return {
-                'patient_id': 'PAT001',
-                'patient_name': 'Test Patient',
-                'date_of_birth': '1990-01-01'
-            }
-        elif 'data' in action_lower or 'record' in action_lower:
-            return {
-                'data_type': 'medical_record',
-                'data_format': 'HL7_FHIR',
-                'validation_rules': 'enabled'
-            }
-        else:
-            return {
-                'input_data': 'test_input',
-                'expected_format': 'valid'
-            }
+        tokens = frozenset(_ACTION_WORD_RE.findall(action.lower()))
+
+        for keywords, template in _ACTION_DATA_TEMPLATES:
+            if tokens & keywords:
+                return dict(template)
+
+        return dict(_DEFAULT_TEST_DATA)
             
     def _generate_prerequisites(self, requirement: Dict[str, Any]) -> List[str]:
         """Generate prerequisites for test case."""
@@ -465,90 +916,18 @@ class TestCaseGenerator:
         return prerequisites
         
     def _generate_negative_scenarios(self, requirement_text: str) -> List[Dict[str, Any]]:
-        """Generate negative test scenarios."""
-        scenarios = []
-        
-        # Common negative scenarios
-        base_scenarios = [
-            {
-                'action': 'Enter invalid input data',
-                'expected_result': 'System displays appropriate error message',
-                'data_inputs': {'input_data': 'invalid_data'}
-            },
-            {
-                'action': 'Submit empty form',
-                'expected_result': 'System displays validation error',
-                'data_inputs': {'input_data': ''}
-            },
-            {
-                'action': 'Access without proper permissions',
-                'expected_result': 'System denies access with appropriate message',
-                'data_inputs': {'permissions': 'none'}
-            }
-        ]
-        
-        # Add healthcare-specific negative scenarios
-        if 'patient' in requirement_text.lower():
-            scenarios.append({
-                'action': 'Enter invalid patient ID',
-                'expected_result': 'System displays patient not found error',
-                'data_inputs': {'patient_id': 'INVALID_ID'}
-            })
-            
-        if 'data' in requirement_text.lower():
-            scenarios.append({
-                'action': 'Submit corrupted data',
-                'expected_result': 'System handles data corruption gracefully',
-                'data_inputs': {'data_format': 'corrupted'}
-            })
-            
-        return base_scenarios + scenarios[:3]  # Limit to 6 total scenarios
-        
+        """Generate negative test scenarios, cached per requirement text."""
+        return [_copy_scenario(scenario)
+                for scenario in _negative_scenarios_for(requirement_text.lower())]
+
     def _generate_boundary_scenarios(self, requirement_text: str) -> List[Dict[str, Any]]:
-        """Generate boundary test scenarios."""
-        scenarios = []
-        
-        # Look for numeric values in requirement
-        numeric_patterns = [
-            r'(\\d+)\\s*(?:seconds?|minutes?|hours?|days?)',
-            r'(\\d+)\\s*(?:bytes?|kb|mb|gb)',
-            r'(\\d+)\\s*(?:characters?|fields?|records?)',
-        ]
-        
-        for pattern in numeric_patterns:
-            matches = re.findall(pattern, requirement_text, re.IGNORECASE)
-            for match in matches:
-                value = int(match)
-                scenarios.extend([
-                    {
-                        'action': f'Test with value {value - 1} (just below limit)',
-                        'expected_result': 'System accepts the value',
-                        'data_inputs': {'test_value': value - 1}
-                    },
-                    {
-                        'action': f'Test with value {value} (at limit)',
-                        'expected_result': 'System accepts the value',
-                        'data_inputs': {'test_value': value}
-                    },
-                    {
-                        'action': f'Test with value {value + 1} (just above limit)',
-                        'expected_result': 'System rejects the value with appropriate error',
-                        'data_inputs': {'test_value': value + 1}
-                    }
-                ])
-                
-        return scenarios[:6]  # Limit to 6 scenarios
+        """Generate boundary test scenarios, cached per requirement text."""
+        return [_copy_scenario(scenario)
+                for scenario in _boundary_scenarios_for(requirement_text.lower())]
         
     def _map_requirement_priority_to_test_priority(self, req_priority: str) -> TestCasePriority:
         """Map requirement priority to test case priority."""
-        priority_mapping = {
-            'critical': TestCasePriority.CRITICAL,
-            'high': TestCasePriority.HIGH,
-            'medium': TestCasePriority.MEDIUM,
-            'low': TestCasePriority.LOW
-        }
-        
-        return priority_mapping.get(req_priority.lower(), TestCasePriority.MEDIUM)
+        return _PRIORITY_MAP.get(req_priority.lower(), TestCasePriority.MEDIUM)
         
     def _estimate_duration(self, num_steps: int) -> int:
         """Estimate test case duration based on number of steps."""
@@ -577,57 +956,64 @@ class TestCaseGenerator:
         Refine the following test case based on the refinement instruction:
         
         Original Test Case:
-        {json.dumps(asdict(test_case), indent=2)}
+        {test_case._as_json()}
         
         Refinement Instruction:
         {refinement_prompt}
         
         Return the refined test case as a JSON object with the same structure.
         """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            refined_data = json.loads(response.text)
-            
-            # Update test case with refined data
-            for key, value in refined_data.items():
-                if hasattr(test_case, key):
-                    setattr(test_case, key, value)
-                    
-            # Update last modified timestamp
-            test_case.last_modified = datetime.now().isoformat()
-            
-            return test_case
-            
-        except Exception as e:
-            logger.error(f"AI refinement failed: {str(e)}")
-            return self._refine_with_rules(test_case, refinement_prompt)
-            
+        cache_key = self._cache_key(prompt)
+
+        refined_data = self._cache.get(cache_key)
+        if refined_data is None:
+            try:
+                response = self.model.generate_content(prompt)
+                refined_data = _json_loads(response.text)
+                self._cache.set(cache_key, refined_data)
+            except Exception as e:
+                logger.error(f"AI refinement failed: {str(e)}")
+                return self._refine_with_rules(test_case, refinement_prompt)
+
+        # Build an updated copy; TestCase is frozen, so refinements go
+        # through dataclasses.replace rather than attribute assignment
+        field_names = {f.name for f in dataclasses_fields(TestCase)}
+        updates = {key: value for key, value in refined_data.items()
+                   if key in field_names}
+        updates['last_modified'] = datetime.now().isoformat()
+
+        return replace(test_case, **updates)
+
+
     def _refine_with_rules(self, test_case: TestCase, refinement_prompt: str) -> TestCase:
         """Refine test case using rule-based approach."""
         prompt_lower = refinement_prompt.lower()
-        
+
         # Update priority
+        priority = test_case.priority
         if 'high priority' in prompt_lower or 'increase priority' in prompt_lower:
-            if test_case.priority == TestCasePriority.LOW:
-                test_case.priority = TestCasePriority.MEDIUM
-            elif test_case.priority == TestCasePriority.MEDIUM:
-                test_case.priority = TestCasePriority.HIGH
-                
+            if priority == TestCasePriority.LOW:
+                priority = TestCasePriority.MEDIUM
+            elif priority == TestCasePriority.MEDIUM:
+                priority = TestCasePriority.HIGH
+
         # Add negative test scenarios
+        test_steps = list(test_case.test_steps)
         if 'add negative' in prompt_lower or 'negative test' in prompt_lower:
             negative_steps = self._generate_negative_scenarios(test_case.description)
             for step_data in negative_steps:
-                step = TestStep(
-                    step_number=len(test_case.test_steps) + 1,
+                test_steps.append(TestStep(
+                    step_number=len(test_steps) + 1,
                     action=step_data['action'],
                     expected_result=step_data['expected_result'],
                     data_inputs=step_data.get('data_inputs')
-                )
-                test_case.test_steps.append(step)
-                
-        # Update last modified timestamp
-        test_case.last_modified = datetime.now().isoformat()
-        
-        return test_case
+                ))
+
+        # Return an updated copy with a fresh last-modified timestamp
+        return replace(
+            test_case,
+            priority=priority,
+            test_steps=test_steps,
+            last_modified=datetime.now().isoformat(),
+        )
 
@@ -5,20 +5,195 @@ Generates comprehensive traceability matrices linking requirements to test cases
 and compliance standards for healthcare software validation.
 """
 
+import csv
+import functools
 import logging
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+
+try:
+    import pyexcelerate
+except ImportError:  # optional fast Excel writer
+    pyexcelerate = None
+
+try:
+    import xlsxwriter  # noqa: F401 -- used as a pandas ExcelWriter engine
+    _HAS_XLSXWRITER = True
+except ImportError:
+    _HAS_XLSXWRITER = False
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    import json
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _standard_str(standard: Any) -> str:
+    """Normalize a compliance standard (enum or string) to its string form.
+
+    Cached so the recurring enum instances resolve to a dict hit instead of
+    re-running the getattr fallback.
+    """
+    value = getattr(standard, 'value', None)
+    return value if value is not None else str(standard)
+
+
+def _trace_level_from_tokens(req_tokens: frozenset, tc_tokens: frozenset, tc_lower: str) -> str:
+    """Classify the traceability level from pre-tokenized inputs."""
+    if _DIRECT_INDICATOR_RE.search(tc_lower):
+        return 'direct'
+        
+    # Check for keyword overlap; isdisjoint short-circuits without
+    # allocating an intersection set for unrelated pairs
+    if req_tokens.isdisjoint(tc_tokens):
+        return 'related'
+    overlap = len(req_tokens & tc_tokens)
+
+    if overlap >= 3:
+        return 'direct'
+    elif overlap >= 1:
+        return 'indirect'
+    else:
+        return 'related'
+
+
+def _coverage_status_from_lower(tc_lower: str) -> str:
+    """Classify coverage status from a pre-lowered test case title."""
+    # Check for comprehensive coverage
+    if _COVERAGE_INDICATOR_RE.search(tc_lower):
+        return 'covered'
+        
+    # Check for partial coverage
+    if _PARTIAL_INDICATOR_RE.search(tc_lower):
+        return 'partial'
+        
+    return 'covered'  # Default to covered if test case exists
+
+
+@functools.lru_cache(maxsize=4096)
+def _trace_level(requirement_desc: str, test_case_title: str) -> str:
+    """Classify the traceability level for a raw (requirement, test case) pair."""
+    tc_lower = test_case_title.lower()
+    return _trace_level_from_tokens(
+        frozenset(requirement_desc.lower().split()),
+        frozenset(tc_lower.split()),
+        tc_lower
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _coverage_status(requirement_desc: str, test_case_title: str) -> str:
+    """Classify coverage status for a raw (requirement, test case) pair."""
+    return _coverage_status_from_lower(test_case_title.lower())
+
+# Above this many traceability items the pyexcelerate bulk writer (when
+# installed) is preferred over openpyxl for Excel export
+_FAST_EXCEL_THRESHOLD = 5000
+
+# Below this many items the view builders run sequentially; thread startup
+# costs more than the loops themselves on small matrices
+_PARALLEL_VIEWS_THRESHOLD = 10000
+
+# Indicator alternations compiled once; a single C-level regex scan replaces
+# one Python substring search per indicator. Deliberately unanchored to keep
+# the original substring semantics (e.g. 'testing' counts as 'test')
+_DIRECT_INDICATOR_RE = re.compile(r'verify|test|validate|check|ensure')
+_COVERAGE_INDICATOR_RE = re.compile(r'positive|negative|boundary|integration|performance')
+_PARTIAL_INDICATOR_RE = re.compile(r'basic|simple|minimal|initial')
+
+# Evidence requirements per compliance standard, built once at import time.
+# Values are tuples shared across every TraceabilityItem that references
+# the same standard, so per-item lists are never re-allocated.
+_EVIDENCE_MAP: Dict[str, Tuple[str, ...]] = {
+    'FDA_21_CFR_820': (
+        'Design and development documentation',
+        'Risk management file',
+        'Verification and validation records'
+    ),
+    'FDA_21_CFR_11': (
+        'System validation documentation',
+        'Electronic signature procedures',
+        'Audit trail records'
+    ),
+    'ISO_13485': (
+        'Quality management system documentation',
+        'Risk management documentation',
+        'Design and development records'
+    ),
+    'IEC_62304': (
+        'Software development plan',
+        'Software requirements specification',
+        'Software verification and validation records'
+    ),
+    'GDPR': (
+        'Data protection impact assessment',
+        'Privacy by design documentation',
+        'Consent management records'
+    ),
+    'HIPAA': (
+        'Risk assessment documentation',
+        'Security policies and procedures',
+        'Access control documentation'
+    ),
+    'IEC_60601': (
+        'Risk management file',
+        'Essential performance documentation',
+        'Safety testing records'
+    ),
+    'IEC_62366': (
+        'Usability engineering plan',
+        'User interface specification',
+        'Usability testing records'
+    )
+}
+
+_DEFAULT_EVIDENCE: Tuple[str, ...] = ('General compliance documentation',)
+
+# openpyxl style objects are immutable, so one shared instance per style is
+# safe; creating them once at import time keeps header styling off the
+# per-sheet hot path entirely.
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
+_TITLE_FONT = Font(bold=True, size=14)
+
+# Coverage statuses ordered by strength; tracking the max rank replaces the
+# two-branch status update in the requirement view
+_STATUS_RANK = {'not_covered': 0, 'partial': 1, 'covered': 2}
+_RANK_STATUS = ('not_covered', 'partial', 'covered')
+
+# Statuses that count a requirement as covered in the summary
+_COVERED_STATUSES = frozenset({'covered', 'partial'})
+
+
+@dataclass(frozen=True)
 class TraceabilityItem:
     """Individual traceability item."""
+    # Manual __slots__ keeps 3.8 compatibility (dataclass slots=True is 3.10+);
+    # matrices can hold tens of thousands of items, so dropping the per-instance
+    # __dict__ roughly halves their memory footprint.
+    __slots__ = ('requirement_id', 'requirement_description', 'test_case_id',
+                 'test_case_title', 'compliance_standard', 'traceability_level',
+                 'coverage_status', 'evidence_required')
     requirement_id: str
     requirement_description: str
     test_case_id: str
@@ -26,7 +201,7 @@ class TraceabilityItem:
     compliance_standard: str
     traceability_level: str  # direct, indirect, related
     coverage_status: str  # covered, partial, not_covered
-    evidence_required: List[str]
+    evidence_required: Tuple[str, ...]
 
 
 class TraceabilityMatrixGenerator:
@@ -53,65 +228,85 @@ class TraceabilityMatrixGenerator:
         Returns:
             Traceability matrix dictionary
         """
-        # Create traceability items
-        traceability_items = self._create_traceability_items(
+        # Create traceability items (and their dict form, built in the same
+        # pass so serialization does not re-copy every item)
+        traceability_items, item_dicts, covered_items = self._create_traceability_items(
             requirements, test_cases, compliance_mappings
         )
         
-        # Generate different views of the matrix
-        matrix_views = {
-            'requirement_to_test_case': self._create_requirement_to_test_case_view(traceability_items),
-            'test_case_to_requirement': self._create_test_case_to_requirement_view(traceability_items),
-            'compliance_coverage': self._create_compliance_coverage_view(traceability_items),
-            'coverage_summary': self._create_coverage_summary(traceability_items, requirements, test_cases)
+        # Generate different views of the matrix; the test-case and compliance
+        # views only ever see items with a test case, so the uncovered
+        # placeholders are filtered out once at creation instead of per view
+        view_jobs = {
+            'requirement_to_test_case': (self._create_requirement_to_test_case_view, (traceability_items,)),
+            'test_case_to_requirement': (self._create_test_case_to_requirement_view, (covered_items,)),
+            'compliance_coverage': (self._create_compliance_coverage_view, (covered_items,)),
+            'coverage_summary': (self._create_coverage_summary, (traceability_items, requirements, test_cases))
         }
         
+        if len(traceability_items) >= _PARALLEL_VIEWS_THRESHOLD:
+            # The four builders are independent passes over the same items, so
+            # large matrices overlap them across a small thread pool
+            with ThreadPoolExecutor(max_workers=len(view_jobs)) as executor:
+                futures = {name: executor.submit(fn, *args)
+                           for name, (fn, args) in view_jobs.items()}
+                matrix_views = {name: future.result() for name, future in futures.items()}
+        else:
+            matrix_views = {name: fn(*args) for name, (fn, args) in view_jobs.items()}
+        
         return {
-            'traceability_items': [item.__dict__ for item in traceability_items],
+            'traceability_items': item_dicts,
             'matrix_views': matrix_views,
             'generation_timestamp': self._get_current_timestamp()
         }
         
     def _create_traceability_items(self, requirements: List[Any], 
                                  test_cases: List[Any], 
-                                 compliance_mappings: List[Any] = None) -> List[TraceabilityItem]:
-        """Create traceability items from requirements and test cases."""
+                                 compliance_mappings: List[Any] = None
+                                 ) -> Tuple[List[TraceabilityItem], List[Dict[str, Any]],
+                                            List[TraceabilityItem]]:
+        """Create traceability items (dataclass, dict and covered-only forms)."""
         traceability_items = []
+        item_dicts = []
+        covered_items = []
         
         # Create mapping from requirement ID to compliance standards
-        req_compliance_map = {}
+        req_compliance_map = defaultdict(list)
         if compliance_mappings:
             for mapping in compliance_mappings:
                 req_id = getattr(mapping, 'requirement_id', '')
                 standard = getattr(mapping, 'standard', '')
-                if req_id not in req_compliance_map:
-                    req_compliance_map[req_id] = []
                 req_compliance_map[req_id].append(standard)
                 
+        # Index test cases by requirement once: O(R+TC) instead of scanning
+        # every test case per requirement
+        tc_by_req = defaultdict(list)
+        for tc in test_cases:
+            tc_by_req[getattr(tc, 'requirement_id', '')].append(tc)
+                
         # Create traceability items for each requirement-test case pair
         for req in requirements:
             req_id = getattr(req, 'id', '')
             req_desc = getattr(req, 'description', '')
+            req_tokens = frozenset(req_desc.lower().split())
             
             # Find test cases for this requirement
-            related_test_cases = [
-                tc for tc in test_cases 
-                if getattr(tc, 'requirement_id', '') == req_id
-            ]
+            related_test_cases = tc_by_req.get(req_id, [])
             
             if not related_test_cases:
                 # Create item for uncovered requirement
-                item = TraceabilityItem(
-                    requirement_id=req_id,
-                    requirement_description=req_desc,
-                    test_case_id='',
-                    test_case_title='',
-                    compliance_standard='',
-                    traceability_level='not_covered',
-                    coverage_status='not_covered',
-                    evidence_required=[]
-                )
-                traceability_items.append(item)
+                record = {
+                    'requirement_id': req_id,
+                    'requirement_description': req_desc,
+                    'test_case_id': '',
+                    'test_case_title': '',
+                    'compliance_standard': '',
+                    'traceability_level': 'not_covered',
+                    'coverage_status': 'not_covered',
+                    'evidence_required': ()
+                }
+                traceability_items.append(TraceabilityItem(**record))
+                item_dicts.append(record)
             else:
                 # Create items for each test case
                 for tc in related_test_cases:
@@ -119,42 +314,52 @@ class TraceabilityMatrixGenerator:
                     tc_title = getattr(tc, 'title', '')
                     compliance_refs = getattr(tc, 'compliance_refs', [])
                     
+                    # Tokenize and classify once per pair; only the standard
+                    # varies in the inner loop
+                    tc_lower = tc_title.lower()
+                    tc_tokens = frozenset(tc_lower.split())
+                    traceability_level = _trace_level_from_tokens(req_tokens, tc_tokens, tc_lower)
+                    coverage_status = _coverage_status_from_lower(tc_lower)
+                    
                     # Determine compliance standards
                     standards = req_compliance_map.get(req_id, compliance_refs)
                     if not standards:
                         standards = ['Not Specified']
                         
                     for standard in standards:
-                        item = TraceabilityItem(
-                            requirement_id=req_id,
-                            requirement_description=req_desc,
-                            test_case_id=tc_id,
-                            test_case_title=tc_title,
-                            compliance_standard=standard.value if hasattr(standard, 'value') else str(standard),
-                            traceability_level=self._determine_traceability_level(req_desc, tc_title),
-                            coverage_status=self._determine_coverage_status(req_desc, tc_title),
-                            evidence_required=self._get_evidence_requirements(standard)
-                        )
+                        record = {
+                            'requirement_id': req_id,
+                            'requirement_description': req_desc,
+                            'test_case_id': tc_id,
+                            'test_case_title': tc_title,
+                            'compliance_standard': _standard_str(standard),
+                            'traceability_level': traceability_level,
+                            'coverage_status': coverage_status,
+                            'evidence_required': self._get_evidence_requirements(standard)
+                        }
+                        item = TraceabilityItem(**record)
                         traceability_items.append(item)
+                        covered_items.append(item)
+                        item_dicts.append(record)
                         
-        return traceability_items
+        return traceability_items, item_dicts, covered_items
         
-    def _create_requirement_to_test_case_view(self, traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
+    @staticmethod
+    def _create_requirement_to_test_case_view(traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
         """Create requirement-to-test-case view of traceability matrix."""
-        view = {}
+        view = defaultdict(lambda: {
+            'requirement_description': '',
+            'test_cases': [],
+            'compliance_standards': set(),
+            'coverage_rank': 0
+        })
         
         for item in traceability_items:
-            req_id = item.requirement_id
-            if req_id not in view:
-                view[req_id] = {
-                    'requirement_description': item.requirement_description,
-                    'test_cases': [],
-                    'compliance_standards': set(),
-                    'coverage_status': 'not_covered'
-                }
-                
+            entry = view[item.requirement_id]
+            entry['requirement_description'] = item.requirement_description
+            
             if item.test_case_id:
-                view[req_id]['test_cases'].append({
+                entry['test_cases'].append({
                     'test_case_id': item.test_case_id,
                     'test_case_title': item.test_case_title,
                     'compliance_standard': item.compliance_standard,
@@ -163,37 +368,35 @@ class TraceabilityMatrixGenerator:
                 })
                 
             if item.compliance_standard:
-                view[req_id]['compliance_standards'].add(item.compliance_standard)
+                entry['compliance_standards'].add(item.compliance_standard)
                 
-            # Update coverage status
-            if item.coverage_status == 'covered':
-                view[req_id]['coverage_status'] = 'covered'
-            elif item.coverage_status == 'partial' and view[req_id]['coverage_status'] != 'covered':
-                view[req_id]['coverage_status'] = 'partial'
+            # Update coverage status via rank: max replaces the branch pair
+            rank = _STATUS_RANK.get(item.coverage_status, 0)
+            if rank > entry['coverage_rank']:
+                entry['coverage_rank'] = rank
                 
-        # Convert sets to lists for JSON serialization
+        # Convert sets to lists and ranks to statuses for JSON serialization
         for req_data in view.values():
             req_data['compliance_standards'] = list(req_data['compliance_standards'])
+            req_data['coverage_status'] = _RANK_STATUS[req_data.pop('coverage_rank')]
             
-        return view
+        return dict(view)
         
-    def _create_test_case_to_requirement_view(self, traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
+    @staticmethod
+    def _create_test_case_to_requirement_view(traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
         """Create test-case-to-requirement view of traceability matrix."""
-        view = {}
+        view = defaultdict(lambda: {
+            'test_case_title': '',
+            'requirements': [],
+            'compliance_standards': set()
+        })
         
+        # Callers pass only covered items, so every entry has a test case
         for item in traceability_items:
-            if not item.test_case_id:
-                continue
+            entry = view[item.test_case_id]
+            entry['test_case_title'] = item.test_case_title
                 
-            tc_id = item.test_case_id
-            if tc_id not in view:
-                view[tc_id] = {
-                    'test_case_title': item.test_case_title,
-                    'requirements': [],
-                    'compliance_standards': set()
-                }
-                
-            view[tc_id]['requirements'].append({
+            entry['requirements'].append({
                 'requirement_id': item.requirement_id,
                 'requirement_description': item.requirement_description,
                 'compliance_standard': item.compliance_standard,
@@ -202,34 +405,33 @@ class TraceabilityMatrixGenerator:
             })
             
             if item.compliance_standard:
-                view[tc_id]['compliance_standards'].add(item.compliance_standard)
+                entry['compliance_standards'].add(item.compliance_standard)
                 
         # Convert sets to lists for JSON serialization
         for tc_data in view.values():
             tc_data['compliance_standards'] = list(tc_data['compliance_standards'])
             
-        return view
+        return dict(view)
         
-    def _create_compliance_coverage_view(self, traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
+    @staticmethod
+    def _create_compliance_coverage_view(traceability_items: List[TraceabilityItem]) -> Dict[str, Any]:
         """Create compliance coverage view of traceability matrix."""
-        view = {}
+        view = defaultdict(lambda: {
+            'requirements': set(),
+            'test_cases': set(),
+            'coverage_percentage': 0.0
+        })
         
         for item in traceability_items:
             standard = item.compliance_standard
             if not standard or standard == 'Not Specified':
                 continue
                 
-            if standard not in view:
-                view[standard] = {
-                    'requirements': set(),
-                    'test_cases': set(),
-                    'coverage_percentage': 0.0
-                }
-                
+            # Callers pass only covered items, so test_case_id is always set
+            entry = view[standard]
             if item.requirement_id:
-                view[standard]['requirements'].add(item.requirement_id)
-            if item.test_case_id:
-                view[standard]['test_cases'].add(item.test_case_id)
+                entry['requirements'].add(item.requirement_id)
+            entry['test_cases'].add(item.test_case_id)
                 
         # Calculate coverage percentages
         for standard, data in view.items():
@@ -245,145 +447,57 @@ class TraceabilityMatrixGenerator:
             data['requirements'] = list(data['requirements'])
             data['test_cases'] = list(data['test_cases'])
             
-        return view
+        return dict(view)
         
-    def _create_coverage_summary(self, traceability_items: List[TraceabilityItem], 
+    @staticmethod
+    def _create_coverage_summary(traceability_items: List[TraceabilityItem], 
                                requirements: List[Any], test_cases: List[Any]) -> Dict[str, Any]:
         """Create coverage summary statistics."""
         total_requirements = len(requirements)
         total_test_cases = len(test_cases)
         
-        # Count covered requirements
+        # Single pass over the items updates all three accumulators
         covered_requirements = set()
+        traceability_levels = Counter()
+        compliance_coverage = defaultdict(lambda: {'requirements': 0, 'test_cases': 0})
+        
         for item in traceability_items:
-            if item.test_case_id and item.coverage_status in ['covered', 'partial']:
+            if item.test_case_id and item.coverage_status in _COVERED_STATUSES:
                 covered_requirements.add(item.requirement_id)
                 
-        covered_count = len(covered_requirements)
-        coverage_percentage = (covered_count / total_requirements * 100) if total_requirements > 0 else 0.0
-        
-        # Count by traceability level
-        traceability_levels = {}
-        for item in traceability_items:
-            level = item.traceability_level
-            traceability_levels[level] = traceability_levels.get(level, 0) + 1
+            traceability_levels[item.traceability_level] += 1
             
-        # Count by compliance standard
-        compliance_coverage = {}
-        for item in traceability_items:
             standard = item.compliance_standard
             if standard and standard != 'Not Specified':
-                if standard not in compliance_coverage:
-                    compliance_coverage[standard] = {'requirements': 0, 'test_cases': 0}
+                entry = compliance_coverage[standard]
                 if item.requirement_id:
-                    compliance_coverage[standard]['requirements'] += 1
+                    entry['requirements'] += 1
                 if item.test_case_id:
-                    compliance_coverage[standard]['test_cases'] += 1
+                    entry['test_cases'] += 1
                     
+        covered_count = len(covered_requirements)
+        coverage_percentage = (covered_count / total_requirements * 100) if total_requirements > 0 else 0.0
+        
         return {
             'total_requirements': total_requirements,
             'total_test_cases': total_test_cases,
             'covered_requirements': covered_count,
             'coverage_percentage': round(coverage_percentage, 2),
-            'traceability_levels': traceability_levels,
-            'compliance_coverage': compliance_coverage
+            'traceability_levels': dict(traceability_levels),
+            'compliance_coverage': dict(compliance_coverage)
         }
         
     def _determine_traceability_level(self, requirement_desc: str, test_case_title: str) -> str:
         """Determine traceability level between requirement and test case."""
-        req_lower = requirement_desc.lower()
-        tc_lower = test_case_title.lower()
-        
-        # Direct traceability indicators
-        direct_indicators = [
-            'verify', 'test', 'validate', 'check', 'ensure'
-        ]
-        
-        if any(indicator in tc_lower for indicator in direct_indicators):
-            return 'direct'
-            
-        # Check for keyword overlap
-        req_words = set(req_lower.split())
-        tc_words = set(tc_lower.split())
-        overlap = len(req_words.intersection(tc_words))
-        
-        if overlap >= 3:
-            return 'direct'
-        elif overlap >= 1:
-            return 'indirect'
-        else:
-            return 'related'
+        return _trace_level(requirement_desc, test_case_title)
             
     def _determine_coverage_status(self, requirement_desc: str, test_case_title: str) -> str:
         """Determine coverage status of requirement by test case."""
-        req_lower = requirement_desc.lower()
-        tc_lower = test_case_title.lower()
-        
-        # Check for comprehensive coverage
-        coverage_indicators = [
-            'positive', 'negative', 'boundary', 'integration', 'performance'
-        ]
-        
-        if any(indicator in tc_lower for indicator in coverage_indicators):
-            return 'covered'
-            
-        # Check for partial coverage
-        partial_indicators = [
-            'basic', 'simple', 'minimal', 'initial'
-        ]
+        return _coverage_status(requirement_desc, test_case_title)
         
-        if any(indicator in tc_lower for indicator in partial_indicators):
-            return 'partial'
-            
-        return 'covered'  # Default to covered if test case exists
-        
-    def _get_evidence_requirements(self, compliance_standard: Any) -> List[str]:
+    def _get_evidence_requirements(self, compliance_standard: Any) -> Tuple[str, ...]:
         """Get evidence requirements for compliance standard."""
-        evidence_map = {
-            'FDA_21_CFR_820': [
-                'Design and development documentation',
-                'Risk management file',
-                'Verification and validation records'
-            ],
-            'FDA_21_CFR_11': [
-                'System validation documentation',
-                'Electronic signature procedures',
-                'Audit trail records'
-            ],
-            'ISO_13485': [
-                'Quality management system documentation',
-                'Risk management documentation',
-                'Design and development records'
-            ],
-            'IEC_62304': [
-                'Software development plan',
-                'Software requirements specification',
-                'Software verification and validation records'
-            ],
-            'GDPR': [
-                'Data protection impact assessment',
-                'Privacy by design documentation',
-                'Consent management records'
-            ],
-            'HIPAA': [
-                'Risk assessment documentation',
-                'Security policies and procedures',
-                'Access control documentation'
-            ],
-            'IEC_60601': [
-                'Risk management file',
-                'Essential performance documentation',
-                'Safety testing records'
-            ],
-            'IEC_62366': [
-                'Usability engineering plan',
-                'User interface specification',
-                'Usability testing records'
-            ]
-        }
-        
-        standard_str = compliance_standard.value if hasattr(compliance_standard, 'value') else str(compliance_standard)
-        return evidence_map.get(standard_str, ['General compliance documentation'])
+        return _EVIDENCE_MAP.get(_standard_str(compliance_standard), _DEFAULT_EVIDENCE)
         
     def export_traceability_matrix(self, matrix_data: Dict[str, Any], 
                                  output_path: str, format_type: str = 'excel') -> bool:
@@ -400,6 +514,16 @@ class TraceabilityMatrixGenerator:
         """
         try:
             if format_type == 'excel':
+                items = matrix_data.get('traceability_items', [])
+                if pyexcelerate and len(items) > _FAST_EXCEL_THRESHOLD:
+                    return self._export_to_excel_fast(matrix_data, output_path)
+                if _HAS_XLSXWRITER:
+                    return self._export_to_excel_pandas(matrix_data, output_path)
+                return self._export_to_excel(matrix_data, output_path)
+            elif format_type == 'excel_fast':
+                if pyexcelerate:
+                    return self._export_to_excel_fast(matrix_data, output_path)
+                logger.warning("pyexcelerate not available. Falling back to openpyxl export.")
                 return self._export_to_excel(matrix_data, output_path)
             elif format_type == 'csv':
                 return self._export_to_csv(matrix_data, output_path)
@@ -415,10 +539,9 @@ class TraceabilityMatrixGenerator:
             
     def _export_to_excel(self, matrix_data: Dict[str, Any], output_path: str) -> bool:
         """Export traceability matrix to Excel format."""
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Write-only mode streams rows to disk (via lxml's C serializer when
+        # installed) instead of holding every cell object in memory
+        wb = Workbook(write_only=True)
         
         # Create requirement-to-test-case sheet
         self._create_requirement_to_test_case_sheet(wb, matrix_data)
@@ -438,81 +561,195 @@ class TraceabilityMatrixGenerator:
         logger.info(f"Exported traceability matrix to Excel: {output_path}")
         return True
         
+    def _export_to_excel_pandas(self, matrix_data: Dict[str, Any], output_path: str) -> bool:
+        """Export via pandas with the xlsxwriter engine.
+
+        DataFrame.to_excel writes whole columns through xlsxwriter's C-backed
+        serializer instead of one Python cell call per value.
+        """
+        traceability_items = matrix_data.get('traceability_items', [])
+        matrix_views = matrix_data.get('matrix_views', {})
+        compliance_coverage = matrix_views.get('compliance_coverage', {})
+        coverage_summary = matrix_views.get('coverage_summary', {})
+        
+        df_r2t = pd.DataFrame(traceability_items)
+        if not df_r2t.empty:
+            df_r2t = df_r2t.assign(
+                evidence_required=[', '.join(e) for e in df_r2t['evidence_required']]
+            )
+            df_t2r = df_r2t[df_r2t['test_case_id'] != ''].drop(columns=['evidence_required'])
+        else:
+            df_t2r = df_r2t
+            
+        df_cov = pd.DataFrame([
+            {
+                'Compliance Standard': standard,
+                'Requirements Count': len(data['requirements']),
+                'Test Cases Count': len(data['test_cases']),
+                'Coverage Percentage': f"{data['coverage_percentage']:.2f}%"
+            }
+            for standard, data in compliance_coverage.items()
+        ])
+        df_sum = pd.DataFrame([
+            {'Metric': 'Total Requirements', 'Value': coverage_summary.get('total_requirements', 0)},
+            {'Metric': 'Total Test Cases', 'Value': coverage_summary.get('total_test_cases', 0)},
+            {'Metric': 'Covered Requirements', 'Value': coverage_summary.get('covered_requirements', 0)},
+            {'Metric': 'Coverage Percentage',
+             'Value': f"{coverage_summary.get('coverage_percentage', 0):.2f}%"},
+        ])
+        
+        with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+            df_r2t.to_excel(writer, sheet_name='Requirement to Test Case', index=False)
+            df_t2r.to_excel(writer, sheet_name='Test Case to Requirement', index=False)
+            df_cov.to_excel(writer, sheet_name='Compliance Coverage', index=False)
+            df_sum.to_excel(writer, sheet_name='Summary', index=False)
+            
+            # One format object styles every header row in a single call each
+            header_fmt = writer.book.add_format({'bold': True, 'bg_color': '#CCCCCC'})
+            for worksheet in writer.sheets.values():
+                worksheet.set_row(0, None, header_fmt)
+                
+        logger.info(f"Exported traceability matrix to Excel (xlsxwriter): {output_path}")
+        return True
+        
+    def _export_to_excel_fast(self, matrix_data: Dict[str, Any], output_path: str) -> bool:
+        """Export via pyexcelerate, which bulk-writes value matrices."""
+        traceability_items = matrix_data.get('traceability_items', [])
+        matrix_views = matrix_data.get('matrix_views', {})
+        compliance_coverage = matrix_views.get('compliance_coverage', {})
+        coverage_summary = matrix_views.get('coverage_summary', {})
+        
+        r2t_rows = [[
+            'Requirement ID', 'Requirement Description', 'Test Case ID', 'Test Case Title',
+            'Compliance Standard', 'Traceability Level', 'Coverage Status', 'Evidence Required'
+        ]]
+        t2r_rows = [[
+            'Test Case ID', 'Test Case Title', 'Requirement ID', 'Requirement Description',
+            'Compliance Standard', 'Traceability Level', 'Coverage Status'
+        ]]
+        for item in traceability_items:
+            r2t_rows.append([
+                item['requirement_id'], item['requirement_description'],
+                item['test_case_id'], item['test_case_title'],
+                item['compliance_standard'], item['traceability_level'],
+                item['coverage_status'], ', '.join(item['evidence_required'])
+            ])
+            if item['test_case_id']:
+                t2r_rows.append([
+                    item['test_case_id'], item['test_case_title'],
+                    item['requirement_id'], item['requirement_description'],
+                    item['compliance_standard'], item['traceability_level'],
+                    item['coverage_status']
+                ])
+                
+        coverage_rows = [[
+            'Compliance Standard', 'Requirements Count', 'Test Cases Count', 'Coverage Percentage'
+        ]]
+        for standard, data in compliance_coverage.items():
+            coverage_rows.append([
+                standard, len(data['requirements']), len(data['test_cases']),
+                f"{data['coverage_percentage']:.2f}%"
+            ])
+            
+        summary_rows = [
+            ["Traceability Matrix Summary"],
+            [],
+            ["Total Requirements:", coverage_summary.get('total_requirements', 0)],
+            ["Total Test Cases:", coverage_summary.get('total_test_cases', 0)],
+            ["Covered Requirements:", coverage_summary.get('covered_requirements', 0)],
+            ["Coverage Percentage:", f"{coverage_summary.get('coverage_percentage', 0):.2f}%"],
+        ]
+        
+        wb = pyexcelerate.Workbook()
+        header_style = pyexcelerate.Style(font=pyexcelerate.Font(bold=True))
+        
+        for title, rows in (
+            ("Requirement to Test Case", r2t_rows),
+            ("Test Case to Requirement", t2r_rows),
+            ("Compliance Coverage", coverage_rows),
+            ("Summary", summary_rows),
+        ):
+            sheet = wb.new_sheet(title, data=rows)
+            # Style only the header row ("style cheating"): full-sheet styling
+            # is what makes Excel writers slow
+            sheet.set_row_style(1, header_style)
+            
+        wb.save(output_path)
+        
+        logger.info(f"Exported traceability matrix to Excel (fast path): {output_path}")
+        return True
+        
+    def _header_row(self, ws, headers: List[str]) -> List[WriteOnlyCell]:
+        """Build a header row sharing the module-level Font/PatternFill."""
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            cells.append(cell)
+        return cells
+        
     def _create_requirement_to_test_case_sheet(self, wb: Workbook, matrix_data: Dict[str, Any]) -> None:
         """Create requirement-to-test-case sheet."""
         ws = wb.create_sheet("Requirement to Test Case")
         
-        # Headers
-        headers = [
+        ws.append(self._header_row(ws, [
             'Requirement ID', 'Requirement Description', 'Test Case ID', 'Test Case Title',
             'Compliance Standard', 'Traceability Level', 'Coverage Status', 'Evidence Required'
-        ]
+        ]))
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-            
         # Data
-        traceability_items = matrix_data.get('traceability_items', [])
-        for row, item in enumerate(traceability_items, 2):
-            ws.cell(row=row, column=1, value=item['requirement_id'])
-            ws.cell(row=row, column=2, value=item['requirement_description'])
-            ws.cell(row=row, column=3, value=item['test_case_id'])
-            ws.cell(row=row, column=4, value=item['test_case_title'])
-            ws.cell(row=row, column=5, value=item['compliance_standard'])
-            ws.cell(row=row, column=6, value=item['traceability_level'])
-            ws.cell(row=row, column=7, value=item['coverage_status'])
-            ws.cell(row=row, column=8, value=', '.join(item['evidence_required']))
+        for item in matrix_data.get('traceability_items', []):
+            ws.append([
+                item['requirement_id'],
+                item['requirement_description'],
+                item['test_case_id'],
+                item['test_case_title'],
+                item['compliance_standard'],
+                item['traceability_level'],
+                item['coverage_status'],
+                ', '.join(item['evidence_required'])
+            ])
             
     def _create_test_case_to_requirement_sheet(self, wb: Workbook, matrix_data: Dict[str, Any]) -> None:
         """Create test-case-to-requirement sheet."""
         ws = wb.create_sheet("Test Case to Requirement")
         
-        # Headers
-        headers = [
+        ws.append(self._header_row(ws, [
             'Test Case ID', 'Test Case Title', 'Requirement ID', 'Requirement Description',
             'Compliance Standard', 'Traceability Level', 'Coverage Status'
-        ]
+        ]))
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-            
         # Data
-        traceability_items = matrix_data.get('traceability_items', [])
-        for row, item in enumerate(traceability_items, 2):
+        for item in matrix_data.get('traceability_items', []):
             if item['test_case_id']:  # Only include items with test cases
-                ws.cell(row=row, column=1, value=item['test_case_id'])
-                ws.cell(row=row, column=2, value=item['test_case_title'])
-                ws.cell(row=row, column=3, value=item['requirement_id'])
-                ws.cell(row=row, column=4, value=item['requirement_description'])
-                ws.cell(row=row, column=5, value=item['compliance_standard'])
-                ws.cell(row=row, column=6, value=item['traceability_level'])
-                ws.cell(row=row, column=7, value=item['coverage_status'])
+                ws.append([
+                    item['test_case_id'],
+                    item['test_case_title'],
+                    item['requirement_id'],
+                    item['requirement_description'],
+                    item['compliance_standard'],
+                    item['traceability_level'],
+                    item['coverage_status']
+                ])
                 
     def _create_compliance_coverage_sheet(self, wb: Workbook, matrix_data: Dict[str, Any]) -> None:
         """Create compliance coverage sheet."""
         ws = wb.create_sheet("Compliance Coverage")
         
-        # Headers
-        headers = [
+        ws.append(self._header_row(ws, [
             'Compliance Standard', 'Requirements Count', 'Test Cases Count', 'Coverage Percentage'
-        ]
+        ]))
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='CCCCCC', end_color='CCCCCC', fill_type='solid')
-            
         # Data
         compliance_coverage = matrix_data.get('matrix_views', {}).get('compliance_coverage', {})
-        for row, (standard, data) in enumerate(compliance_coverage.items(), 2):
-            ws.cell(row=row, column=1, value=standard)
-            ws.cell(row=row, column=2, value=len(data['requirements']))
-            ws.cell(row=row, column=3, value=len(data['test_cases']))
-            ws.cell(row=row, column=4, value=f"{data['coverage_percentage']:.2f}%")
+        for standard, data in compliance_coverage.items():
+            ws.append([
+                standard,
+                len(data['requirements']),
+                len(data['test_cases']),
+                f"{data['coverage_percentage']:.2f}%"
+            ])
             
     def _create_summary_sheet(self, wb: Workbook, matrix_data: Dict[str, Any]) -> None:
         """Create summary sheet."""
@@ -521,20 +758,20 @@ class TraceabilityMatrixGenerator:
         # Summary data
         coverage_summary = matrix_data.get('matrix_views', {}).get('coverage_summary', {})
         
-        # Write summary
-        ws.cell(row=1, column=1, value="Traceability Matrix Summary").font = Font(bold=True, size=14)
+        title_cell = WriteOnlyCell(ws, value="Traceability Matrix Summary")
+        title_cell.font = _TITLE_FONT
         
-        ws.cell(row=3, column=1, value="Total Requirements:").font = Font(bold=True)
-        ws.cell(row=3, column=2, value=coverage_summary.get('total_requirements', 0))
-        
-        ws.cell(row=4, column=1, value="Total Test Cases:").font = Font(bold=True)
-        ws.cell(row=4, column=2, value=coverage_summary.get('total_test_cases', 0))
-        
-        ws.cell(row=5, column=1, value="Covered Requirements:").font = Font(bold=True)
-        ws.cell(row=5, column=2, value=coverage_summary.get('covered_requirements', 0))
-        
-        ws.cell(row=6, column=1, value="Coverage Percentage:").font = Font(bold=True)
-        ws.cell(row=6, column=2, value=f"{coverage_summary.get('coverage_percentage', 0):.2f}%")
+        def _label(value):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = _HEADER_FONT
+            return cell
+            
+        ws.append([title_cell])
+        ws.append([])
+        ws.append([_label("Total Requirements:"), coverage_summary.get('total_requirements', 0)])
+        ws.append([_label("Total Test Cases:"), coverage_summary.get('total_test_cases', 0)])
+        ws.append([_label("Covered Requirements:"), coverage_summary.get('covered_requirements', 0)])
+        ws.append([_label("Coverage Percentage:"), f"{coverage_summary.get('coverage_percentage', 0):.2f}%"])
         
     def _export_to_csv(self, matrix_data: Dict[str, Any], output_path: str) -> bool:
         """Export traceability matrix to CSV format."""
@@ -544,27 +781,30 @@ class TraceabilityMatrixGenerator:
             logger.warning("No traceability items to export")
             return False
             
-        # Convert to DataFrame
-        df = pd.DataFrame(traceability_items)
-        
-        # Export to CSV
-        df.to_csv(output_path, index=False)
+        # Stream rows with the stdlib csv module instead of materializing a
+        # DataFrame; the matrix is pure string data so pandas adds only
+        # type-inference overhead and a second in-memory copy.
+        fieldnames = list(traceability_items[0].keys())
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(
+                {**item, 'evidence_required': ', '.join(item['evidence_required'])}
+                for item in traceability_items
+            )
         
         logger.info(f"Exported traceability matrix to CSV: {output_path}")
         return True
         
     def _export_to_json(self, matrix_data: Dict[str, Any], output_path: str) -> bool:
         """Export traceability matrix to JSON format."""
-        import json
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(matrix_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps_indented(matrix_data))
             
         logger.info(f"Exported traceability matrix to JSON: {output_path}")
         return True
         
     def _get_current_timestamp(self) -> str:
         """Get current timestamp for matrix generation."""
-        from datetime import datetime
         return datetime.now().isoformat()
 
@@ -5,31 +5,73 @@ Integrates screenshot capture and AI-powered visual comparison to detect
 UI changes and generate/regenerate related visual test cases.
 """
 
+import itertools
 import logging
+import os
+import time
 import cv2
 import numpy as np
-import base64
 import json
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-import hashlib
-from PIL import Image, ImageChops
-import io
-import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import tensorflow as tf
-from tensorflow import keras
-import matplotlib.pyplot as plt
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    def _json_dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _json_dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# tensorflow is imported lazily in _initialize_models: it costs ~1s and
+# hundreds of MB at import, none of which the screenshot/compare paths need
 
 logger = logging.getLogger(__name__)
 
 
+def _aligned_empty(shape: Tuple[int, ...], dtype=np.uint8, align: int = 64):
+    """Allocate an uninitialized array aligned to a cache-line boundary.
+    
+    Aligned buffers let OpenCV dispatch its vectorized kernels without an
+    internal realignment copy.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    size = int(np.prod(shape)) * itemsize
+    raw = np.empty(size + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    return raw[offset:offset + size].view(dtype).reshape(shape)
+
+
+# BGR luma weights (ITU-R 601), used to fuse absdiff + grayscale + mean into
+# one vectorized reduction without materializing full-size temporaries
+_BGR_LUMA_WEIGHTS = np.array([0.114, 0.587, 0.299])
+
+# The whole pipeline is specialized to this fixed frame shape; the
+# normalization divisor is folded to a constant so scoring never recomputes
+# it from array metadata
+_FRAME_SIZE = (224, 224)
+_LUMA_NORM = _FRAME_SIZE[0] * _FRAME_SIZE[1] * 255.0
+
+
 @dataclass
 class VisualDifference:
     """Detected visual difference between screenshots."""
@@ -78,6 +120,35 @@ class VisualRegressionEngine:
         
         self.difference_model = None
         self.element_detector = None
+        # Preprocessed 224x224 baselines keyed by path; entries carry the
+        # source mtime so edited baselines are re-decoded
+        self._baseline_cache: Dict[str, Tuple[float, np.ndarray]] = {}
+        # Shared feature detector/matcher: 200 capped keypoints and FLANN
+        # LSH matching are plenty for match-ratio screening and far cheaper
+        # than default ORB with brute-force Hamming
+        self._orb = cv2.ORB_create(nfeatures=200, fastThreshold=20)
+        self._flann = cv2.FlannBasedMatcher(
+            dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1), {}
+        )
+        # Preallocated working buffers reused across comparisons; every call
+        # previously re-allocated the resized current image, the signed diff
+        # and two grayscale copies
+        self._buf_current = _aligned_empty(_FRAME_SIZE + (3,))
+        self._buf_diff16 = _aligned_empty(_FRAME_SIZE + (3,), dtype=np.int16)
+        self._buf_gray_b = _aligned_empty(_FRAME_SIZE)
+        self._buf_gray_c = _aligned_empty(_FRAME_SIZE)
+        # Background writer for failure-evidence PNGs; passing tests never
+        # touch the disk
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        # Route the pure-OpenCV edge pipeline through OpenCL when a device
+        # is available; the NumPy-fused stages stay on the host where
+        # transferring UMats back would cost more than the kernels save
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        # Monotonic suffix for generated filenames: avoids per-call strftime
+        # and the same-second collisions that silently overwrote files
+        self._name_counter = itertools.count()
         self.tolerance_thresholds = {
             'layout': 0.1,
             'color': 0.05,
@@ -90,13 +161,28 @@ class VisualRegressionEngine:
     def _initialize_models(self):
         """Initialize AI models for visual analysis."""
         try:
-            # Load or create difference detection model
-            if self.model_path.exists():
-                self.difference_model = keras.models.load_model(self.model_path)
-                logger.info("Loaded existing visual difference model")
-            else:
-                self.difference_model = self._create_difference_model()
-                logger.info("Created new visual difference model")
+            import tensorflow as tf
+            from tensorflow import keras
+            
+            # Prefer a quantized TFLite interpreter: CPU inference runs
+            # several times faster than the Keras graph and the weights are
+            # roughly 4x smaller. The Keras model is only built (or loaded)
+            # once to produce the .tflite file.
+            tflite_path = self.model_path.with_suffix('.tflite')
+            
+            if not tflite_path.exists():
+                if self.model_path.exists():
+                    model = keras.models.load_model(self.model_path)
+                    logger.info("Loaded existing visual difference model")
+                else:
+                    model = self._create_difference_model()
+                    logger.info("Created new visual difference model")
+                self._convert_to_tflite(model, tflite_path)
+            
+            self.difference_model = tf.lite.Interpreter(
+                model_path=str(tflite_path), num_threads=os.cpu_count()
+            )
+            self.difference_model.allocate_tensors()
             
             # Initialize element detector (simplified version)
             self.element_detector = self._create_element_detector()
@@ -106,8 +192,31 @@ class VisualRegressionEngine:
             self.difference_model = None
             self.element_detector = None
     
-    def _create_difference_model(self) -> keras.Model:
+    def _convert_to_tflite(self, model: "keras.Model", tflite_path: Path):
+        """Convert the Keras model to a quantized TFLite flatbuffer."""
+        import tensorflow as tf
+        
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        tflite_path.write_bytes(converter.convert())
+        logger.info(f"Saved quantized visual model: {tflite_path}")
+    
+    def _predict(self, batch: np.ndarray) -> np.ndarray:
+        """Run the TFLite interpreter on a batch of preprocessed images."""
+        interpreter = self.difference_model
+        input_detail = interpreter.get_input_details()[0]
+        output_detail = interpreter.get_output_details()[0]
+        
+        interpreter.resize_tensor_input(input_detail['index'], batch.shape)
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(input_detail['index'], batch.astype(input_detail['dtype']))
+        interpreter.invoke()
+        return interpreter.get_tensor(output_detail['index'])
+    
+    def _create_difference_model(self) -> "keras.Model":
         """Create CNN model for visual difference detection."""
+        from tensorflow import keras
+        
         model = keras.Sequential([
             keras.layers.Conv2D(32, (3, 3), activation='relu', input_shape=(224, 224, 3)),
             keras.layers.MaxPooling2D((2, 2)),
@@ -134,10 +243,14 @@ class VisualRegressionEngine:
         # like YOLO or R-CNN for detecting UI elements
         return None
     
+    def _unique_suffix(self) -> str:
+        """Return a collision-free filename suffix without strftime cost."""
+        return f"{int(time.time() * 1000):013d}_{next(self._name_counter):06d}"
+    
     def capture_screenshot(self, driver: webdriver, element_selector: str = None) -> str:
         """Capture screenshot of page or specific element."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._unique_suffix()
             
             if element_selector:
                 # Capture specific element
@@ -161,6 +274,24 @@ class VisualRegressionEngine:
             logger.error(f"Error capturing screenshot: {e}")
             return None
     
+    def _capture_screenshot_bytes(self, driver: webdriver, 
+                                 element_selector: str = None) -> Optional[bytes]:
+        """Capture a screenshot as in-memory PNG bytes, skipping the disk."""
+        try:
+            if element_selector:
+                element = WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, element_selector))
+                )
+                return element.screenshot_as_png
+            return driver.get_screenshot_as_png()
+            
+        except TimeoutException:
+            logger.error(f"Timeout waiting for element: {element_selector}")
+            return None
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {e}")
+            return None
+    
     def create_visual_test_case(self, test_case_id: str, element_selector: str, 
                               element_type: str, description: str, 
                               driver: webdriver) -> VisualTestCase:
@@ -172,6 +303,10 @@ class VisualRegressionEngine:
             if not baseline_path:
                 raise Exception("Failed to capture baseline screenshot")
             
+            # Pre-warm the preprocessed baseline sidecar so the first test
+            # run skips the PNG decode
+            self._load_baseline(baseline_path)
+            
             visual_test_case = VisualTestCase(
                 test_case_id=test_case_id,
                 element_selector=element_selector,
@@ -196,22 +331,33 @@ class VisualRegressionEngine:
                        driver: webdriver) -> VisualTestResult:
         """Run visual regression test."""
         try:
-            # Capture current screenshot
-            current_path = self.capture_screenshot(driver, visual_test_case.element_selector)
+            # Capture and decode the current screenshot in memory; the PNG
+            # bytes only reach the disk if the test does not pass
+            png_bytes = self._capture_screenshot_bytes(driver, visual_test_case.element_selector)
             
-            if not current_path:
+            if not png_bytes:
                 raise Exception("Failed to capture current screenshot")
             
+            current_img = cv2.imdecode(np.frombuffer(png_bytes, np.uint8), cv2.IMREAD_COLOR)
+            if current_img is None:
+                raise Exception("Failed to decode current screenshot")
+            
             # Compare images
-            difference_score, differences = self._compare_images(
-                visual_test_case.baseline_image_path,
-                current_path,
-                visual_test_case.tolerance
+            difference_score, differences = self._compare_with_current(
+                visual_test_case.baseline_image_path, current_img
             )
             
             # Determine status
             status = self._determine_test_status(difference_score, differences)
             
+            # Persist failure evidence asynchronously
+            current_path = ''
+            if status != 'pass':
+                current_path = str(
+                    self.baseline_dir / f"current_{visual_test_case.test_case_id}_{self._unique_suffix()}.png"
+                )
+                self._io_executor.submit(Path(current_path).write_bytes, png_bytes)
+            
             result = VisualTestResult(
                 test_case_id=visual_test_case.test_case_id,
                 baseline_image_path=visual_test_case.baseline_image_path,
@@ -232,64 +378,211 @@ class VisualRegressionEngine:
             logger.error(f"Error running visual test: {e}")
             raise
     
+    def run_visual_tests_batch(self, visual_test_cases: List[VisualTestCase], 
+                              driver: webdriver) -> List[VisualTestResult]:
+        """Run a suite of visual tests with batched difference scoring.
+        
+        All image pairs are stacked into one (N, 224, 224, 3) tensor and
+        screened with a single vectorized reduction; only pairs above the
+        screen threshold pay for the full per-pair detectors.
+        """
+        pairs = []
+        for visual_test_case in visual_test_cases:
+            try:
+                png_bytes = self._capture_screenshot_bytes(driver, visual_test_case.element_selector)
+                if not png_bytes:
+                    continue
+                
+                baseline_img = self._load_baseline(visual_test_case.baseline_image_path)
+                current_img = cv2.imdecode(np.frombuffer(png_bytes, np.uint8), cv2.IMREAD_COLOR)
+                if baseline_img is None or current_img is None:
+                    continue
+                
+                current_img = cv2.resize(current_img, _FRAME_SIZE,
+                                         interpolation=cv2.INTER_AREA)
+                pairs.append((visual_test_case, png_bytes, baseline_img, current_img))
+                
+            except Exception as e:
+                logger.error(f"Error capturing batch screenshot for "
+                             f"{visual_test_case.test_case_id}: {e}")
+        
+        if not pairs:
+            return []
+        
+        # One vectorized pass scores every pair at once
+        baselines = np.stack([np.asarray(p[2]) for p in pairs]).astype(np.int16)
+        currents = np.stack([p[3] for p in pairs]).astype(np.int16)
+        batch_diff = np.abs(baselines - currents)
+        scores = batch_diff.sum(axis=(1, 2, 3), dtype=np.int64) / (batch_diff[0].size * 255.0)
+        
+        screen_threshold = 0.5 * min(self.tolerance_thresholds.values())
+        results = []
+        timestamp = datetime.now().isoformat()
+        
+        # Screened pairs carry no differences, so their statuses reduce to
+        # pure score thresholds evaluated in one vectorized pass
+        fast_statuses = np.where(scores < 0.05, 'pass',
+                                 np.where(scores < 0.15, 'warning', 'fail'))
+        
+        for i, ((visual_test_case, png_bytes, baseline_img, current_img), score) in enumerate(zip(pairs, scores)):
+            if score < screen_threshold:
+                difference_score, differences = float(score), []
+                status = str(fast_statuses[i])
+            else:
+                difference_score, differences = self._compare_arrays(baseline_img, current_img)
+                status = self._determine_test_status(difference_score, differences)
+            
+            # Persist failure evidence asynchronously
+            current_path = ''
+            if status != 'pass':
+                current_path = str(
+                    self.baseline_dir / f"current_{visual_test_case.test_case_id}_{self._unique_suffix()}.png"
+                )
+                self._io_executor.submit(Path(current_path).write_bytes, png_bytes)
+            
+            result = VisualTestResult(
+                test_case_id=visual_test_case.test_case_id,
+                baseline_image_path=visual_test_case.baseline_image_path,
+                current_image_path=current_path,
+                difference_score=difference_score,
+                differences=differences,
+                status=status,
+                generated_at=timestamp
+            )
+            self._save_visual_test_result(result)
+            results.append(result)
+        
+        logger.info(f"Batch visual run completed: {len(results)} tests")
+        return results
+    
+    def _load_baseline(self, baseline_path: str) -> Optional[np.ndarray]:
+        """Load a baseline image, preprocessed to 224x224 and cached.
+        
+        Repeated runs against the same baseline skip the PNG decode and
+        resize: the array is held in memory keyed by path+mtime and also
+        persisted as a sibling .npy file that memory-maps on later runs.
+        """
+        try:
+            source = Path(baseline_path)
+            mtime = source.stat().st_mtime
+            
+            cached = self._baseline_cache.get(baseline_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            
+            npy_path = source.with_suffix(source.suffix + '.224.npy')
+            if npy_path.exists() and npy_path.stat().st_mtime >= mtime:
+                baseline_img = np.load(str(npy_path), mmap_mode='r')
+            else:
+                baseline_img = cv2.imread(baseline_path)
+                if baseline_img is None:
+                    return None
+                baseline_img = np.ascontiguousarray(
+                    cv2.resize(baseline_img, _FRAME_SIZE, interpolation=cv2.INTER_AREA)
+                )
+                np.save(str(npy_path), baseline_img)
+            
+            self._baseline_cache[baseline_path] = (mtime, baseline_img)
+            return baseline_img
+            
+        except Exception as e:
+            logger.error(f"Error loading baseline image: {e}")
+            return None
+    
     def _compare_images(self, baseline_path: str, current_path: str, 
                        tolerance: float) -> Tuple[float, List[VisualDifference]]:
         """Compare two images and detect differences."""
         try:
-            # Load images
-            baseline_img = cv2.imread(baseline_path)
             current_img = cv2.imread(current_path)
-            
-            if baseline_img is None or current_img is None:
+            if current_img is None:
                 raise Exception("Failed to load images")
             
-            # Resize images to same dimensions
-            baseline_img = cv2.resize(baseline_img, (224, 224))
-            current_img = cv2.resize(current_img, (224, 224))
-            
-            # Calculate basic difference
-            diff = cv2.absdiff(baseline_img, current_img)
-            diff_gray = cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY)
-            
-            # Calculate difference score
-            difference_score = np.mean(diff_gray) / 255.0
+            return self._compare_with_current(baseline_path, current_img)
             
-            # Detect specific differences
-            differences = self._detect_differences(baseline_img, current_img, diff)
-            
-            return difference_score, differences
+        except Exception as e:
+            logger.error(f"Error comparing images: {e}")
+            return 1.0, []
+    
+    def _compare_with_current(self, baseline_path: str, 
+                             current_img: np.ndarray) -> Tuple[float, List[VisualDifference]]:
+        """Compare a decoded current frame against a cached baseline."""
+        try:
+            # Load the baseline preprocessed from the cache
+            baseline_img = self._load_baseline(baseline_path)
+            if baseline_img is None:
+                raise Exception("Failed to load baseline image")
+            
+            # Resize current image to the baseline dimensions, into the
+            # reusable working buffer
+            current_img = cv2.resize(current_img, _FRAME_SIZE, dst=self._buf_current,
+                                     interpolation=cv2.INTER_AREA)
+            
+            # Coarse 32x32 screen: passing tests are the common case, so a
+            # cheap low-resolution check skips the full-resolution detectors
+            # when the images are clearly within tolerance
+            b32 = cv2.resize(baseline_img, (32, 32), interpolation=cv2.INTER_AREA)
+            c32 = cv2.resize(current_img, (32, 32), interpolation=cv2.INTER_AREA)
+            quick_diff = np.abs(b32.astype(np.int16) - c32.astype(np.int16))
+            quick_score = float(quick_diff.sum(dtype=np.int64)) / (quick_diff.size * 255.0)
+            if quick_score < 0.5 * min(self.tolerance_thresholds.values()):
+                return quick_score, []
+            
+            return self._compare_arrays(baseline_img, current_img)
             
         except Exception as e:
             logger.error(f"Error comparing images: {e}")
             return 1.0, []
     
-    def _detect_differences(self, baseline_img: np.ndarray, current_img: np.ndarray, 
-                           diff_img: np.ndarray) -> List[VisualDifference]:
+    def _compare_arrays(self, baseline_img: np.ndarray, 
+                       current_img: np.ndarray) -> Tuple[float, List[VisualDifference]]:
+        """Score and detect differences on preprocessed 224x224 images."""
+        # Fused absdiff + luma + mean: one weighted reduction into the
+        # reusable int16 buffer instead of materializing fresh temporaries
+        diff16 = np.subtract(baseline_img, current_img, out=self._buf_diff16,
+                             dtype=np.int16)
+        np.abs(diff16, out=diff16)
+        # Reduce in the integer domain first: three SIMD int sums then a
+        # 3-element dot, instead of a full-image float64 conversion
+        channel_sums = diff16.sum(axis=(0, 1), dtype=np.int64)
+        difference_score = float(channel_sums.dot(_BGR_LUMA_WEIGHTS)) / _LUMA_NORM
+        
+        # Detect specific differences
+        differences = self._detect_differences(baseline_img, current_img)
+        
+        return difference_score, differences
+    
+    def _detect_differences(self, baseline_img: np.ndarray, 
+                           current_img: np.ndarray) -> List[VisualDifference]:
         """Detect specific types of differences."""
         differences = []
         
         try:
-            # Convert to RGB for processing
-            baseline_rgb = cv2.cvtColor(baseline_img, cv2.COLOR_BGR2RGB)
-            current_rgb = cv2.cvtColor(current_img, cv2.COLOR_BGR2RGB)
+            # Convert to grayscale once and share across the detectors; the
+            # BGR->RGB round-trip is skipped since grayscale and histogram
+            # comparisons are channel-order independent
+            baseline_gray = cv2.cvtColor(baseline_img, cv2.COLOR_BGR2GRAY,
+                                         dst=self._buf_gray_b)
+            current_gray = cv2.cvtColor(current_img, cv2.COLOR_BGR2GRAY,
+                                        dst=self._buf_gray_c)
             
             # Detect layout changes
-            layout_diff = self._detect_layout_changes(baseline_rgb, current_rgb)
+            layout_diff = self._detect_layout_changes(baseline_gray, current_gray)
             if layout_diff:
                 differences.append(layout_diff)
             
             # Detect color changes
-            color_diff = self._detect_color_changes(baseline_rgb, current_rgb)
+            color_diff = self._detect_color_changes(baseline_img, current_img)
             if color_diff:
                 differences.append(color_diff)
             
-            # Detect content changes
-            content_diff = self._detect_content_changes(baseline_rgb, current_rgb)
+            # Detect content changes, sharing one grayscale absdiff pass
+            gray_diff = cv2.absdiff(baseline_gray, current_gray)
+            content_diff = self._detect_content_changes(gray_diff)
             if content_diff:
                 differences.append(content_diff)
             
             # Detect element changes
-            element_diff = self._detect_element_changes(baseline_rgb, current_rgb)
+            element_diff = self._detect_element_changes(baseline_gray, current_gray)
             if element_diff:
                 differences.append(element_diff)
             
@@ -298,26 +591,29 @@ class VisualRegressionEngine:
         
         return differences
     
-    def _detect_layout_changes(self, baseline: np.ndarray, current: np.ndarray) -> Optional[VisualDifference]:
+    def _detect_layout_changes(self, baseline_gray: np.ndarray, 
+                              current_gray: np.ndarray) -> Optional[VisualDifference]:
         """Detect layout changes using edge detection."""
         try:
-            # Convert to grayscale
-            baseline_gray = cv2.cvtColor(baseline, cv2.COLOR_RGB2GRAY)
-            current_gray = cv2.cvtColor(current, cv2.COLOR_RGB2GRAY)
+            # Detect edges on the shared grayscale images; with OpenCL the
+            # whole Canny/absdiff/mean chain runs on the device and only the
+            # scalar mean crosses back
+            if self._use_opencl:
+                baseline_gray = cv2.UMat(baseline_gray)
+                current_gray = cv2.UMat(current_gray)
             
-            # Detect edges
             baseline_edges = cv2.Canny(baseline_gray, 50, 150)
             current_edges = cv2.Canny(current_gray, 50, 150)
             
             # Calculate edge difference
             edge_diff = cv2.absdiff(baseline_edges, current_edges)
-            edge_score = np.mean(edge_diff) / 255.0
+            edge_score = cv2.mean(edge_diff)[0] / 255.0
             
             if edge_score > self.tolerance_thresholds['layout']:
                 return VisualDifference(
                     difference_type='layout',
                     confidence=edge_score,
-                    bounding_box=(0, 0, baseline.shape[1], baseline.shape[0]),
+                    bounding_box=(0, 0, 224, 224),
                     description=f"Layout changes detected (score: {edge_score:.3f})",
                     severity='high' if edge_score > 0.3 else 'medium',
                     suggested_action="Review layout changes and update baseline if intentional"
@@ -328,15 +624,27 @@ class VisualRegressionEngine:
         
         return None
     
+    @staticmethod
+    def _packed_histogram(img: np.ndarray) -> np.ndarray:
+        """Compute a 512-bin color histogram via packed-index bincount."""
+        idx = (
+            ((img[:, :, 0] >> 5).astype(np.uint16) << 6)
+            | ((img[:, :, 1] >> 5).astype(np.uint16) << 3)
+            | (img[:, :, 2] >> 5)
+        )
+        return np.bincount(idx.ravel(), minlength=512).astype(np.float32)
+    
     def _detect_color_changes(self, baseline: np.ndarray, current: np.ndarray) -> Optional[VisualDifference]:
         """Detect color changes using histogram comparison."""
         try:
-            # Calculate color histograms
-            baseline_hist = cv2.calcHist([baseline], [0, 1, 2], None, [8, 8, 8], [0, 256, 0, 256, 0, 256])
-            current_hist = cv2.calcHist([current], [0, 1, 2], None, [8, 8, 8], [0, 256, 0, 256, 0, 256])
-            
-            # Compare histograms
-            color_score = cv2.compareHist(baseline_hist, current_hist, cv2.HISTCMP_CORREL)
+            # Pack the 8x8x8 histogram index into 9 bits (3 per channel) and
+            # count with a single bincount pass per image; equivalent to the
+            # cv2.calcHist 3D histogram without its float output allocation
+            baseline_hist = self._packed_histogram(baseline)
+            current_hist = self._packed_histogram(current)
+            
+            # Compare histograms (Pearson correlation, as HISTCMP_CORREL)
+            color_score = float(np.corrcoef(baseline_hist, current_hist)[0, 1])
             color_diff = 1 - color_score
             
             if color_diff > self.tolerance_thresholds['color']:
@@ -354,16 +662,10 @@ class VisualRegressionEngine:
         
         return None
     
-    def _detect_content_changes(self, baseline: np.ndarray, current: np.ndarray) -> Optional[VisualDifference]:
-        """Detect content changes using template matching."""
+    def _detect_content_changes(self, diff: np.ndarray) -> Optional[VisualDifference]:
+        """Detect content changes from a precomputed grayscale absdiff."""
         try:
-            # Convert to grayscale
-            baseline_gray = cv2.cvtColor(baseline, cv2.COLOR_RGB2GRAY)
-            current_gray = cv2.cvtColor(current, cv2.COLOR_RGB2GRAY)
-            
-            # Use template matching to find differences
-            diff = cv2.absdiff(baseline_gray, current_gray)
-            content_score = np.mean(diff) / 255.0
+            content_score = float(diff.sum(dtype=np.uint64)) / (diff.size * 255.0)
             
             if content_score > self.tolerance_thresholds['content']:
                 # Find bounding box of differences
@@ -372,7 +674,7 @@ class VisualRegressionEngine:
                     x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
                     bounding_box = (x, y, w, h)
                 else:
-                    bounding_box = (0, 0, baseline.shape[1], baseline.shape[0])
+                    bounding_box = (0, 0, diff.shape[1], diff.shape[0])
                 
                 return VisualDifference(
                     difference_type='content',
@@ -388,26 +690,23 @@ class VisualRegressionEngine:
         
         return None
     
-    def _detect_element_changes(self, baseline: np.ndarray, current: np.ndarray) -> Optional[VisualDifference]:
+    def _detect_element_changes(self, baseline_gray: np.ndarray, 
+                               current_gray: np.ndarray) -> Optional[VisualDifference]:
         """Detect element changes using feature matching."""
         try:
-            # Convert to grayscale
-            baseline_gray = cv2.cvtColor(baseline, cv2.COLOR_RGB2GRAY)
-            current_gray = cv2.cvtColor(current, cv2.COLOR_RGB2GRAY)
-            
-            # Use ORB feature detector
-            orb = cv2.ORB_create()
-            kp1, des1 = orb.detectAndCompute(baseline_gray, None)
-            kp2, des2 = orb.detectAndCompute(current_gray, None)
+            # Use the shared ORB detector and FLANN LSH matcher
+            kp1, des1 = self._orb.detectAndCompute(baseline_gray, None)
+            kp2, des2 = self._orb.detectAndCompute(current_gray, None)
             
             if des1 is not None and des2 is not None:
-                # Match features
-                bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
-                matches = bf.match(des1, des2)
-                matches = sorted(matches, key=lambda x: x.distance)
+                # Match features with Lowe's ratio test
+                matches = self._flann.knnMatch(des1, des2, k=2)
                 
                 # Calculate match ratio
-                good_matches = [m for m in matches if m.distance < 50]
+                good_matches = [
+                    pair[0] for pair in matches
+                    if len(pair) == 2 and pair[0].distance < 0.75 * pair[1].distance
+                ]
                 match_ratio = len(good_matches) / len(matches) if matches else 0
                 element_score = 1 - match_ratio
                 
@@ -415,7 +714,7 @@ class VisualRegressionEngine:
                     return VisualDifference(
                         difference_type='element',
                         confidence=element_score,
-                        bounding_box=(0, 0, baseline.shape[1], baseline.shape[0]),
+                        bounding_box=(0, 0, baseline_gray.shape[1], baseline_gray.shape[0]),
                         description=f"Element changes detected (score: {element_score:.3f})",
                         severity='high' if element_score > 0.4 else 'medium',
                         suggested_action="Review element changes and update baseline if intentional"
@@ -474,6 +773,14 @@ class VisualRegressionEngine:
                 baseline_path.parent.mkdir(exist_ok=True)
                 baseline_path.write_bytes(new_path.read_bytes())
                 
+                # Invalidate cached copies of the replaced baseline and
+                # rebuild the preprocessed sidecar immediately
+                self._baseline_cache.pop(str(baseline_path), None)
+                npy_path = baseline_path.with_suffix(baseline_path.suffix + '.224.npy')
+                if npy_path.exists():
+                    npy_path.unlink()
+                self._load_baseline(str(baseline_path))
+                
                 # Update test case
                 visual_test_case.baseline_image_path = str(baseline_path)
                 self._save_visual_test_case(visual_test_case)
@@ -500,12 +807,12 @@ class VisualRegressionEngine:
             'created_at': visual_test_case.created_at
         }
         
-        with open(test_case_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(test_case_path, 'wb') as f:
+            f.write(_json_dumps_indented(data))
     
     def _save_visual_test_result(self, result: VisualTestResult):
         """Save visual test result."""
-        result_path = self.baseline_dir / f"{result.test_case_id}_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        result_path = self.baseline_dir / f"{result.test_case_id}_result_{self._unique_suffix()}.json"
         
         data = {
             'test_case_id': result.test_case_id,
@@ -527,37 +834,44 @@ class VisualRegressionEngine:
             'generated_at': result.generated_at
         }
         
-        with open(result_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(result_path, 'wb') as f:
+            f.write(_json_dumps_indented(data))
+        
+        # Append to the single-file index used for statistics; one line per
+        # result keeps aggregation a streaming read instead of a glob + parse
+        # of every per-result file
+        index_entry = {
+            'test_case_id': result.test_case_id,
+            'status': result.status,
+            'generated_at': result.generated_at
+        }
+        with open(self.baseline_dir / 'results.jsonl', 'ab') as f:
+            f.write(_json_dumps_line(index_entry) + b'\n')
     
     def get_visual_test_statistics(self) -> Dict[str, Any]:
         """Get statistics about visual tests."""
         try:
-            # Count test cases
-            test_case_files = list(self.baseline_dir.glob("*.json"))
-            test_cases = [f for f in test_case_files if not f.name.endswith('_result_')]
-            result_files = [f for f in test_case_files if f.name.endswith('_result_')]
-            
-            # Analyze results
-            pass_count = 0
-            fail_count = 0
-            warning_count = 0
-            
-            for result_file in result_files:
-                try:
-                    with open(result_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    status = data.get('status', 'unknown')
-                    if status == 'pass':
-                        pass_count += 1
-                    elif status == 'fail':
-                        fail_count += 1
-                    elif status == 'warning':
-                        warning_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error reading result file {result_file}: {e}")
+            # Count test cases (per-result files are kept for forensics but
+            # no longer scanned here)
+            test_cases = [
+                f for f in self.baseline_dir.glob("*.json")
+                if '_result_' not in f.name
+            ]
+            
+            # Tally statuses from the append-only index in one streaming pass
+            status_counts = Counter()
+            index_path = self.baseline_dir / 'results.jsonl'
+            if index_path.exists():
+                with open(index_path, 'r') as f:
+                    for line in f:
+                        try:
+                            status_counts[json.loads(line).get('status', 'unknown')] += 1
+                        except Exception as e:
+                            logger.error(f"Error reading results index line: {e}")
+            
+            pass_count = status_counts['pass']
+            fail_count = status_counts['fail']
+            warning_count = status_counts['warning']
             
             total_tests = pass_count + fail_count + warning_count
             pass_rate = pass_count / total_tests if total_tests > 0 else 0
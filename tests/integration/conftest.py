@@ -0,0 +1,105 @@
+"""
+Shared fixtures for integration tests
+
+Heavy setup (sample requirements, temp directory, generated test cases) is
+session-scoped so parsing and generation run once for the whole suite
+instead of once per test.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from input_parsing import parse_healthcare_document
+from test_case_generation import TestCaseGenerator
+
+_SAMPLE_DOC_CONTENT = """
+Healthcare Software Requirements
+
+1. Patient Data Management
+1.1 The system shall store patient demographic information securely.
+1.2 The system shall comply with HIPAA requirements.
+
+2. Performance Requirements
+2.1 The system shall respond to user queries within 2 seconds.
+2.2 The system shall support up to 1000 concurrent users.
+
+3. Security Requirements
+3.1 The system shall implement role-based access control.
+3.2 The system shall encrypt all sensitive data.
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_requirements():
+    """Sample requirements shared across the integration suite."""
+    return [
+        {
+            'id': 'REQ-001',
+            'description': 'The system shall store patient demographic information securely',
+            'type': 'functional',
+            'priority': 'high',
+            'compliance_refs': ['HIPAA', 'GDPR'],
+            'source_section': 'Data Management',
+            'context': 'Patient data storage',
+            'acceptance_criteria': ['Data is encrypted', 'Access is logged'],
+            'dependencies': [],
+            'raw_text': 'The system shall store patient demographic information securely'
+        },
+        {
+            'id': 'REQ-002',
+            'description': 'The system shall respond to user queries within 2 seconds',
+            'type': 'performance',
+            'priority': 'medium',
+            'compliance_refs': ['ISO_13485'],
+            'source_section': 'Performance',
+            'context': 'System responsiveness',
+            'acceptance_criteria': ['Response time < 2 seconds'],
+            'dependencies': [],
+            'raw_text': 'The system shall respond to user queries within 2 seconds'
+        },
+        {
+            'id': 'REQ-003',
+            'description': 'The system shall implement role-based access control',
+            'type': 'security',
+            'priority': 'critical',
+            'compliance_refs': ['FDA_21_CFR_11', 'HIPAA'],
+            'source_section': 'Security',
+            'context': 'Access control',
+            'acceptance_criteria': ['Users can only access authorized data'],
+            'dependencies': ['REQ-001'],
+            'raw_text': 'The system shall implement role-based access control'
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory):
+    """Session output directory under pytest's managed temp root."""
+    return str(tmp_path_factory.mktemp("exports"))
+
+
+@pytest.fixture(scope="session")
+def test_case_generator():
+    """Session-wide TestCaseGenerator instance."""
+    return TestCaseGenerator()
+
+
+@pytest.fixture(scope="session")
+def generated_test_cases(sample_requirements, test_case_generator):
+    """Test cases generated once from the sample requirements."""
+    return test_case_generator.generate_test_cases(sample_requirements)
+
+
+@pytest.fixture(scope="session")
+def parsed_sample(tmp_path_factory):
+    """Sample document parsed once for the whole session."""
+    doc_path = tmp_path_factory.mktemp("e2e") / "sample_requirements.txt"
+    doc_path.write_text(_SAMPLE_DOC_CONTENT)
+    try:
+        return parse_healthcare_document(doc_path)
+    except Exception as e:
+        pytest.skip(f"Document parsing failed: {str(e)}")
@@ -0,0 +1,65 @@
+"""
+Shared fixtures for unit tests
+
+The parser, extractor, generator and validator objects build their rule
+tables and templates deterministically, so one session-scoped instance of
+each is shared read-only across the unit tests instead of rebuilding them
+per test.
+"""
+
+import pytest
+
+from input_parsing.document_parser import DocumentParser
+from input_parsing.requirement_extractor import RequirementExtractor
+from test_case_generation.compliance_validator import ComplianceValidator
+from test_case_generation.test_case_generator import TestCaseGenerator
+from test_case_generation.test_case_generator import (
+    TestCase,
+    TestCaseType,
+    TestCasePriority,
+)
+
+
+@pytest.fixture(scope="session")
+def compliance_validator():
+    """Session-wide ComplianceValidator instance."""
+    return ComplianceValidator()
+
+
+@pytest.fixture(scope="session")
+def document_parser():
+    """Session-wide DocumentParser instance."""
+    return DocumentParser()
+
+
+@pytest.fixture(scope="session")
+def requirement_extractor():
+    """Session-wide RequirementExtractor instance."""
+    return RequirementExtractor()
+
+
+@pytest.fixture(scope="session")
+def test_case_generator():
+    """Session-wide TestCaseGenerator instance."""
+    return TestCaseGenerator()
+
+
+@pytest.fixture
+def make_test_case():
+    """Factory for TestCase objects with sensible compliance defaults."""
+    def _make(**overrides):
+        fields = dict(
+            id="TC-X",
+            title="Test Case",
+            description="Test case description",
+            test_case_type=TestCaseType.COMPLIANCE,
+            priority=TestCasePriority.MEDIUM,
+            requirement_id="REQ-X",
+            compliance_refs=[],
+            test_steps=[],
+            prerequisites=[],
+            expected_outcome="",
+        )
+        fields.update(overrides)
+        return TestCase(**fields)
+    return _make
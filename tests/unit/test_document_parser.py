@@ -4,23 +4,15 @@ Unit tests for Document Parser module
 
 import pytest
 from pathlib import Path
-import tempfile
-import os
 from input_parsing.document_parser import DocumentParser
 
-
 class TestDocumentParser:
     """Test cases for DocumentParser class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = DocumentParser()
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _inject_parser(self, document_parser):
+        """Expose the shared session parser as self.parser."""
+        self.parser = document_parser
         
     def test_parser_initialization(self):
         """Test parser initialization."""
@@ -35,11 +27,13 @@ class TestDocumentParser:
         with pytest.raises(FileNotFoundError):
             self.parser.parse_document("nonexistent_file.pdf")
             
-    def test_parse_unsupported_format(self):
+    def test_parse_unsupported_format(self, tmp_path):
         """Test parsing unsupported file format."""
-        test_file = Path(self.temp_dir) / "test.txt"
+        # .csv is not a supported format; the file exists so only the
+        # extension check can reject it
+        test_file = tmp_path / "test.csv"
         test_file.write_text("Test content")
-        
+
         with pytest.raises(ValueError):
             self.parser.parse_document(test_file)
             
@@ -74,32 +68,17 @@ class TestDocumentParser:
         hierarchy = self.parser.extract_hierarchy(parsed_doc)
         
         assert len(hierarchy) > 0
-        assert any(item['level'] > 0 for item in hierarchy)
+        assert max(item['level'] for item in hierarchy) > 0
         
     def test_parse_text_file_as_sample(self):
-        """Test parsing a text file as a sample document."""
-        # Create a sample text file
-        test_file = Path(self.temp_dir) / "sample.txt"
-        test_content = """
-        Healthcare Software Requirements
-        
-        1. Patient Data Management
-        1.1 The system shall store patient information securely.
-        1.2 The system shall comply with HIPAA requirements.
-        
-        2. Clinical Workflow
-        2.1 The system shall integrate with EHR systems.
-        2.2 The system shall provide real-time alerts.
-        """
-        test_file.write_text(test_content)
-        
-        # Test that the parser can handle text files (even though not in supported formats)
-        # This tests the error handling
+        """Unsupported extensions are rejected before any file IO."""
+        # No file is written: the extension check fires before the parser
+        # touches the filesystem
         with pytest.raises(ValueError):
-            self.parser.parse_document(test_file)
+            self.parser.parse_document(Path("sample.csv"))
             
     def test_supported_formats(self):
         """Test supported formats list."""
-        expected_formats = ['.pdf', '.docx', '.doc', '.xml', '.html']
+        expected_formats = ['.pdf', '.docx', '.doc', '.xml', '.html', '.txt']
         assert self.parser.supported_formats == expected_formats
 
@@ -9,9 +9,10 @@ from test_case_generation.test_case_generator import TestCaseGenerator, TestCase
 class TestTestCaseGenerator:
     """Test cases for TestCaseGenerator class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = TestCaseGenerator()
+    @pytest.fixture(autouse=True)
+    def _inject_generator(self, test_case_generator):
+        """Expose the shared session generator as self.generator."""
+        self.generator = test_case_generator
         
     def test_generator_initialization(self):
         """Test generator initialization."""
@@ -25,8 +26,10 @@ class TestTestCaseGenerator:
         actions = self.generator._extract_actions_from_requirement(requirement_text)
         
         assert len(actions) > 0
-        assert any('store' in action.lower() for action in actions)
-        assert any('validate' in action.lower() for action in actions)
+        # One pass over the actions instead of an any() scan per verb
+        joined_actions = ' '.join(action.lower() for action in actions)
+        assert 'store' in joined_actions
+        assert 'validate' in joined_actions
         
     def test_generate_test_data_for_action(self):
         """Test test data generation for actions."""
@@ -40,8 +43,9 @@ class TestTestCaseGenerator:
         assert 'patient_id' in patient_data
         assert 'patient_name' in patient_data
         
-        # Test generic action
-        generic_data = self.generator._generate_test_data_for_action("Process data")
+        # Test generic action (no template keyword; 'data' would resolve
+        # to the medical-record template)
+        generic_data = self.generator._generate_test_data_for_action("Submit the form")
         assert 'input_data' in generic_data
         
     def test_generate_prerequisites(self):
@@ -62,93 +66,82 @@ class TestTestCaseGenerator:
         requirement_text = "The system shall store patient data securely"
         
         scenarios = self.generator._generate_negative_scenarios(requirement_text)
-        
+
         assert len(scenarios) > 0
-        assert all('action' in scenario for scenario in scenarios)
-        assert all('expected_result' in scenario for scenario in scenarios)
-        assert all('data_inputs' in scenario for scenario in scenarios)
+        required = {'action', 'expected_result', 'data_inputs'}
+        assert all(required <= scenario.keys() for scenario in scenarios)
         
     def test_generate_boundary_scenarios(self):
         """Test boundary scenario generation."""
         requirement_text = "The system shall handle up to 1000 concurrent users"
         
         scenarios = self.generator._generate_boundary_scenarios(requirement_text)
-        
+
         assert len(scenarios) > 0
-        assert all('action' in scenario for scenario in scenarios)
-        assert all('expected_result' in scenario for scenario in scenarios)
-        assert all('data_inputs' in scenario for scenario in scenarios)
-        
-    def test_map_requirement_priority_to_test_priority(self):
+        required = {'action', 'expected_result', 'data_inputs'}
+        assert all(required <= scenario.keys() for scenario in scenarios)
+        
+    @pytest.mark.parametrize("requirement_priority,expected", [
+        ('critical', TestCasePriority.CRITICAL),
+        ('high', TestCasePriority.HIGH),
+        ('medium', TestCasePriority.MEDIUM),
+        ('low', TestCasePriority.LOW),
+        ('unknown', TestCasePriority.MEDIUM),
+    ])
+    def test_map_requirement_priority_to_test_priority(self, requirement_priority, expected):
         """Test priority mapping from requirement to test case."""
-        assert self.generator._map_requirement_priority_to_test_priority('critical') == TestCasePriority.CRITICAL
-        assert self.generator._map_requirement_priority_to_test_priority('high') == TestCasePriority.HIGH
-        assert self.generator._map_requirement_priority_to_test_priority('medium') == TestCasePriority.MEDIUM
-        assert self.generator._map_requirement_priority_to_test_priority('low') == TestCasePriority.LOW
-        assert self.generator._map_requirement_priority_to_test_priority('unknown') == TestCasePriority.MEDIUM
-        
-    def test_estimate_duration(self):
+        assert self.generator._map_requirement_priority_to_test_priority(requirement_priority) == expected
+        
+    @pytest.mark.parametrize("step_count,expected_minutes", [
+        (1, 7),    # 5 + 1*2
+        (5, 15),   # 5 + 5*2
+        (10, 25),  # 5 + 10*2
+    ])
+    def test_estimate_duration(self, step_count, expected_minutes):
         """Test duration estimation."""
-        assert self.generator._estimate_duration(1) == 7  # 5 + 1*2
-        assert self.generator._estimate_duration(5) == 15  # 5 + 5*2
-        assert self.generator._estimate_duration(10) == 25  # 5 + 10*2
-        
-    def test_generate_positive_test_case(self):
-        """Test positive test case generation."""
-        requirement = {
-            'id': 'REQ-001',
-            'description': 'The system shall store patient data securely',
-            'priority': 'high',
-            'compliance_refs': ['HIPAA']
-        }
-        
-        test_case = self.generator._generate_positive_test_case(requirement)
-        
-        assert test_case is not None
-        assert test_case.id.startswith('TC-REQ-001-POS')
-        assert test_case.test_case_type == TestCaseType.POSITIVE
-        assert test_case.priority == TestCasePriority.HIGH
-        assert test_case.requirement_id == 'REQ-001'
-        assert len(test_case.test_steps) > 0
-        assert test_case.expected_outcome != ""
-        
-    def test_generate_negative_test_case(self):
-        """Test negative test case generation."""
+        assert self.generator._estimate_duration(step_count) == expected_minutes
+        
+    @pytest.mark.parametrize(
+        "method_name,req_id,description,req_priority,compliance_ref,"
+        "id_suffix,expected_type,expected_priority,outcome_contains", [
+            ('_generate_positive_test_case', 'REQ-001',
+             'The system shall store patient data securely', 'high', 'HIPAA',
+             'POS', TestCaseType.POSITIVE, TestCasePriority.HIGH, ''),
+            ('_generate_negative_test_case', 'REQ-002',
+             'The system shall validate user input', 'medium', 'FDA',
+             'NEG', TestCaseType.NEGATIVE, TestCasePriority.MEDIUM, 'invalid'),
+            ('_generate_boundary_test_case', 'REQ-003',
+             'The system shall handle up to 1000 users', 'high', 'ISO',
+             'BND', TestCaseType.BOUNDARY, TestCasePriority.HIGH, None),
+        ])
+    def test_generate_test_case(self, method_name, req_id, description,
+                                req_priority, compliance_ref, id_suffix,
+                                expected_type, expected_priority,
+                                outcome_contains):
+        """Test rule-based test case generation for each test case type."""
         requirement = {
-            'id': 'REQ-002',
-            'description': 'The system shall validate user input',
-            'priority': 'medium',
-            'compliance_refs': ['FDA']
+            'id': req_id,
+            'description': description,
+            'priority': req_priority,
+            'compliance_refs': [compliance_ref]
         }
-        
-        test_case = self.generator._generate_negative_test_case(requirement)
-        
-        assert test_case is not None
-        assert test_case.id.startswith('TC-REQ-002-NEG')
-        assert test_case.test_case_type == TestCaseType.NEGATIVE
-        assert test_case.priority == TestCasePriority.MEDIUM
-        assert test_case.requirement_id == 'REQ-002'
+
+        test_case = getattr(self.generator, method_name)(requirement)
+
+        if test_case is None:
+            # Only the boundary builder may bail out (no numeric values)
+            assert method_name == '_generate_boundary_test_case'
+            return
+
+        assert test_case.id.startswith(f'TC-{req_id}-{id_suffix}')
+        assert test_case.test_case_type == expected_type
+        assert test_case.priority == expected_priority
+        assert test_case.requirement_id == req_id
         assert len(test_case.test_steps) > 0
-        assert 'invalid' in test_case.expected_outcome.lower()
-        
-    def test_generate_boundary_test_case(self):
-        """Test boundary test case generation."""
-        requirement = {
-            'id': 'REQ-003',
-            'description': 'The system shall handle up to 1000 users',
-            'priority': 'high',
-            'compliance_refs': ['ISO']
-        }
-        
-        test_case = self.generator._generate_boundary_test_case(requirement)
-        
-        if test_case:  # May be None if no numeric values found
-            assert test_case.id.startswith('TC-REQ-003-BND')
-            assert test_case.test_case_type == TestCaseType.BOUNDARY
-            assert test_case.priority == TestCasePriority.HIGH
-            assert test_case.requirement_id == 'REQ-003'
-            assert len(test_case.test_steps) > 0
-            
+        if outcome_contains is not None:
+            assert test_case.expected_outcome != ""
+            assert outcome_contains in test_case.expected_outcome.lower()
+
     def test_generate_test_cases_with_rules(self):
         """Test test case generation using rule-based approach."""
         requirements = [